@@ -0,0 +1,49 @@
+"""Weeks and months of all Landkreise over the full range of the archive: python -m benchmarks.bench_aggregate
+
+Compares labelling every date with apply and grouping in the boxplot to the vectorized aggregation.
+"""
+import matplotlib
+import pandas as pd
+
+from benchmarks.utils import measure, print_results
+from corona.history import _get_df_inzidenz, aggregate, format_to_week, group_labels, read_sheets, show_aggregates
+from tests.testing_utils import get_testdata_binary
+
+
+def label_by_apply(df: pd.DataFrame) -> pd.DataFrame:
+    """The former by_week before drawing: a label per row with apply and filtering by value_counts"""
+    df = df.copy()
+    df["KW"] = df.index.to_series().apply(format_to_week)
+    counts = df["KW"].value_counts()
+    return df[df["KW"].isin(counts[counts >= 3].index)]
+
+
+def bench_aggregate() -> dict[str, float]:
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    sheets = read_sheets(get_testdata_binary("Fallzahlen_Kum_Tab_Archiv.xlsx"), True, True)
+    df_all = _get_df_inzidenz(sheets["LK_7-Tage-Inzidenz (fixiert)"], None, 0).T
+    df_few = df_all.iloc[:, :9]
+
+    def draw_boxplot_by():
+        label_by_apply(df_few.set_axis([str(region) for region in df_few.columns], axis=1)).boxplot(by="KW", rot=45)
+        plt.close("all")
+
+    def draw_bxp():
+        show_aggregates(aggregate(df_few, "week"), rot=45)
+        plt.close("all")
+
+    shape = f"{len(df_all.columns)}x{len(df_all)}"
+    return {
+        f"label weeks by apply {shape}": measure(lambda: label_by_apply(df_all)),
+        f"label weeks vectorized {shape}": measure(lambda: group_labels(df_all.index, "week")),
+        f"weeks vectorized {shape}": measure(lambda: aggregate(df_all, "week")),
+        f"months vectorized {shape}": measure(lambda: aggregate(df_all, "month")),
+        "draw boxplot(by=) 9 regions": measure(draw_boxplot_by, repeat=3),
+        "draw bxp 9 regions": measure(draw_bxp, repeat=3),
+    }
+
+
+if __name__ == "__main__":
+    print_results("weeks and months of Fallzahlen_Kum_Tab_Archiv.xlsx", bench_aggregate())
@@ -0,0 +1,51 @@
+"""History of all Landkreise over the full range of the archive: python -m benchmarks.bench_all_landkreise
+
+Compares selecting the Landkreise by label and drawing a bar per Landkreis and day to the all Landkreise mode.
+"""
+import matplotlib
+
+from benchmarks.utils import measure, print_results
+from corona.history import _get_df_inzidenz, fill_ax_complete, get_colors, get_lines_inz, read_sheets, show_heatmap
+from corona.landkreise import Landkreise
+from tests.testing_utils import get_testdata_binary
+
+
+def bench_all_landkreise(bars: bool = True) -> dict[str, float]:
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    sheets = read_sheets(get_testdata_binary("Fallzahlen_Kum_Tab_Archiv.xlsx"), True, True)
+    df_lk, df_bl = sheets["LK_7-Tage-Inzidenz (fixiert)"], sheets["BL_7-Tage-Inzidenz (fixiert)"]
+    kreise = list(Landkreise.find_by_lk_names(df_lk.index))
+    df_germany = df_bl.loc["Gesamt"]
+
+    def select(kreise):
+        df = _get_df_inzidenz(df_lk, kreise, 0)
+        df.loc["Deutschland"] = df_germany
+        return df
+
+    def draw_bars():
+        fig, ax = plt.subplots(1, 1)
+        fill_ax_complete(ax, df_all, "Inzidenz fix", get_lines_inz)
+        fig.savefig("/dev/null", format="png")
+        plt.close(fig)
+
+    def draw_heatmap():
+        show_heatmap(df_all, None, "title", "/dev/null", True)
+        plt.close("all")
+
+    df_all = select(None)
+    shape = f"{len(df_all) - 1}x{len(df_all.columns)}"
+    results = {
+        f"select by labels {shape}": measure(lambda: select(kreise)),
+        f"select all {shape}": measure(lambda: select(None)),
+        "get_colors": measure(lambda: get_colors(df_all)),
+        "draw heatmap": measure(draw_heatmap, repeat=3),
+    }
+    if bars:
+        results["draw bars"] = measure(draw_bars, repeat=1)
+    return results
+
+
+if __name__ == "__main__":
+    print_results("all Landkreise of Fallzahlen_Kum_Tab_Archiv.xlsx", bench_all_landkreise())
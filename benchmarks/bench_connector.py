@@ -0,0 +1,32 @@
+"""New session per call vs one shared session against a local stub server: python -m benchmarks.bench_connector"""
+import asyncio
+import time
+
+from benchmarks.stub_server import StubServer
+from benchmarks.utils import print_results
+from corona.rki_connector import Connector
+
+CALLS = 50
+
+
+async def bench_sessions(calls: int = CALLS) -> dict[str, float]:
+    results = {}
+    async with StubServer().run() as server:
+        start = time.perf_counter()
+        for _ in range(calls):
+            async with server.connector() as con:
+                await con.get_all_cases()
+        results[f"new session per call ({len(server.connections)} connections)"] = (time.perf_counter() - start) / calls
+
+    async with StubServer().run() as server:
+        async with Connector.create_session() as session:
+            start = time.perf_counter()
+            for _ in range(calls):
+                async with server.connector(session=session) as con:
+                    await con.get_all_cases()
+            results[f"shared session ({len(server.connections)} connections)"] = (time.perf_counter() - start) / calls
+    return results
+
+
+if __name__ == "__main__":
+    print_results(f"get_all_cases, mean of {CALLS} sequential calls", asyncio.run(bench_sessions()))
@@ -0,0 +1,51 @@
+"""Graph per Bundesland of the current excel file: python -m benchmarks.bench_export
+
+Compares saving a graph per Bundesland with show_graph to the batch export, in this process and in a process pool.
+"""
+import os
+import tempfile
+
+import matplotlib
+
+from benchmarks.utils import measure, print_results
+from corona.export import export_charts, region_sets_by_land, select_region_set
+from corona.history import date_formatter, read_excel, show_graph
+from tests.testing_utils import get_testdata_binary
+
+
+def bench_export() -> dict[str, float]:
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    excel = get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx")
+    df_inzidenz, df_hosp = read_excel(excel, None, False, 8)
+    df_inzidenz, df_hosp = df_inzidenz.rename(columns=date_formatter), df_hosp.rename(columns=date_formatter)
+    region_sets = region_sets_by_land()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+
+        def show_graphs():
+            for region_set in region_sets:
+                df1, df2 = select_region_set(df_inzidenz, df_hosp, region_set.landkreise)
+                show_graph(df1, df2, "title", os.path.join(output_dir, f"{region_set.name}.png"))
+                plt.close("all")
+
+        def export(jobs: int):
+            return export_charts(df_inzidenz, df_hosp, region_sets, output_dir, title="title", jobs=jobs)
+
+        results = {
+            f"show_graph {len(region_sets)} graphs": measure(show_graphs, repeat=2),
+            "export 1 job": measure(lambda: export(1), repeat=2),
+            f"export pool of {os.cpu_count()}": measure(lambda: export(os.cpu_count()), repeat=2),
+            f"export pool of {os.cpu_count()} svg": measure(
+                lambda: export_charts(df_inzidenz, df_hosp, region_sets, output_dir, "svg", "title"), repeat=2
+            ),
+        }
+        for timing in sorted(export(1), key=lambda timing: -(timing.draw + timing.save))[:3]:
+            results[f"  draw {timing.name}"] = timing.draw
+            results[f"  save {timing.name}"] = timing.save
+    return results
+
+
+if __name__ == "__main__":
+    print_results("graph per Bundesland of Fallzahlen_Inzidenz_aktualisiert.xlsx", bench_export())
@@ -0,0 +1,23 @@
+"""Cold vs warm parse times of the bundled workbooks: python -m benchmarks.bench_frame_cache"""
+import tempfile
+
+from benchmarks.utils import WORKBOOKS, measure, print_results
+from corona.cache import FrameCache
+from corona.history import read_sheets
+from tests.testing_utils import get_testdata_binary
+
+
+def bench_frame_cache() -> dict[str, float]:
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = FrameCache(temp_dir)
+        for file_name, fixed_values, archive in WORKBOOKS:
+            excel = get_testdata_binary(file_name)
+            results[f"{file_name} cold"] = measure(lambda: read_sheets(excel, fixed_values, archive), repeat=3)
+            read_sheets(excel, fixed_values, archive, cache)
+            results[f"{file_name} warm"] = measure(lambda: read_sheets(excel, fixed_values, archive, cache))
+    return results
+
+
+if __name__ == "__main__":
+    print_results("read_sheets without / with FrameCache", bench_frame_cache())
@@ -0,0 +1,53 @@
+"""Import time of the cli commands measured with python -X importtime: python -m benchmarks.bench_import
+
+Exits with an error if the imports needed by 'corona today' exceed IMPORT_BUDGET.
+"""
+import subprocess
+import sys
+
+from benchmarks.utils import print_results
+
+IMPORT_BUDGET = 0.5  # seconds
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib")
+COMMANDS = {
+    "corona today --help": ["-m", "corona", "today", "--help"],
+    "corona today (imports)": ["-c", "from corona import cli; cli.get_command(None, 'today')"],
+    "corona history (imports)": ["-c", "from corona import cli; cli.get_command(None, 'history')"],
+}
+
+
+def import_times(args: list[str]) -> dict[str, float]:
+    """Runs python with args and returns the cumulative import time in seconds of all top level imports"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, check=True
+    ).stderr
+    times = {}
+    for line in result.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not name.startswith("  "):  # only top level imports, nested ones are part of their cumulative time
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def bench_import() -> tuple[dict[str, float], dict[str, list[str]]]:
+    results = {}
+    heavy = {}
+    for name, args in COMMANDS.items():
+        times = import_times(args)
+        results[name] = sum(times.values())
+        heavy[name] = [module for module in HEAVY_MODULES if module in times]
+    return results, heavy
+
+
+if __name__ == "__main__":
+    results, heavy = bench_import()
+    print_results("cumulative import time", results)
+    for name, modules in heavy.items():
+        print(f"  {name} imports {', '.join(modules) or 'none of ' + ', '.join(HEAVY_MODULES)}")
+    over_budget = {
+        name: time for name, time in results.items() if name.startswith("corona today") and time > IMPORT_BUDGET
+    }
+    if over_budget:
+        sys.exit(f"Import budget of {IMPORT_BUDGET} s exceeded: {over_budget}")
@@ -0,0 +1,40 @@
+"""Decoding the answers of the FeatureServer with every installed json decoder: python -m benchmarks.bench_json"""
+import json
+import re
+
+from benchmarks.utils import measure, print_results
+from corona.json_decoder import JSON_DECODERS, create_decoder
+from corona.rki_connector import CasesResult, Connector
+from tests.testing_utils import get_testdata_binary, get_testdata_file
+
+
+def bench_json() -> dict[str, float]:
+    all_cases = get_testdata_binary("all.json")
+    cases = [
+        get_testdata_binary(path.name)
+        for path in get_testdata_file("").iterdir()
+        if re.fullmatch(r"\d+\.json", path.name)
+    ]
+    results = {
+        "all.json json + parse_answer_all": measure(
+            lambda: Connector.parse_answer_all(json.loads(all_cases)), number=100
+        ),
+        f"{len(cases)} Landkreise json + parse_answer_all": measure(
+            lambda: [Connector.parse_answer_all(json.loads(data)) for data in cases], number=100
+        ),
+    }
+    for name in JSON_DECODERS[1:]:
+        try:
+            decoder = create_decoder(name)
+        except RuntimeError:
+            print(f"{name} is not installed")
+            continue
+        results[f"all.json {name}"] = measure(lambda: decoder.decode_cases(all_cases, CasesResult), number=100)
+        results[f"{len(cases)} Landkreise {name}"] = measure(
+            lambda: [decoder.decode_cases(data, CasesResult) for data in cases], number=100
+        )
+    return results
+
+
+if __name__ == "__main__":
+    print_results("decoding answers of the FeatureServer", bench_json())
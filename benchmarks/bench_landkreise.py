@@ -0,0 +1,46 @@
+"""Lookups of all Landkreise with the indexes compared to scanning all members: python -m benchmarks.bench_landkreise"""
+from typing import Optional
+
+import pandas as pd
+
+from benchmarks.utils import measure, print_results
+from corona.history import read_sheets
+from corona.landkreise import Landkreise
+from tests.testing_utils import get_testdata_binary
+
+
+def find_by_id_scan(lk_id: int) -> Landkreise:
+    """Lookup as it was done before the indexes"""
+    result = tuple(lk for lk in Landkreise if lk.id == lk_id)
+    if len(result) != 1:
+        raise ValueError(f"lk_id {lk_id} does not exist")
+    return result[0]
+
+
+def find_by_lk_name_scan(lk_name) -> Optional[Landkreise]:
+    """Lookup as it was done before the indexes"""
+    return result[0] if len(result := tuple(lk for lk in Landkreise if lk.lk_name == lk_name)) == 1 else None
+
+
+def bench_landkreise() -> dict[str, float]:
+    ids = [landkreis.id for landkreis in Landkreise]
+    df = read_sheets(get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx"))["LK_7-Tage-Inzidenz-aktualisiert"]
+
+    def rename_scan() -> pd.DataFrame:
+        return df.rename(index=lambda name: result if (result := find_by_lk_name_scan(name)) is not None else name)
+
+    def rename_index() -> pd.DataFrame:
+        result = df.copy(deep=False)
+        result.index = pd.Index(Landkreise.map_lk_names(df.index), dtype=object)
+        return result
+
+    return {
+        f"find_by_ids ({len(ids)} ids) scan": measure(lambda: list(map(find_by_id_scan, ids))),
+        f"find_by_ids ({len(ids)} ids) index": measure(lambda: Landkreise.find_by_ids(ids), number=100),
+        f"rename LK sheet ({len(df)} rows) scan": measure(rename_scan),
+        f"rename LK sheet ({len(df)} rows) index": measure(rename_index, number=100),
+    }
+
+
+if __name__ == "__main__":
+    print_results("Landkreise lookups", bench_landkreise())
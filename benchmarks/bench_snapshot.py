@@ -0,0 +1,54 @@
+"""List of CasesResult compared to CasesSnapshot for all.json: python -m benchmarks.bench_snapshot"""
+import heapq
+import json
+import tracemalloc
+
+from benchmarks.utils import measure, print_results
+from corona.rki_connector import Connector
+from corona.snapshot import CasesSnapshot
+from tests.testing_utils import get_testdata_text
+
+
+def retained_memory(func) -> int:
+    """Returns the bytes allocated by python for the result of func, which are still in use after it returned"""
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841 - keeps the result alive while measuring
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_snapshot() -> tuple[dict[str, float], dict[str, int]]:
+    text = get_testdata_text("all.json")
+    response_json = json.loads(text)
+    cases = Connector.parse_answer_all(response_json)
+    snapshot = CasesSnapshot.from_json(response_json)
+    value = lambda case: case.cases7_per_100k
+    times = {
+        "parse list": measure(lambda: Connector.parse_answer_all(response_json), number=100),
+        "parse snapshot": measure(lambda: CasesSnapshot.from_json(response_json), number=100),
+        "sort by name list": measure(lambda: sorted(cases, key=lambda case: case.city_name), number=100),
+        "sort by name snapshot": measure(snapshot.sort_by_name, number=100),
+        "sort by value list": measure(lambda: sorted(cases, key=value), number=100),
+        "sort by value snapshot": measure(snapshot.sort_by_value, number=100),
+        "top 10 list": measure(lambda: heapq.nlargest(10, cases, key=value), number=100),
+        "top 10 snapshot": measure(lambda: snapshot.top(10), number=100),
+        "filter 500-1000 list": measure(lambda: [case for case in cases if 500 <= value(case) <= 1000], number=100),
+        "filter 500-1000 snapshot": measure(lambda: snapshot.filter(500, 1000), number=100),
+        "iterate list": measure(lambda: list(cases), number=100),
+        "iterate snapshot": measure(lambda: list(snapshot), number=100),
+    }
+    memory = {
+        "list": retained_memory(lambda: Connector.parse_answer_all(json.loads(text))),
+        "snapshot": retained_memory(lambda: CasesSnapshot.from_json(json.loads(text))),
+    }
+    return times, memory
+
+
+if __name__ == "__main__":
+    times, memory = bench_snapshot()
+    print_results("CasesResult list vs CasesSnapshot of all.json", times)
+    print("retained memory of the parsed result, after the json was released")
+    for name, size in memory.items():
+        print(f"  {name:8} {size / 1024:10.1f} KiB")
@@ -0,0 +1,39 @@
+"""Fixed values from the imported series compared to parsing the excel files: python -m benchmarks.bench_store"""
+import asyncio
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import measure, print_results
+from corona.history import LANDKREISE, import_excels, read_excel, read_series
+from corona.store import Store
+from tests.testing_utils import get_testdata_file
+
+
+def bench_store() -> dict[str, float]:
+    archive = get_testdata_file("Fallzahlen_Kum_Tab_Archiv.xlsx")
+    current = get_testdata_file("Fallzahlen_Kum_Tab_aktuell.xlsx")
+    archive_content, current_content = archive.read_bytes(), current.read_bytes()
+
+    def parse_all():
+        df, _ = read_excel(current_content, LANDKREISE, True, 0)
+        return df.join(read_excel(archive_content, LANDKREISE, True, 0, True)[0])
+
+    with tempfile.TemporaryDirectory() as temp_dir, Store(Path(temp_dir) / "inzidenz.sqlite3") as store:
+        results = {
+            "import archive and current": measure(
+                lambda: asyncio.run(import_excels(store, archive, current, False)), repeat=1
+            )
+        }
+        results.update(
+            {
+                "8 days excel": measure(lambda: read_excel(current_content, LANDKREISE, True, 8), repeat=3),
+                "8 days store": measure(lambda: read_series(store, LANDKREISE, 8)),
+                "all days excel": measure(parse_all, repeat=3),
+                "all days store": measure(lambda: read_series(store, LANDKREISE, 0)),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    print_results("fixed values of the default Landkreise", bench_store())
@@ -0,0 +1,37 @@
+"""Parse time and peak memory of the excel engines: python -m benchmarks.bench_streaming"""
+import tracemalloc
+
+from benchmarks.utils import WORKBOOKS, measure, print_results
+from corona.history import LANDKREISE, read_excel
+from tests.testing_utils import get_testdata_binary
+
+
+def peak_memory(func) -> int:
+    """Returns the peak of memory allocated by python while running func in bytes"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_streaming() -> tuple[dict[str, float], dict[str, int]]:
+    times = {}
+    memory = {}
+    for file_name, fixed_values, archive in WORKBOOKS:
+        excel = get_testdata_binary(file_name)
+        for engine in ("openpyxl", "streaming"):
+            func = lambda: read_excel(excel, LANDKREISE, fixed_values, 8, archive, engine=engine)
+            times[f"{file_name} {engine}"] = measure(func, repeat=3)
+            memory[f"{file_name} {engine}"] = peak_memory(func)
+    return times, memory
+
+
+if __name__ == "__main__":
+    times, memory = bench_streaming()
+    print_results("read_excel time by engine", times)
+    width = max(len(name) for name in memory)
+    print("read_excel peak traced memory by engine")
+    for name, size in memory.items():
+        print(f"  {name:{width}} {size / 1024 / 1024:10.3f} MiB")
@@ -0,0 +1,85 @@
+"""Local http server answering like the ArcGIS and RKI servers with the recorded test data"""
+import contextlib
+import json
+import re
+from collections.abc import AsyncIterator
+
+from aiohttp import web
+
+from corona.replay import ALL_CASES, ResponseDirectory
+from corona.rki_connector import Connector
+from tests.testing_utils import get_testdata_binary, get_testdata_file
+
+
+class StubServer:
+    def __init__(self, max_record_count: int = 2000):
+        """Inits the server.
+
+        Args:
+            max_record_count (int, optional): Max features of a page, like the maxRecordCount of the FeatureServer.
+                                              Defaults to 2000.
+        """
+        self.max_record_count = max_record_count
+        self.connections: set = set()
+        self.requests = 0
+        self.url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        file_name = request.match_info["file_name"]
+        content_type = "application/json" if file_name.endswith(".json") else "application/octet-stream"
+        return web.Response(body=get_testdata_binary(file_name), content_type=content_type)
+
+    async def handle_query(self, request: web.Request) -> web.Response:
+        """Answers the queries of Connector.url, url_ids, url_count, url_updates and url_page by their parameters"""
+        self.requests += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        where = request.query.get("where", "")
+        if where == "1=1":
+            features = json.loads(get_testdata_binary(ALL_CASES))["features"]
+            if request.query.get("returnCountOnly") == "true":
+                return web.json_response({"count": len(features)})
+            if request.query.get("returnDistinctValues") == "true":
+                updates = sorted({feature["attributes"]["last_update"] for feature in features})
+                return web.json_response({"features": [{"attributes": {"last_update": update}} for update in updates]})
+            offset = int(request.query.get("resultOffset", 0))
+            count = min(int(request.query.get("resultRecordCount", len(features))), self.max_record_count)
+            page = features[offset : offset + count]
+            return web.json_response({"features": page, "exceededTransferLimit": offset + count < len(features)})
+        region_ids = [int(region_id) for region_id in re.findall(r"\d+", where)]
+        return web.json_response(ResponseDirectory(get_testdata_file("")).cases_json(region_ids))
+
+    @contextlib.asynccontextmanager
+    async def run(self) -> AsyncIterator["StubServer"]:
+        """Serves the files of tests/test_data as http://127.0.0.1:{port}/{file_name}
+        and the cases of Landkreise as http://127.0.0.1:{port}/query?where=..."""
+        app = web.Application()
+        app.router.add_get("/query", self.handle_query)
+        app.router.add_get("/{file_name}", self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        try:
+            yield self
+        finally:
+            await runner.cleanup()
+
+    def connector(self, **kwargs) -> Connector:
+        """Returns a Connector requesting all its urls from this server"""
+        con = Connector(**kwargs)
+        query = f"{self.url}/query?where={{}}&f=json"
+        con.url = query.format("OBJECTID={}")
+        con.url_ids = query.format("OBJECTID IN ({})")
+        con.url_all = query.format("1=1")
+        con.url_count = f"{con.url_all}&returnCountOnly=true"
+        con.url_updates = f"{con.url_all}&outFields=last_update&returnDistinctValues=true"
+        con.url_page = f"{con.url_all}&orderByFields=OBJECTID&resultOffset={{}}&resultRecordCount={{}}"
+        con.url_germany = f"{self.url}/de.json"
+        con.url_excel = f"{self.url}/Fallzahlen_Inzidenz_aktualisiert.xlsx"
+        con.url_excel_fixed = f"{self.url}/Fallzahlen_Kum_Tab_aktuell.xlsx"
+        con.url_excel_fixed_archive = f"{self.url}/Fallzahlen_Kum_Tab_Archiv.xlsx"
+        return con
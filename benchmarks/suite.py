@@ -0,0 +1,276 @@
+"""Benchmark suite of the hot paths, storing the results as json to compare them across commits.
+
+    python -m benchmarks.suite                          # writes .benchmarks/{commit}.json
+    python -m benchmarks.suite -k read_excel -o results.json
+    python -m benchmarks.suite --compare .benchmarks/{baseline commit}.json --fail-above 1.2
+
+The Connector requests a local StubServer, graphs are drawn with the Agg backend into a temporary directory.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import namedtuple
+from collections.abc import AsyncIterable, Awaitable, Iterable
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional
+
+import matplotlib
+import pandas as pd
+
+from benchmarks.stub_server import StubServer
+from benchmarks.utils import WORKBOOKS, measure_runs
+from corona.history import (
+    LANDKREISE,
+    _get_df_inzidenz,
+    by_month,
+    by_week,
+    date_formatter,
+    get_colors,
+    read_excel,
+    read_sheets,
+    show_graph,
+)
+from corona.json_decoder import create_decoder
+from corona.landkreise import Landkreise
+from corona.rki_connector import CasesResult, Connector
+from tests.testing_utils import get_testdata_binary, get_testdata_text
+
+RESULTS_DIR = Path(".benchmarks")
+Benchmark = namedtuple("Benchmark", ("name", "func", "repeat", "number"))
+Comparison = namedtuple("Comparison", ("name", "baseline", "current", "ratio"))
+
+
+def parsing_benchmarks() -> list[Benchmark]:
+    response_json = json.loads(get_testdata_text("all.json"))
+    decoder = create_decoder()
+    benchmarks = [
+        Benchmark("parse_answer_all all.json", partial(Connector.parse_answer_all, response_json), 5, 100),
+        Benchmark(
+            f"decode_cases all.json {decoder.name}",
+            partial(decoder.decode_cases, get_testdata_binary("all.json"), CasesResult),
+            5,
+            100,
+        ),
+    ]
+    for file_name, fixed_values, archive in WORKBOOKS:
+        func = partial(read_excel, get_testdata_binary(file_name), LANDKREISE, fixed_values, 8, archive)
+        benchmarks.append(Benchmark(f"read_excel {file_name}", func, 3, 1))
+    return benchmarks
+
+
+def lookup_benchmarks() -> list[Benchmark]:
+    ids = [landkreis.id for landkreis in Landkreise]
+    lk_names = [landkreis.lk_name for landkreis in Landkreise]
+    names = [landkreis.name for landkreis in Landkreise]
+    laender = sorted({landkreis.land for landkreis in Landkreise if landkreis.land})
+    return [
+        Benchmark(f"find_by_ids {len(ids)} ids", partial(Landkreise.find_by_ids, ids), 5, 100),
+        Benchmark(
+            f"find_by_lk_names {len(lk_names)} names", lambda: list(Landkreise.find_by_lk_names(lk_names)), 5, 100
+        ),
+        Benchmark(f"find_by_name {len(names)} names", lambda: list(map(Landkreise.find_by_name, names)), 5, 100),
+        Benchmark(f"find_by_land {len(laender)} laender", lambda: list(map(Landkreise.find_by_land, laender)), 5, 100),
+    ]
+
+
+def graph_benchmarks(output_dir: str) -> list[Benchmark]:
+    import matplotlib.pyplot as plt
+
+    df_inzidenz, df_hosp = read_excel(get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx"), LANDKREISE)
+    df_inzidenz, df_hosp = df_inzidenz.rename(columns=date_formatter), df_hosp.rename(columns=date_formatter)
+    sheets = read_sheets(get_testdata_binary("Fallzahlen_Kum_Tab_Archiv.xlsx"), True, True)
+    df_archive = _get_df_inzidenz(sheets["LK_7-Tage-Inzidenz (fixiert)"], LANDKREISE, 0).T
+    output_file = os.path.join(output_dir, "graph.png")
+
+    def closing(func: Callable[[], object]) -> Callable[[], None]:
+        def draw():
+            func()
+            plt.close("all")
+
+        return draw
+
+    shape = f"{len(df_archive.columns)}x{len(df_archive)}"
+    return [
+        Benchmark("get_colors", partial(get_colors, df_inzidenz, df_hosp), 5, 100),
+        Benchmark(f"by_week {shape}", closing(partial(by_week, df_archive, rot=45)), 3, 1),
+        Benchmark(f"by_month {shape}", closing(partial(by_month, df_archive, rot=45)), 3, 1),
+        Benchmark("show_graph png", closing(partial(show_graph, df_inzidenz, df_hosp, "title", output_file)), 3, 1),
+    ]
+
+
+async def _collect(results: AsyncIterable) -> list:
+    return [result async for result in results]
+
+
+async def _gather(coroutines: Iterable[Awaitable]) -> list:
+    return await asyncio.gather(*coroutines)
+
+
+def connector_benchmarks(loop: asyncio.AbstractEventLoop, stack: contextlib.AsyncExitStack) -> list[Benchmark]:
+    """The Connector shares one session to a StubServer running in loop, until stack is closed"""
+
+    async def start() -> Connector:
+        server = await stack.enter_async_context(StubServer().run())
+        return await stack.enter_async_context(server.connector())
+
+    con = loop.run_until_complete(start())
+
+    def run(coroutine: Callable[[], Awaitable]) -> Callable[[], object]:
+        return lambda: loop.run_until_complete(coroutine())
+
+    return [
+        Benchmark("Connector.get_all_cases", run(con.get_all_cases), 5, 10),
+        Benchmark(
+            f"Connector.get_cases {len(LANDKREISE)} bulk",
+            run(lambda: _collect(con.get_cases(LANDKREISE, True, bulk=True))),
+            5,
+            10,
+        ),
+        Benchmark(
+            f"Connector.get_cases {len(LANDKREISE)} single",
+            run(lambda: _collect(con.get_cases(LANDKREISE, True))),
+            5,
+            10,
+        ),
+        Benchmark("Connector.get_germany", run(con.get_germany), 5, 10),
+        Benchmark(
+            "Connector.get_germany 10 concurrent",
+            run(lambda: _gather(con.get_germany() for _ in range(10))),
+            5,
+            10,
+        ),
+        Benchmark("Connector.get_excel", run(con.get_excel), 5, 10),
+    ]
+
+
+def run_benchmarks(benchmarks: list[Benchmark], keyword: Optional[str] = None) -> dict[str, dict]:
+    """Runs the benchmarks containing keyword in their name, or all if keyword is None.
+
+    Returns:
+        dict[str, dict]: Best and median seconds per call, repeat and number of runs by benchmark name
+    """
+    results = {}
+    width = max((len(benchmark.name) for benchmark in benchmarks), default=0)
+    for benchmark in benchmarks:
+        if keyword and keyword not in benchmark.name:
+            continue
+        runs = measure_runs(benchmark.func, benchmark.repeat, benchmark.number)
+        results[benchmark.name] = {
+            "best": min(runs),
+            "median": statistics.median(runs),
+            "repeat": benchmark.repeat,
+            "number": benchmark.number,
+        }
+        print(f"  {benchmark.name:{width}} {min(runs) * 1000:10.3f} ms", flush=True)
+    return results
+
+
+def run_suite(keyword: Optional[str] = None) -> dict[str, dict]:
+    """Runs all benchmarks of the suite, or only those containing keyword in their name"""
+    matplotlib.use("Agg")
+    loop = asyncio.new_event_loop()
+    stack = contextlib.AsyncExitStack()
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            benchmarks = [
+                *parsing_benchmarks(),
+                *lookup_benchmarks(),
+                *graph_benchmarks(output_dir),
+                *connector_benchmarks(loop, stack),
+            ]
+            return run_benchmarks(benchmarks, keyword)
+    finally:
+        loop.run_until_complete(stack.aclose())
+        loop.close()
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict:
+    """Returns the commit and versions the results were measured with"""
+    import aiohttp
+    import numpy as np
+
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": {
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "aiohttp": aiohttp.__version__,
+        },
+    }
+
+
+def default_output_file(env: dict) -> Path:
+    name = env["commit"] or "results"
+    return RESULTS_DIR / f"{name}{'-dirty' if env['dirty'] else ''}.json"
+
+
+def compare(baseline: dict[str, dict], current: dict[str, dict]) -> list[Comparison]:
+    """Compares the best times of the benchmarks contained in both results, ratio > 1 means slower than baseline"""
+    return [
+        Comparison(name, baseline[name]["best"], result["best"], result["best"] / baseline[name]["best"])
+        for name, result in current.items()
+        if name in baseline and baseline[name]["best"] > 0
+    ]
+
+
+def print_comparisons(comparisons: list[Comparison], threshold: float) -> None:
+    width = max((len(comparison.name) for comparison in comparisons), default=0)
+    print(f"  {'':{width}} {'baseline':>13} {'current':>13} {'ratio':>7}")
+    for name, baseline, current, ratio in comparisons:
+        mark = "  slower" if ratio > threshold else "  faster" if ratio < 1 / threshold else ""
+        print(f"  {name:{width}} {baseline * 1000:10.3f} ms {current * 1000:10.3f} ms {ratio:7.2f}{mark}")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--keyword", help="Only run the benchmarks containing this in their name")
+    parser.add_argument("-o", "--output", type=Path, help="Json file to write. Defaults to .benchmarks/{commit}.json")
+    parser.add_argument("--compare", type=Path, help="Json file of a former run to compare the results to")
+    parser.add_argument(
+        "--threshold", type=float, default=1.1, help="Ratio marking a benchmark as slower or faster. Defaults to 1.1"
+    )
+    parser.add_argument("--fail-above", type=float, help="Exits with an error if a ratio exceeds this")
+    args = parser.parse_args(argv)
+
+    env = environment()
+    print(f"benchmark suite of {env['commit']}{' (dirty)' if env['dirty'] else ''}, best time per call")
+    results = run_suite(args.keyword)
+    output_file = args.output or default_output_file(env)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(json.dumps({**env, "results": results}, indent=2), encoding="utf-8")
+    print(f"results written to {output_file}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"compared to {baseline['commit']} of {baseline['created']}")
+        comparisons = compare(baseline["results"], results)
+        print_comparisons(comparisons, args.threshold)
+        if args.fail_above is not None:
+            if regressions := [comparison.name for comparison in comparisons if comparison.ratio > args.fail_above]:
+                sys.exit(f"{len(regressions)} benchmarks slower than {args.fail_above}x the baseline: {regressions}")
+
+
+if __name__ == "__main__":
+    main()
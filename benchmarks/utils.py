@@ -0,0 +1,26 @@
+import timeit
+from typing import Callable
+
+WORKBOOKS = (
+    # (file name, fixed_values, archive)
+    ("Fallzahlen_Inzidenz_aktualisiert.xlsx", False, False),
+    ("Fallzahlen_Kum_Tab_aktuell.xlsx", True, False),
+    ("Fallzahlen_Kum_Tab_Archiv.xlsx", True, True),
+)
+
+
+def measure_runs(func: Callable[[], object], repeat: int = 5, number: int = 1) -> list[float]:
+    """Returns the seconds per call of repeat runs, each calling func number times"""
+    return [seconds / number for seconds in timeit.repeat(func, repeat=repeat, number=number)]
+
+
+def measure(func: Callable[[], object], repeat: int = 5, number: int = 1) -> float:
+    """Returns the best time in seconds of repeat runs, each calling func number times"""
+    return min(measure_runs(func, repeat, number))
+
+
+def print_results(title: str, results: dict[str, float]) -> None:
+    width = max(len(name) for name in results)
+    print(title)
+    for name, seconds in results.items():
+        print(f"  {name:{width}} {seconds * 1000:10.3f} ms")
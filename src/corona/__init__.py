@@ -1,16 +1,115 @@
+import importlib
+import os
+import sys
+from typing import Optional
+
 import asyncclick as click
 
-from corona.history import history_wrapped
-from corona.today import today_wrapped
+from corona.metrics import REGISTRY
+from corona.profiling import PROFILE_FORMATS, Profiler
+from corona.replay import RECORD_DIR_ENV, REPLAY_DIR_ENV
+
+
+class LazyGroup(click.Group):
+    """Group importing the module of a command only when the command is used.
+    Keeps e.g. 'corona today' from importing pandas and matplotlib, which are only needed by history."""
+
+    def __init__(self, *args, lazy_commands: Optional[dict[str, str]] = None, **kwargs):
+        """Inits the group.
+
+        Args:
+            lazy_commands (dict[str, str], optional): Maps command names to 'module:attribute' of the command.
+                                                      Defaults to None.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "today": "corona.today:today_wrapped",
+        "history": "corona.history:history_wrapped",
+        "import": "corona.history:import_wrapped",
+        "clear-cache": "corona.cache:clear_cache_wrapped",
+        "export": "corona.export:export_wrapped",
+        "serve": "corona.serve:serve_wrapped",
+    },
+)
+@click.option(
+    "--replay",
+    type=click.Path(file_okay=False, exists=True),
+    help="Answers from the responses recorded in this directory instead of sending requests. "
+    f"Can be set with the environment variable {REPLAY_DIR_ENV} as well.",
+)
+@click.option(
+    "--record-responses",
+    type=click.Path(file_okay=False),
+    help="Records the responses into this directory, to replay them with --replay later. "
+    f"Can be set with the environment variable {RECORD_DIR_ENV} as well.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Prints the time, bytes, rows and peak memory of the phases of the run to stderr. "
+    "Tracing the memory slows the run down.",
+)
+@click.option("--profile-format", type=click.Choice(PROFILE_FORMATS), default="table", help="Defaults to table.")
+@click.option(
+    "--profile-dump",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Writes cProfile stats of the run to this file, to inspect them with pstats or snakeviz.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Writes the request, cache and parse metrics of the run to this file in the Prometheus text format.",
+)
+def cli(
+    replay: Optional[str] = None,
+    record_responses: Optional[str] = None,
+    profile: bool = False,
+    profile_format: str = "table",
+    profile_dump: Optional[str] = None,
+    metrics_file: Optional[str] = None,
+):
+    # the Connectors of all commands take their directories from the environment
+    if replay:
+        os.environ[REPLAY_DIR_ENV] = replay
+    if record_responses:
+        os.environ[RECORD_DIR_ENV] = record_responses
+    ctx = click.get_current_context()
+    if profile:
+        profiler = Profiler().start()
+
+        def print_profile():
+            profiler.stop()
+            print(profiler.format(profile_format), file=sys.stderr)
+
+        ctx.call_on_close(print_profile)
+    if profile_dump:
+        import cProfile
 
+        c_profile = cProfile.Profile()
+        c_profile.enable()
 
-@click.group()
-def cli():
-    pass
+        def dump_stats():
+            c_profile.disable()
+            c_profile.dump_stats(profile_dump)
 
+        ctx.call_on_close(dump_stats)
+    if metrics_file:
+        ctx.call_on_close(lambda: REGISTRY.write(metrics_file))
 
-cli.add_command(today_wrapped)
-cli.add_command(history_wrapped)
 
 if __name__ == "__main__":
     cli(_anyio_backend="asyncio")
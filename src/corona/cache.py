@@ -0,0 +1,222 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Optional, Union
+
+import asyncclick as click
+
+LOG = logging.getLogger(__name__)
+CachedResponse = namedtuple("CachedResponse", ("content", "etag", "last_modified", "fetched"))
+
+
+def user_cache_dir() -> Path:
+    """Returns the directory used for caching, can be overwritten with the environment variable CORONA_CACHE_DIR
+
+    Returns:
+        Path: Cache directory, might not exist yet
+    """
+    if cache_dir := os.getenv("CORONA_CACHE_DIR"):
+        return Path(cache_dir)
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "corona"
+
+
+class _DiskCache:
+    suffix = ".bin"
+
+    def __init__(self, directory: Path, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}{self.suffix}"
+
+    def _related_paths(self, path: Path) -> tuple[Path, ...]:
+        return (path,)
+
+    def evict(self) -> None:
+        """Deletes the least recently used entries until the cache is smaller than max_size"""
+        try:
+            entries = [(path.stat(), path) for path in self.directory.glob(f"*{self.suffix}")]
+        except OSError:
+            return
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+            if total <= self.max_size:
+                break
+            LOG.debug("Evicting '%s' from cache", path.name)
+            for file in self._related_paths(path):
+                file.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def clear(self) -> None:
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.glob(f"*{self.suffix}"):
+            for file in self._related_paths(path):
+                file.unlink(missing_ok=True)
+
+
+class HttpCache(_DiskCache):
+    """Stores downloaded files together with their ETag and Last-Modified header on disk, keyed by url."""
+
+    def __init__(
+        self,
+        directory: Union[None, str, Path] = None,
+        max_age: float = 3600,
+        max_size: int = 64 * 1024 * 1024,
+    ):
+        """Inits the cache.
+
+        Args:
+            directory (str|Path, optional): Directory to store the files in. Defaults to user_cache_dir() / "http".
+            max_age (float, optional): Seconds an entry is served without revalidation. Defaults to 3600.
+            max_size (int, optional): Max size of all cached files in bytes, the least recently used files will be
+                                      deleted if exceeded. Defaults to 64 MiB.
+        """
+        super().__init__(Path(directory) if directory else user_cache_dir() / "http", max_size)
+        self.max_age = max_age
+
+    def _related_paths(self, path: Path) -> tuple[Path, ...]:
+        return path, path.with_suffix(".json")
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        return self._related_paths(self._path(url))
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        data_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text("utf-8"))
+            content = data_path.read_bytes()
+            entry = CachedResponse(content, meta.get("etag"), meta.get("last_modified"), meta["fetched"])
+            size = meta["size"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if len(content) != size:
+            LOG.warning("Cache entry for '%s' is corrupt, ignoring it", url)
+            return None
+        os.utime(data_path)  # mark as recently used
+        return entry
+
+    def is_fresh(self, entry: CachedResponse, max_age: Optional[float] = None) -> bool:
+        max_age = self.max_age if max_age is None else max_age
+        return time.time() - entry.fetched < max_age
+
+    @staticmethod
+    def revalidation_headers(entry: Optional[CachedResponse]) -> dict[str, str]:
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def put(self, url: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        data_path, meta_path = self._paths(url)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "fetched": time.time(), "size": len(content)}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(data_path, content)
+            _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as err:
+            LOG.warning("Could not write cache entry for '%s': %s", url, err)
+            return
+        self.evict()
+
+    def touch(self, url: str) -> None:
+        """Marks the entry of url as fresh again, e.g. after the server answered with 304 Not Modified"""
+        _, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text("utf-8"))
+            meta["fetched"] = time.time()
+            _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except (OSError, ValueError) as err:
+            LOG.warning("Could not refresh cache entry for '%s': %s", url, err)
+
+
+class FrameCache(_DiskCache):
+    """Stores parsed excel sheets (dicts of DataFrames) on disk, keyed by the hash of the excel file and the parameters
+    used for parsing. Parsing the excel files with openpyxl is by far slower than loading the pickled frames."""
+
+    suffix = ".pickle"
+
+    def __init__(self, directory: Union[None, str, Path] = None, max_size: int = 256 * 1024 * 1024):
+        """Inits the cache.
+
+        Args:
+            directory (str|Path, optional): Directory to store the frames in. Defaults to user_cache_dir() / "frames".
+            max_size (int, optional): Max size of all cached frames in bytes, the least recently used files will be
+                                      deleted if exceeded. Defaults to 256 MiB.
+        """
+        super().__init__(Path(directory) if directory else user_cache_dir() / "frames", max_size)
+
+    @staticmethod
+    def key(content: bytes, *params) -> str:
+        """Creates the key for content parsed with params
+
+        Args:
+            content (bytes): Content of the parsed file
+            params: Everything else that has an influence on the parsed result, needs a stable repr
+
+        Returns:
+            str: key to use for get and put
+        """
+        return f"{hashlib.sha256(content).hexdigest()}-{params!r}"
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                result = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as err:
+            LOG.warning("Could not load cached frames '%s': %s", path.name, err)
+            return None
+        os.utime(path)  # mark as recently used
+        return result
+
+    def put(self, key: str, frames) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self._path(key), pickle.dumps(frames, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError as err:
+            LOG.warning("Could not write cached frames: %s", err)
+            return
+        self.evict()
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+
+
+@click.command("clear-cache")
+@click.option(
+    "-t",
+    "--type",
+    "cache_type",
+    type=click.Choice(("all", "http", "frames")),
+    default="all",
+    help="Which cache to clear: downloaded excel files (http), parsed excel sheets (frames) or both (all).",
+)
+async def clear_cache_wrapped(cache_type: str = "all") -> None:
+    """Löscht die zwischengespeicherten Dateien"""
+    if cache_type in ("all", "http"):
+        HttpCache().clear()
+    if cache_type in ("all", "frames"):
+        FrameCache().clear()
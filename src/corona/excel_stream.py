@@ -0,0 +1,193 @@
+"""Reads windows of xlsx sheets without loading the complete sheets.
+
+openpyxl creates an object for every cell of a sheet, even in read only mode. The sheets of the RKI excel files contain
+more than 100.000 cells, but only a few rows and the last columns are of interest. Therefore only the header row is read
+with openpyxl, the xml of the sheet is parsed incrementally with iterparse, every row is cleared once it was looked at
+and only the cells of the requested rows and columns are decoded.
+"""
+import io
+import zipfile
+from collections.abc import Callable, Collection, Iterator
+from typing import Optional
+from xml.etree import ElementTree
+
+import openpyxl
+import pandas as pd
+from openpyxl.reader.strings import read_string_table
+from openpyxl.utils import column_index_from_string
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _local_name(tag: str) -> str:
+    """Returns the tag without its namespace, sheets may use prefixes like <x:c> or the strict namespace"""
+    return tag.rpartition("}")[2]
+
+
+class StreamingWorkbook:
+    """Workbook reading only the requested rows and columns of its sheets"""
+
+    def __init__(self, path):
+        """Opens the workbook
+
+        Args:
+            path (str|bytes): Path to the xlsx file or its content
+        """
+        self._archive = zipfile.ZipFile(io.BytesIO(path) if isinstance(path, bytes) else path)
+        self._workbook = openpyxl.load_workbook(
+            io.BytesIO(path) if isinstance(path, bytes) else path, read_only=True, data_only=True, keep_links=False
+        )
+        self._sheet_paths = self._read_sheet_paths()
+        self._shared_strings: Optional[list[str]] = None
+
+    def _read_sheet_paths(self) -> dict[str, str]:
+        rels = ElementTree.fromstring(self._archive.read("xl/_rels/workbook.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{PACKAGE_REL_NS}Relationship")}
+        workbook = ElementTree.fromstring(self._archive.read("xl/workbook.xml"))
+        result = {}
+        for sheet in workbook.iter(f"{MAIN_NS}sheet"):
+            target = targets[sheet.get(f"{REL_NS}id")]
+            result[sheet.get("name")] = target[1:] if target.startswith("/") else f"xl/{target}"
+        return result
+
+    @property
+    def shared_strings(self) -> list[str]:
+        if self._shared_strings is None:
+            try:
+                with self._archive.open("xl/sharedStrings.xml") as xml_source:
+                    self._shared_strings = list(read_string_table(xml_source))
+            except KeyError:  # workbook without any shared strings
+                self._shared_strings = []
+        return self._shared_strings
+
+    def read_header(self, sheet_name: str, header_row: int) -> list:
+        """Reads a row with openpyxl. Columns without value will be named like pandas does: 'Unnamed: {position}'"""
+        rows = self._workbook[sheet_name].iter_rows(min_row=header_row, max_row=header_row, values_only=True)
+        header = next(rows, ())
+        return [f"Unnamed: {i}" if value is None else value for i, value in enumerate(header)]
+
+    def read_sheet(
+        self,
+        sheet_name: str,
+        skip_rows: int,
+        use_col: Callable[[object], bool],
+        labels: Collection[str],
+        days: int,
+        rename_column: Optional[Callable] = None,
+    ) -> pd.DataFrame:
+        """Reads a window of a sheet like pd.read_excel(index_col=0, usecols=use_col, skiprows=skip_rows) followed by
+        df.loc[labels, df.columns[-days:]], but without reading all other rows and columns.
+
+        Args:
+            sheet_name (str): Name of the sheet
+            skip_rows (int): Rows before the header row
+            use_col (Callable): Is called with the header names, only columns returning True are used.
+                                The first used column is the index.
+            labels (Collection[str]): Values of the index column of the rows to read
+            days (int): Amount of the last used columns to read. Reads all columns if 0.
+            rename_column (Callable, optional): Is applied to the column names. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Requested rows in order of the sheet and the requested columns as float
+        """
+        header_row = skip_rows + 1
+        header = self.read_header(sheet_name, header_row)
+        used = [i for i, name in enumerate(header) if use_col(name)]
+        if not used:
+            raise ValueError(f"Sheet '{sheet_name}' does not contain any usable column")
+        # 1-based column numbers like the references of the cells
+        index_column = used[0] + 1
+        value_positions = used[1:][-days:]
+        value_columns = {pos + 1: i for i, pos in enumerate(value_positions)}
+
+        labels = set(labels)
+        index = []
+        data = []
+        for row_number, row in enumerate(self._iter_rows(sheet_name), start=1):
+            row_number = int(row.get("r", row_number))
+            if row_number <= header_row:
+                continue
+            label = None
+            values = [float("nan")] * len(value_columns)
+            column = 0
+            for cell in row:
+                if _local_name(cell.tag) != "c":
+                    continue
+                reference = cell.get("r")
+                column = column_index_from_string(reference.rstrip("0123456789")) if reference else column + 1
+                if column == index_column:
+                    label = self._cell_value(cell)
+                    if label not in labels:
+                        break
+                elif column in value_columns:
+                    value = self._cell_value(cell)
+                    values[value_columns[column]] = float("nan") if value is None else value
+            if label is None or label not in labels:
+                continue
+            index.append(label)
+            data.append(values)
+
+        columns = [header[pos] for pos in value_positions]
+        if rename_column is not None:
+            columns = list(map(rename_column, columns))
+        return pd.DataFrame(data, index=index, columns=columns, dtype="float64")
+
+    def _iter_rows(self, sheet_name: str) -> Iterator[ElementTree.Element]:
+        """Yields the row elements of a sheet. They are removed from the tree once the caller looked at them, so only
+        a single row is kept in memory."""
+        with self._archive.open(self._sheet_paths[sheet_name]) as sheet_xml:
+            sheet_data = None
+            for event, element in ElementTree.iterparse(sheet_xml, events=("start", "end")):
+                name = _local_name(element.tag)
+                if event == "start":
+                    if name == "sheetData":
+                        sheet_data = element
+                elif name == "row":
+                    yield element
+                    if sheet_data is not None:
+                        sheet_data.clear()
+
+    def _cell_value(self, cell: ElementTree.Element):
+        cell_type = cell.get("t")
+        if cell_type == "inlineStr":
+            return _inline_string(cell)
+        value = next((child.text for child in cell if _local_name(child.tag) == "v"), None)
+        if value is None:
+            return None
+        if cell_type == "s":
+            return self.shared_strings[int(value)]
+        if cell_type == "str":
+            return value
+        if cell_type == "e":  # error values like #DIV/0!, pandas reads them as NaN too
+            return None
+        if cell_type == "b":
+            return value == "1"
+        return float(value)
+
+    def close(self) -> None:
+        self._workbook.close()
+        self._archive.close()
+
+    def __enter__(self) -> "StreamingWorkbook":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _inline_string(cell: ElementTree.Element) -> Optional[str]:
+    """Returns the text of an inline string, plain or of its rich text runs"""
+    for child in cell:
+        if _local_name(child.tag) != "is":
+            continue
+        parts = []
+        for node in child:
+            name = _local_name(node.tag)
+            if name == "t":
+                parts.append(node.text or "")
+            elif name == "r":
+                parts.extend(text.text or "" for text in node if _local_name(text.tag) == "t")
+        return "".join(parts)
+    return None
@@ -0,0 +1,216 @@
+"""Batch export of history graphs, e.g. for a nightly run rendering a graph per Bundesland.
+
+The values of all Landkreise are read once, the graphs are rendered with the Agg backend in a process pool.
+Every worker reuses its figure for all graphs it renders.
+"""
+import contextlib
+import json
+import logging
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+import asyncclick as click
+import pandas as pd
+
+from corona.history import date_formatter, draw_graph, read_history, set_graph_title
+from corona.landkreise import DEUTSCHLAND, Landkreise
+from corona.store import Store
+
+LOG = logging.getLogger(__name__)
+RegionSet = namedtuple("RegionSet", ("name", "landkreise"))
+ChartTiming = namedtuple("ChartTiming", ("name", "path", "draw", "save"))
+EXPORT_FORMATS = ("png", "svg")
+
+# state of a worker process, set by _init_worker
+_worker: dict = {}
+
+
+def region_sets_by_land() -> list[RegionSet]:
+    """Returns a region set per Bundesland containing all its Landkreise"""
+    laender = sorted({landkreis.land for landkreis in Landkreise if landkreis.land})
+    return [RegionSet(land, Landkreise.find_by_land(land)) for land in laender]
+
+
+def read_region_sets(config_file: Union[str, Path]) -> list[RegionSet]:
+    """Reads region sets from a json file mapping the name of every set to a list of Landkreis ids,
+    e.g. {"Rheinland": [80, 82, 96]}. Raises ValueError if the file is invalid or an id does not exist."""
+    with open(config_file, encoding="utf-8") as file:
+        config = json.load(file)
+    if not isinstance(config, dict) or not all(isinstance(ids, list) for ids in config.values()):
+        raise ValueError(f"'{config_file}' must map the names of the region sets to lists of Landkreis ids")
+    return [RegionSet(name, tuple(Landkreise.find_by_ids(ids))) for name, ids in config.items()]
+
+
+def select_region_set(
+    df_inzidenz: pd.DataFrame, df_hosp: Optional[pd.DataFrame], landkreise: tuple[Landkreise, ...]
+) -> tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """Selects the rows of landkreise from the values of all Landkreise, in the same order as get_history"""
+    df1 = df_inzidenz.loc[sorted(landkreise, key=lambda landkreis: landkreis.name) + [DEUTSCHLAND]]
+    if df_hosp is None:
+        return df1, None
+    laender = sorted({landkreis.land for landkreis in landkreise if landkreis.land})
+    return df1, df_hosp.loc[laender + [DEUTSCHLAND]]
+
+
+def _file_name(name: str, export_format: str) -> str:
+    stem = re.sub(r"[^\w-]+", "_", name).strip("_")
+    return f"{stem}.{export_format}"
+
+
+def _init_worker(
+    df_inzidenz: pd.DataFrame, df_hosp: Optional[pd.DataFrame], title: str, fixed_values: bool, dpi: float
+) -> None:
+    """Keeps the values in the worker, so they are transferred once per worker instead of once per graph"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    _worker.update(df_inzidenz=df_inzidenz, df_hosp=df_hosp, title=title, fixed_values=fixed_values, dpi=dpi)
+
+
+def _render(region_set: RegionSet, path: str) -> ChartTiming:
+    from matplotlib.figure import Figure  # without pyplot, the figure is neither managed nor shown
+
+    start = time.perf_counter()
+    if (fig := _worker.get("figure")) is None:
+        fig = _worker["figure"] = Figure()
+    else:
+        fig.clear()
+    df1, df2 = select_region_set(_worker["df_inzidenz"], _worker["df_hosp"], region_set.landkreise)
+    draw_graph(fig, df1, df2, _worker["title"], _worker["fixed_values"])
+    drawn = time.perf_counter()
+    fig.savefig(path, dpi=_worker["dpi"], bbox_inches="tight")
+    return ChartTiming(region_set.name, path, drawn - start, time.perf_counter() - drawn)
+
+
+def export_charts(
+    df_inzidenz: pd.DataFrame,
+    df_hosp: Optional[pd.DataFrame],
+    region_sets: list[RegionSet],
+    output_dir: Union[str, Path],
+    export_format: str = "png",
+    title: Optional[str] = None,
+    fixed_values: bool = False,
+    jobs: Optional[int] = None,
+    dpi: float = 100,
+) -> list[ChartTiming]:
+    """Renders a graph per region set into output_dir.
+
+    Args:
+        df_inzidenz (pd.DataFrame): Inzidenz of all Landkreise and Deutschland, columns already formatted
+        df_hosp (pd.DataFrame, optional): Hospitalisierung of all Bundeslaender and Deutschland
+        region_sets (list[RegionSet]): Region sets to render, the file names are derived from their names
+        output_dir (str|Path): Directory to write the graphs to, created if it does not exist
+        export_format (str, optional): 'png' or 'svg'. Defaults to 'png'.
+        title (str, optional): Title of every graph. Defaults to None.
+        fixed_values (bool, optional): Whether the values are the fixed values, used for the labels. Defaults to False.
+        jobs (int, optional): Amount of worker processes, None uses one per cpu. 1 renders in this process.
+                              Defaults to None.
+        dpi (float, optional): Resolution of png files. Defaults to 100.
+
+    Returns:
+        list[ChartTiming]: Path and seconds to draw and to save of every graph, in the order of region_sets
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{export_format}', must be one of {EXPORT_FORMATS}")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = [str(output_dir / _file_name(region_set.name, export_format)) for region_set in region_sets]
+    if len(set(paths)) != len(paths):
+        raise ValueError("The names of the region sets must result in different file names")
+    initargs = (df_inzidenz, df_hosp, title, fixed_values, dpi)
+    if jobs == 1:
+        _init_worker(*initargs)
+        return list(map(_render, region_sets, paths))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=initargs) as pool:
+        return list(pool.map(_render, region_sets, paths))
+
+
+async def export(
+    output_dir: Union[str, Path],
+    fix: bool = False,
+    days: int = 8,
+    config_file: Optional[str] = None,
+    export_format: str = "png",
+    jobs: Optional[int] = None,
+    input_file: Optional[str] = None,
+    use_cache: bool = True,
+    store: Optional[Store] = None,
+) -> list[ChartTiming]:
+    """Reads the values of all Landkreise once and renders a graph per region set like get_history.
+
+    Args:
+        output_dir (str|Path): Directory to write the graphs to
+        fix (bool, optional): Whether to use the fixed inzident values or not. Defaults to False.
+        days (int, optional): Amount of last days to show. Defaults to 8.
+        config_file (str, optional): Json file with the region sets, see read_region_sets.
+                                     None renders a graph per Bundesland. Defaults to None.
+        export_format (str, optional): 'png' or 'svg'. Defaults to 'png'.
+        jobs (int, optional): Amount of worker processes, None uses one per cpu. Defaults to None.
+        input_file (str, optional): Excel file to use instead of downloading it. Defaults to None.
+        use_cache (bool, optional): Whether downloaded and parsed excel files are cached on disk. Defaults to True.
+        store (Store, optional): Store with imported series, see get_history. Defaults to None.
+
+    Returns:
+        list[ChartTiming]: Path and seconds to draw and to save of every graph
+    """
+    region_sets = read_region_sets(config_file) if config_file else region_sets_by_land()
+    df_inzidenz, df_hosp = await read_history(None, fix, days, input_file, use_cache, store=store)
+    title = set_graph_title(df_inzidenz.columns[-1])
+    df_inzidenz = df_inzidenz.rename(columns=date_formatter)
+    if df_hosp is not None:
+        df_hosp = df_hosp.rename(columns=date_formatter)
+    return export_charts(df_inzidenz, df_hosp, region_sets, output_dir, export_format, title, fix, jobs)
+
+
+@click.command("export")
+@click.argument("output_dir")
+@click.option("-fix/-adjusted", default=False)
+@click.option("-d", "--days", type=int, default=8, help="Amount of last days to show. Defaults to 8.")
+@click.option(
+    "-c",
+    "--config",
+    "config_file",
+    help='Json file mapping names to lists of Landkreis ids, e.g. {"Rheinland": [80, 82]}. '
+    "Default is a graph per Bundesland.",
+)
+@click.option("-f", "--format", "export_format", type=click.Choice(EXPORT_FORMATS), default="png")
+@click.option("-j", "--jobs", type=int, help="Amount of worker processes. Defaults to one per cpu.")
+@click.option(
+    "-i", "--input_file", help="If set will use this as input-excel file. '-fix' parameter must be set accordingly."
+)
+@click.option(
+    "--cache/--no-cache", default=True, help="Cache downloaded and parsed excel files on disk. Default is to cache."
+)
+@click.option(
+    "--store/--no-store",
+    default=True,
+    help="Use the values imported by 'import' instead of parsing the excel files for fixed values. "
+    "Default is to use them.",
+)
+async def export_wrapped(
+    output_dir: str,
+    fix: bool = False,
+    days: int = 8,
+    config_file: Optional[str] = None,
+    export_format: str = "png",
+    jobs: Optional[int] = None,
+    input_file: Optional[str] = None,
+    cache: bool = True,
+    store: bool = True,
+) -> None:
+    """Corona Inzidenzzahlen Historie als Graph pro Bundesland oder Regionen exportieren"""
+    start = time.perf_counter()
+    with Store() if store else contextlib.nullcontext() as history_store:
+        timings = await export(
+            output_dir, fix, days, config_file, export_format, jobs, input_file, cache, history_store
+        )
+    width = max((len(timing.name) for timing in timings), default=0)
+    for timing in timings:
+        print(
+            f"{timing.name:{width}} {timing.draw * 1000:8.1f} ms draw {timing.save * 1000:8.1f} ms save  {timing.path}"
+        )
+    print(f"{len(timings)} Graphen in {time.perf_counter() - start:.1f} s exportiert")
@@ -1,16 +1,32 @@
 import asyncio
 import contextlib
+import hashlib
+import json
+import logging
+import math
+import os
 import re
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Callable, Collection, Optional, Union
 
 import asyncclick as click
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd  # uses openpyxl in background
 
+from corona.cache import FrameCache, HttpCache
+from corona.excel_stream import StreamingWorkbook
 from corona.landkreise import DEUTSCHLAND, Landkreise
+from corona.metrics import CACHE_REQUESTS, READ_EXCEL_SECONDS
+from corona.output import OUTPUT_FORMATS, check_output_format, open_output, validate_output_format, write_frame
+from corona.profiling import profiled
 from corona.rki_connector import Connector
+from corona.store import DEUTSCHLAND_ID, Store
+
+LOG = logging.getLogger(__name__)
+# kinds of the series in the Store, in the same order as the sheet names of _get_excel_param
+SERIES_KINDS = ("landkreise", "bundeslaender", "hospitalisierung")
+FIXED_EXCEL_NAME = "Fallzahlen_Kum_Tab_aktuell.xlsx"
+FIXED_ARCHIVE_EXCEL_NAME = "Fallzahlen_Kum_Tab_Archiv.xlsx"
 
 
 def find_landkreis(lk_name: str):
@@ -41,25 +57,38 @@ def _get_excel_param(fixed_values: bool, archive: bool) -> tuple[list[str], int]
     return sheet_names, 2
 
 
-def _get_df_inzidenz(df: pd.DataFrame, kreise: Collection[Landkreise], days: int):
+@profiled(rows=len)
+def _get_df_inzidenz(df: pd.DataFrame, kreise: Optional[Collection[Landkreise]], days: int):
+    if kreise is None:
+        return _get_df_inzidenz_all(df, days)
     sort_by_name = lambda landkreis: landkreis.name
     kreise_sorted = list(sorted(kreise, key=sort_by_name))
     df = df.loc[[x.lk_name for x in kreise_sorted], df.columns[-days:]]
-    df.rename(index=find_landkreis, columns=format_to_datetime, inplace=True)
+    df.index = pd.Index(Landkreise.map_lk_names(df.index), dtype=object, name=df.index.name)
     return df
 
 
-def _get_df_hosp(df: pd.DataFrame, kreise: Collection[Landkreise], days: int):
+def _get_df_inzidenz_all(df: pd.DataFrame, days: int):
+    """Selects all rows of Landkreise at once, sorted by Bundesland and name. Rows of unknown names are dropped."""
+    df = df.loc[df.index.isin([x.lk_name for x in Landkreise]), df.columns[-days:]]
+    landkreise = Landkreise.map_lk_names(df.index)
+    order = np.lexsort(([x.name for x in landkreise], [x.land for x in landkreise]))
+    df = df.iloc[order]
+    df.index = pd.Index([landkreise[i] for i in order], dtype=object)
+    return df
+
+
+def _get_df_hosp(df: pd.DataFrame, kreise: Optional[Collection[Landkreise]], days: int):
+    if kreise is None:
+        kreise = Landkreise
     laender = list(sorted({x.land for x in kreise if x.land})) + ["Gesamt"]
     df = df.loc[laender, df.columns[-days:]]
-    df.rename(index={"Gesamt": DEUTSCHLAND}, columns=format_to_datetime, inplace=True)
+    df.rename(index={"Gesamt": DEUTSCHLAND}, inplace=True)
     return df
 
 
 def _get_series_ger(df: pd.DataFrame, days: int):
-    ger = df.loc["Gesamt", df.columns[-days:]]
-    ger.rename(format_to_datetime, inplace=True)
-    return ger
+    return df.loc["Gesamt", df.columns[-days:]]
 
 
 def _use_cols(index):
@@ -72,14 +101,94 @@ def _use_cols(index):
     return False
 
 
-def read_excel(path, kreise: Collection[Landkreise], fixed_values: bool = False, days: int = 8, archive: bool = False):
+def read_sheets(
+    path, fixed_values: bool = False, archive: bool = False, cache: Optional[FrameCache] = None
+) -> dict[str, pd.DataFrame]:
+    """Reads all relevant sheets of the excel completely. The columns are converted to datetime.
+
+    Args:
+        path (str|bytes): Path to the excel file or its content. Only content is cached.
+        fixed_values (bool, optional): Whether the excel contains the fixed inzidenz values. Defaults to False.
+        archive (bool, optional): Whether the excel is the archive of the fixed values. Defaults to False.
+        cache (FrameCache, optional): If set, parsed sheets are loaded from and stored in it. Defaults to None.
+
+    Returns:
+        dict[str, pd.DataFrame]: The sheets by sheet name. Must not be modified, as they might be cached.
+    """
     sheet_names, skip_rows = _get_excel_param(fixed_values, archive)
+    key = None
+    if cache is not None and isinstance(path, bytes):
+        key = cache.key(path, fixed_values, archive, pd.__version__)
+        if (dfs := cache.get(key)) is not None:
+            CACHE_REQUESTS.inc(cache="frame", result="hit")
+            return dfs
+        CACHE_REQUESTS.inc(cache="frame", result="miss")
+
     dfs = pd.read_excel(
         path, sheet_name=sheet_names, index_col=0, usecols=_use_cols, skiprows=skip_rows, engine="openpyxl"
     )
-
     for df in dfs.values():
         df.index.name = None
+        df.rename(columns=format_to_datetime, inplace=True)
+
+    if key is not None:
+        cache.put(key, dfs)
+    return dfs
+
+
+def read_sheets_streaming(
+    path,
+    kreise: Optional[Collection[Landkreise]],
+    fixed_values: bool = False,
+    days: int = 8,
+    archive: bool = False,
+) -> dict[str, pd.DataFrame]:
+    """Reads only the rows and last columns of the sheets which are needed for kreise and days.
+    Results in the same frames as read_excel, but is faster and needs less memory than reading the complete sheets.
+
+    Args:
+        path (str|bytes): Path to the excel file or its content
+        kreise (Collection[Landkreise]): Landkreise to read, None reads all Landkreise
+        fixed_values (bool, optional): Whether the excel contains the fixed inzidenz values. Defaults to False.
+        days (int, optional): Amount of last days to read, 0 reads all days. Defaults to 8.
+        archive (bool, optional): Whether the excel is the archive of the fixed values. Defaults to False.
+
+    Returns:
+        dict[str, pd.DataFrame]: The partial sheets by sheet name
+    """
+    sheet_names, skip_rows = _get_excel_param(fixed_values, archive)
+    if kreise is None:
+        kreise = Landkreise
+    labels = [
+        [lk.lk_name for lk in kreise],
+        ["Gesamt"],
+        [lk.land for lk in kreise if lk.land] + ["Gesamt"],
+    ]
+    with StreamingWorkbook(path) as workbook:
+        return {
+            sheet_name: workbook.read_sheet(sheet_name, skip_rows, _use_cols, sheet_labels, days, format_to_datetime)
+            for sheet_name, sheet_labels in zip(sheet_names, labels)
+        }
+
+
+@profiled(rows=lambda result: len(result[0]))
+def read_excel(
+    path,
+    kreise: Optional[Collection[Landkreise]],
+    fixed_values: bool = False,
+    days: int = 8,
+    archive: bool = False,
+    cache: Optional[FrameCache] = None,
+    engine: str = "openpyxl",
+):
+    sheet_names, _ = _get_excel_param(fixed_values, archive)
+    if engine not in ("openpyxl", "streaming"):
+        raise ValueError(f"Unknown engine '{engine}', use 'openpyxl' or 'streaming'")
+    with READ_EXCEL_SECONDS.time(engine=engine):
+        if engine == "streaming":
+            dfs = read_sheets_streaming(path, kreise, fixed_values, days, archive)
+        else:
+            dfs = read_sheets(path, fixed_values, archive, cache)
 
     # get results
     df_inzidenz = _get_df_inzidenz(dfs[sheet_names[0]], kreise, days)
@@ -94,6 +203,157 @@ def read_excel(path, kreise: Collection[Landkreise], fixed_values: bool = False,
     return df_inzidenz, df_hosp
 
 
+def read_store(store: Store, kreise: Collection[Landkreise], days: int = 8, max_age: int = 1) -> Optional[pd.DataFrame]:
+    """Returns the fixed inzidenz values of kreise like read_excel, but from the values recorded in store.
+
+    Args:
+        store (Store): Store with the recorded values
+        kreise (Collection[Landkreise]): Landkreise to return
+        days (int, optional): Amount of last days to return. Defaults to 8.
+        max_age (int, optional): Max days the newest recorded value may be older than today. Defaults to 1.
+
+    Returns:
+        pd.DataFrame: The inzidenz values. None if not all of them were recorded or the newest one is too old.
+    """
+    latest = store.latest_date()
+    if days <= 0 or latest is None or (date.today() - latest).days > max_age:
+        return None
+    dates = [latest - timedelta(days=days_before) for days_before in reversed(range(days))]
+    kreise_sorted = sorted(kreise, key=lambda landkreis: landkreis.name)
+    region_ids = [x.id for x in kreise_sorted] + [DEUTSCHLAND_ID]
+    values = store.get_snapshots(region_ids, dates[0], latest)
+    try:
+        data = [[values[region_id][day] for day in dates] for region_id in region_ids]
+    except KeyError:  # e.g. days before the first recording
+        return None
+    index = pd.Index([*kreise_sorted, DEUTSCHLAND], dtype=object)
+    return pd.DataFrame(data, index=index, columns=pd.DatetimeIndex(dates), dtype="float64")
+
+
+def read_store_hosp(store: Store, kreise: Collection[Landkreise], columns: pd.DatetimeIndex) -> Optional[pd.DataFrame]:
+    """Returns the hospitalisierung values like read_excel for the days of columns, from the series imported into
+    store. The values recorded by 'today --record' do not contain them.
+
+    Returns:
+        pd.DataFrame: The hospitalisierung values. None if not all of them were imported.
+    """
+    series = store.get_series(SERIES_KINDS[2], None, columns[0].date(), columns[-1].date())
+    if not series:
+        return None
+    try:
+        df_hosp = _get_df_hosp(_series_to_df(series, columns), kreise, len(columns))
+    except KeyError:
+        return None
+    return None if df_hosp.isna().any(axis=None) else df_hosp
+
+
+def _iter_series(dfs: dict[str, pd.DataFrame], sheet_names: Collection[str]):
+    for kind, sheet_name in zip(SERIES_KINDS, sheet_names):
+        df = dfs[sheet_name]
+        dates = [column.date() for column in df.columns]
+        for region, values in zip(df.index, df.to_numpy().tolist()):
+            if not isinstance(region, str):  # empty rows
+                continue
+            for day, value in zip(dates, values):
+                if not math.isnan(value):
+                    yield kind, region, day, value
+
+
+def import_excel(
+    store: Store, content: bytes, name: str, archive: bool = False, cache: Optional[FrameCache] = None
+) -> int:
+    """Imports the fixed values of an excel file into store, unless this version of it was imported before.
+
+    Args:
+        store (Store): Store to import into
+        content (bytes): Content of the excel file with the fixed values
+        name (str): Name of the source, e.g. the file name. The source is identified by the hash of content, so
+                    the same content is not imported again under another name.
+        archive (bool, optional): Whether the excel is the archive of the fixed values. Defaults to False.
+        cache (FrameCache, optional): If set, parsed sheets are loaded from and stored in it. Defaults to None.
+
+    Returns:
+        int: Amount of imported values
+    """
+    version = hashlib.sha256(content).hexdigest()
+    if store.has_source(version):
+        return 0
+    sheet_names, _ = _get_excel_param(True, archive)
+    return store.add_series(name, version, _iter_series(read_sheets(content, True, archive, cache), sheet_names))
+
+
+def _series_to_df(series: dict[str, dict[date, float]], columns: Optional[pd.DatetimeIndex] = None) -> pd.DataFrame:
+    df = pd.DataFrame.from_dict(series, orient="index", dtype="float64")
+    df.columns = pd.DatetimeIndex(df.columns)
+    return df.reindex(columns=df.columns.sort_values() if columns is None else columns)
+
+
+def read_series(
+    store: Store, kreise: Optional[Collection[Landkreise]], days: int = 8
+) -> Optional[tuple[pd.DataFrame, Optional[pd.DataFrame]]]:
+    """Returns the fixed values like read_excel, but from the series imported into store.
+
+    Args:
+        store (Store): Store with the imported series
+        kreise (Collection[Landkreise]): Landkreise to return, None returns all
+        days (int, optional): Amount of last days to return, 0 returns all days. Defaults to 8.
+
+    Returns:
+        tuple[pd.DataFrame, Optional[pd.DataFrame]]: Inzidenz and hospitalisierung values. None if nothing was
+                                                     imported or not all Landkreise were imported.
+    """
+    if (latest := store.latest_series_date(SERIES_KINDS[0])) is None:
+        return None
+    first = None if days <= 0 else latest - timedelta(days=days - 1)
+    lk_names = None if kreise is None else [x.lk_name for x in kreise]
+    df_lk = _series_to_df(store.get_series(SERIES_KINDS[0], lk_names, first, latest))
+    df_bl = _series_to_df(store.get_series(SERIES_KINDS[1], None, first, latest), df_lk.columns)
+    df_hosp = _series_to_df(store.get_series(SERIES_KINDS[2], None, first, latest), df_lk.columns)
+    try:
+        df_inzidenz = _get_df_inzidenz(df_lk, kreise, days)
+        df_inzidenz.loc[DEUTSCHLAND] = _get_series_ger(df_bl, days)
+        if df_hosp.isna().all(axis=None):  # e.g. only days of the archive, it does not contain hospitalisierung
+            return df_inzidenz, None
+        return df_inzidenz, _get_df_hosp(df_hosp, kreise, days)
+    except KeyError:
+        LOG.info("Not all Landkreise were imported, using the excel files")
+        return None
+
+
+def _region_id(region: Union[Landkreise, str]) -> Optional[int]:
+    if isinstance(region, Landkreise):
+        return region.id
+    return DEUTSCHLAND_ID if region == DEUTSCHLAND else None
+
+
+def values_to_frame(df_inzidenz: pd.DataFrame, df_hosp: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Returns the values of read_excel as one row per kind, region and date, without missing values.
+
+    Returns:
+        pd.DataFrame: Columns kind ('inzidenz' or 'hospitalisierung'), region (name), region_id (id of the Landkreis,
+                      DEUTSCHLAND_ID for Deutschland, missing for Bundeslaender), date (YYYY-MM-DD) and value
+    """
+    frames = []
+    for kind, df in (("inzidenz", df_inzidenz), ("hospitalisierung", df_hosp)):
+        if df is None:
+            continue
+        values = df.to_numpy(dtype=float).ravel()
+        keep = ~np.isnan(values)
+        columns = len(df.columns)
+        region_ids = np.array([_region_id(region) for region in df.index], dtype=object)
+        frame = pd.DataFrame(
+            {
+                "kind": kind,
+                "region": np.repeat(np.array([str(region) for region in df.index], dtype=object), columns)[keep],
+                "region_id": pd.array(np.repeat(region_ids, columns)[keep], dtype="Int64"),
+                "date": np.tile(pd.DatetimeIndex(df.columns).strftime("%Y-%m-%d").to_numpy(), len(df))[keep],
+                "value": values[keep],
+            }
+        )
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
 def df_to_string(df: pd.DataFrame):
     return df.to_string(header=True, index=True, justify="center", float_format=float_formatter)
 
@@ -110,18 +370,71 @@ def set_graph_title(date_obj: datetime):
     return "7-Tages Inzidenzwerte, Stand: " + date_obj.strftime("%d.%m.%Y")
 
 
-async def get_input(fixed_values: bool, days: int, input_file: Optional[str] = None) -> list:
+async def _download_excels(con: Connector, fixed_values: bool, days: int) -> list:
+    if not fixed_values:
+        return [await con.get_excel()]
+
+    binary_excels = [con.get_excel_fixed()]
+    if days <= 0:
+        binary_excels.append(con.get_excel_fixed_archive())
+    return await asyncio.gather(*binary_excels)
+
+
+async def get_input(
+    fixed_values: bool,
+    days: int,
+    input_file: Optional[str] = None,
+    use_cache: bool = True,
+    con: Optional[Connector] = None,
+) -> list:
     if input_file:
         with open(input_file, "br") as excel_file:
             return [excel_file.read()]
-    async with Connector() as con:
-        if not fixed_values:
-            return [await con.get_excel()]
+    if con is not None:  # already opened by the caller
+        return await _download_excels(con, fixed_values, days)
+    async with Connector(HttpCache() if use_cache else None) as con:
+        return await _download_excels(con, fixed_values, days)
 
-        binary_excels = [con.get_excel_fixed()]
-        if days <= 0:
-            binary_excels.append(con.get_excel_fixed_archive())
-        return await asyncio.gather(*binary_excels)
+
+async def read_history(
+    landkreise: Optional[Collection[Landkreise]],
+    fix: bool = False,
+    days: int = 8,
+    input_file: Optional[str] = None,
+    use_cache: bool = True,
+    engine: str = "openpyxl",
+    con: Optional[Connector] = None,
+    store: Optional[Store] = None,
+) -> tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """Returns the inzidenz and hospitalisierung values of the last days, see get_history for the arguments.
+    landkreise None returns all Landkreise."""
+    inzidenzen_result, result_hosp = None, None
+    binary_excels = None
+    frame_cache = FrameCache() if use_cache else None
+    if store is not None and fix and not input_file and landkreise is not None:
+        if (recorded := read_store(store, landkreise, days)) is not None:
+            # the recordings only contain inzidenz, hospitalisierung is taken from the imported series if possible
+            inzidenzen_result = recorded
+            if (result_hosp := read_store_hosp(store, landkreise, recorded.columns)) is None:
+                LOG.warning("Hospitalisierung of the recorded days was not imported, it is not shown. Run 'import'.")
+    if inzidenzen_result is not None:
+        LOG.info("Using the recorded values of '%s'", store.path)
+    elif store is not None and fix and store.sources():
+        # the archive is imported already, only the current excel file might contain new values
+        binary_excels = await get_input(fix, max(days, 1), input_file, use_cache, con)
+        name = os.path.basename(input_file) if input_file else FIXED_EXCEL_NAME
+        import_excel(store, binary_excels[0], name, False, frame_cache)
+        if (result := read_series(store, landkreise, days)) is not None:
+            inzidenzen_result, result_hosp = result
+    if inzidenzen_result is None:
+        # the current excel loaded for the import is enough, unless all days need the archive as well
+        if binary_excels is None or (days <= 0 and not input_file):
+            binary_excels = await get_input(fix, days, input_file, use_cache, con)
+        inzidenzen_result, result_hosp = read_excel(binary_excels[0], landkreise, fix, days, False, frame_cache, engine)
+        if len(binary_excels) == 2:
+            inzidenzen_result2, _ = read_excel(binary_excels[1], landkreise, fix, days, True, frame_cache, engine)
+            inzidenzen_result = inzidenzen_result.join(inzidenzen_result2)
+    return inzidenzen_result, result_hosp
 
 
 async def get_history(
@@ -130,6 +443,14 @@ async def get_history(
     save: Optional[str] = None,
     method: Union[str, int] = 8,
     input_file: Optional[str] = None,
+    use_cache: bool = True,
+    engine: str = "openpyxl",
+    con: Optional[Connector] = None,
+    all: bool = False,
+    store: Optional[Store] = None,
+    stats_format: Optional[str] = None,
+    output_format: str = "table",
+    output_file: Optional[str] = None,
 ):
     """Corona Inzidenzzahlen Historie
 
@@ -143,7 +464,24 @@ async def get_history(
                                     If set to 'm' or 'month', will plot all months. Defaults to 8.
         input_file (str, optional): Will save plot as imp with given name.
                                     If empty or None the plot will just be displayed. Defaults to None.
+        use_cache (bool, optional): Whether downloaded and parsed excel files are cached on disk. Defaults to True.
+        engine (str, optional): 'openpyxl' parses the complete sheets (and caches them if use_cache),
+                                'streaming' reads only the needed rows and columns. Defaults to 'openpyxl'.
+        con (Connector, optional): Opened Connector to download the excel files with, e.g. to share its session.
+                                   Its cache is used instead of use_cache. Defaults to None.
+        all (bool, optional): Whether to show all Landkreise as heatmap. Ignores landkreise_ids. Defaults to False.
+        store (Store, optional): If set, fixed values of recent days are taken from the values recorded in it,
+                                 if it contains all of them. Their hospitalisierung is taken from the imported
+                                 series, or missing if these days were not imported. Otherwise if series were imported into it, fixed values are taken from them after
+                                 importing the current excel file. Defaults to None.
+        stats_format (str, optional): For weeks and months, 'text' or 'json' prints the statistics of every week or
+                                      month instead of showing the boxplot. Defaults to None.
+        output_format (str, optional): 'table' prints tables and shows the graph, the other OUTPUT_FORMATS of
+                                       corona.output write the values as rows of values_to_frame to output_file
+                                       instead. Defaults to 'table'.
+        output_file (str, optional): File to write the rows to, None writes to stdout. Defaults to None.
     """
+    check_output_format(output_format)
     landkreise = Landkreise.find_by_ids(landkreise_ids)
     if not landkreise:
         landkreise = LANDKREISE
@@ -151,16 +489,34 @@ async def get_history(
     with contextlib.suppress(ValueError):
         method = 8 if method is None else int(method)
         days = method
-    binary_excels = await get_input(fix, days, input_file)
-    inzidenzen_result, result_hosp = read_excel(binary_excels[0], landkreise, fix, days, False)
-    if len(binary_excels) == 2:
-        inzidenzen_result2, _ = read_excel(binary_excels[1], landkreise, fix, days, True)
-        inzidenzen_result = inzidenzen_result.join(inzidenzen_result2)
+    if all:
+        if not isinstance(method, int):
+            raise ValueError("All Landkreise can only be shown by days, not by week or month!")
+        landkreise = None
+    inzidenzen_result, result_hosp = await read_history(
+        landkreise, fix, days, input_file, use_cache, engine, con, store
+    )
 
-    if isinstance(method, int):
+    if output_format != "table":
+        with open_output(output_file) as file:
+            write_frame(values_to_frame(inzidenzen_result, result_hosp), output_format, file)
+    elif landkreise is None:
+        prepare_and_show_heatmap(inzidenzen_result, result_hosp, save, fix)
+    elif isinstance(method, int):
         prepare_and_show_graph(inzidenzen_result, result_hosp, save, fix)
     else:
-        show_boxplot(inzidenzen_result.T, method, save)
+        show_boxplot(inzidenzen_result.T, method, save, stats_format)
+
+
+def _is_days(method: Union[None, str, int]) -> bool:
+    """Returns whether method of get_history shows days, not weeks or months"""
+    if method is None:
+        return True
+    try:
+        int(method)
+    except ValueError:
+        return False
+    return True
 
 
 @click.command("history")
@@ -176,15 +532,131 @@ async def get_history(
 @click.option(
     "-i", "--input_file", help="If set will use this as input-excel file. '-fix' parameter must be set accordingly."
 )
+@click.option(
+    "--cache/--no-cache", default=True, help="Cache downloaded and parsed excel files on disk. Default is to cache."
+)
+@click.option(
+    "-e",
+    "--engine",
+    type=click.Choice(("openpyxl", "streaming")),
+    default="openpyxl",
+    help="'openpyxl' parses the complete excel sheets, 'streaming' only reads the needed rows and columns.",
+)
+@click.option(
+    "-a",
+    "--all",
+    is_flag=True,
+    default=False,
+    help="Shows all Landkreise as heatmap grouped by Bundesland. Ignores the given ids.",
+)
+@click.option(
+    "--store/--no-store",
+    default=True,
+    help="Use the values recorded by 'today --record' for recent days and the values imported by 'import' "
+    "instead of parsing the excel files for fixed values. Default is to use them.",
+)
+@click.option(
+    "--stats",
+    "stats_format",
+    type=click.Choice(("text", "json")),
+    help="For weeks and months: prints count, mean, min, quartiles and max of every week or month "
+    "instead of showing the boxplot.",
+)
+@click.option(
+    "-f",
+    "--output-format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    callback=validate_output_format,
+    help="'table' prints tables and shows the graph. 'jsonl', 'csv' and 'arrow' (requires pyarrow) write a row per "
+    "region and date instead. Default is 'table'.",
+)
+@click.option("--output-file", help="Writes the rows to this file instead of stdout.")
 async def history_wrapped(
     landkreise_ids: Collection[int],
     fix: bool = False,
     save: Optional[str] = None,
     method: Union[str, int] = 8,
     input_file: Optional[str] = None,
+    cache: bool = True,
+    engine: str = "openpyxl",
+    all: bool = False,
+    store: bool = True,
+    stats_format: Optional[str] = None,
+    output_format: str = "table",
+    output_file: Optional[str] = None,
 ) -> None:
     """Corona Inzidenzzahlen Historie"""
-    await get_history(landkreise_ids, fix, save, method, input_file)
+    if stats_format is not None and (output_format != "table" or _is_days(method)):
+        raise click.UsageError("--stats only works with --method week or month and --output-format table.")
+    with Store() if store else contextlib.nullcontext() as history_store:
+        await get_history(
+            landkreise_ids,
+            fix,
+            save,
+            method,
+            input_file,
+            cache,
+            engine,
+            all=all,
+            store=history_store,
+            stats_format=stats_format,
+            output_format=output_format,
+            output_file=output_file,
+        )
+
+
+async def _read_or_download(file_name: Optional[str], download) -> bytes:
+    if not file_name:
+        return await download()
+    with open(file_name, "br") as excel_file:
+        return excel_file.read()
+
+
+async def import_excels(
+    store: Store, archive_file: Optional[str] = None, current_file: Optional[str] = None, use_cache: bool = True
+) -> int:
+    """Imports the fixed values of the archive and the current excel file into store.
+    Files which were imported before in the same version are skipped.
+
+    Args:
+        store (Store): Store to import into
+        archive_file (str, optional): Archive excel file, downloaded if not set. Defaults to None.
+        current_file (str, optional): Current excel file with the fixed values, downloaded if not set. Defaults to None.
+        use_cache (bool, optional): Whether downloaded and parsed excel files are cached on disk. Defaults to True.
+
+    Returns:
+        int: Amount of imported values
+    """
+    async with Connector(HttpCache() if use_cache else None) as con:
+        archive, current = await asyncio.gather(
+            _read_or_download(archive_file, con.get_excel_fixed_archive),
+            _read_or_download(current_file, con.get_excel_fixed),
+        )
+    frame_cache = FrameCache() if use_cache else None
+    added = import_excel(store, archive, os.path.basename(archive_file or FIXED_ARCHIVE_EXCEL_NAME), True, frame_cache)
+    added += import_excel(store, current, os.path.basename(current_file or FIXED_EXCEL_NAME), False, frame_cache)
+    return added
+
+
+@click.command("import")
+@click.option("--archive", "archive_file", help="Archive excel file to import. Default will download it.")
+@click.option(
+    "--current", "current_file", help="Current excel file with fixed values to import. Default will download it."
+)
+@click.option(
+    "--cache/--no-cache", default=True, help="Cache downloaded and parsed excel files on disk. Default is to cache."
+)
+async def import_wrapped(archive_file: Optional[str] = None, current_file: Optional[str] = None, cache: bool = True):
+    """Importiert die fixierten Inzidenzzahlen der RKI Excel Dateien für history"""
+    with Store() as store:
+        added = await import_excels(store, archive_file, current_file, cache)
+        print(f"{added} neue Werte importiert")
+        for source in store.sources():
+            print(
+                f"{source.name} ({source.version[:12]}): {source.first_date} bis {source.last_date}, "
+                f"{source.values} Werte, importiert am {source.imported}"
+            )
 
 
 def dataframe_max(df: pd.DataFrame, default=0):
@@ -231,7 +703,10 @@ def get_lines_hosp(max_val: float):
     return result
 
 
+@profiled()
 def save_or_show(output_file: Optional[str] = None, fig=None):
+    import matplotlib.pyplot as plt  # imported when needed, importing it takes a while
+
     if output_file:
         plt.savefig(output_file, bbox_inches="tight")
     else:
@@ -245,7 +720,10 @@ def _get_colors(min_values: Collection[int], max_values: Collection[int], count:
     return [f"#{int(round(res[0])):02x}{int(round(res[1])):02x}{int(round(res[2])):02x}" for res in result]
 
 
-def get_colors(df1: pd.DataFrame, df2: pd.DataFrame) -> tuple[dict[Landkreise, str], dict[str, str]]:
+@profiled()
+def get_colors(df1: pd.DataFrame, df2: Optional[pd.DataFrame] = None) -> tuple[dict[Landkreise, str], dict[str, str]]:
+    """Assigns a color range to every Bundesland and a color of it to every Landkreis of df1.
+    The Bundeslaender are taken from df2, or from the Landkreise of df1 if df2 is None."""
     # colors
     all_colors = pd.DataFrame(
         (
@@ -268,19 +746,22 @@ def get_colors(df1: pd.DataFrame, df2: pd.DataFrame) -> tuple[dict[Landkreise, s
     )
     all_colors.set_index(["name", "type"], inplace=True)
     # all_hatches = ("", "/", "\\", "x")
-    bundeslaender = df2.index.drop(DEUTSCHLAND)
-    colors_count = min(len(bundeslaender), len(all_colors) // 2)
-    color_indexes = all_colors.index.levels[0]
-
     all_lks = df1.index.drop(DEUTSCHLAND)
     if not_set_bundesland := tuple(lk for lk in all_lks if not lk.land):
         raise ValueError(f"The following Landkreise do not have a Bundesland set: {not_set_bundesland}")
+    lks_by_bundesland: dict[str, list[Landkreise]] = {}
+    for lk in all_lks:
+        lks_by_bundesland.setdefault(lk.land, []).append(lk)
+
+    bundeslaender = sorted(lks_by_bundesland) if df2 is None else df2.index.drop(DEUTSCHLAND)
+    colors_count = min(len(bundeslaender), len(all_colors) // 2)
+    color_indexes = all_colors.index.levels[0]
     result_lks: dict[Landkreise, str] = {}
     result_bundesland: dict[str, str] = {}
     for i, bundesland in enumerate(bundeslaender):
         color_name = color_indexes[i % colors_count]
         color_df = all_colors.loc[color_name]
-        lks = tuple(lk for lk in all_lks if lk.land == bundesland)
+        lks = lks_by_bundesland.get(bundesland, ())
         color_variations = max(len(lks) + 1, 7)
         colors = _get_colors(color_df.loc["min"].values, color_df.loc["max"].values, color_variations)
         result_bundesland[bundesland] = colors.pop(len(colors) // 2)
@@ -360,6 +841,7 @@ def fill_ax_complete(
     ax.set_ylabel(label)
 
 
+@profiled()
 def show_graph(
     df1: pd.DataFrame,
     df2: Optional[pd.DataFrame] = None,
@@ -367,12 +849,23 @@ def show_graph(
     output_file: Optional[str] = None,
     fixed_values: bool = False,
 ):
+    import matplotlib.pyplot as plt  # imported when needed, importing it takes a while
+
+    fig = plt.figure()
+    draw_graph(fig, df1, df2, title, fixed_values)
+    save_or_show(output_file, fig)
+
+
+def draw_graph(
+    fig, df1: pd.DataFrame, df2: Optional[pd.DataFrame] = None, title: Optional[str] = None, fixed_values: bool = False
+) -> None:
+    """Draws the graph of show_graph into fig, which must be empty"""
     label1 = "Inzidenz fix" if fixed_values else "Inzidenz akt"
     if df2 is None:
-        fig, ax1 = plt.subplots(1, 1)
+        ax1 = fig.subplots(1, 1)
         fill_ax_complete(ax1, df1, label1, get_lines_inz)
     else:
-        fig, (ax1, ax2) = plt.subplots(2, 1)
+        ax1, ax2 = fig.subplots(2, 1)
         colors_ax1, colors_ax2 = get_colors(df1, df2)
         label2 = "Hospitalierung fix" if fixed_values else "Hospitalierung akt"
 
@@ -382,8 +875,6 @@ def show_graph(
     if title:
         fig.suptitle(title)
 
-    save_or_show(output_file, fig)
-
 
 def prepare_and_show_graph(
     inzidenzen_result: pd.DataFrame, result_hosp: Optional[pd.DataFrame], output_file: Optional[str], fixed_values: bool
@@ -399,16 +890,88 @@ def prepare_and_show_graph(
     show_graph(inzidenzen_result, result_hosp, title, output_file, fixed_values)
 
 
-def _filter_by_min(df: pd.DataFrame, column: str, mininmum: int):
-    counts = df[column].value_counts()
-    return df[df[column].isin(counts[counts >= mininmum].index)]
+def show_heatmap(
+    df1: pd.DataFrame,
+    df2: Optional[pd.DataFrame] = None,
+    title: Optional[str] = None,
+    output_file: Optional[str] = None,
+    fixed_values: bool = False,
+):
+    """Shows every Landkreis as a row of a heatmap grouped by Bundesland, instead of a bar per Landkreis and day.
+    df2 is shown as a line per Bundesland below."""
+    import matplotlib.pyplot as plt  # imported when needed, importing it takes a while
+    from matplotlib.colors import to_rgba_array
+
+    df_lks = df1.drop(DEUTSCHLAND)
+    colors_lks, colors_bundesland = get_colors(df1, df2)
+    rows = 1 if df2 is None else 2
+    fig, axes = plt.subplots(
+        rows, 2, figsize=(16, 12), squeeze=False, gridspec_kw={"width_ratios": (1, 60), "wspace": 0.01}
+    )
+    ax_land, ax_heat = axes[0]
+
+    # bundesland of every row as color strip, labeled in the middle of the rows of the bundesland
+    lands = pd.Series([lk.land for lk in df_lks.index])
+    ax_land.imshow(to_rgba_array([colors_lks[lk] for lk in df_lks.index]).reshape(-1, 1, 4), aspect="auto")
+    group_bounds = lands.groupby(lands, sort=False).apply(lambda group: (group.index[0], group.index[-1]))
+    ax_land.set_yticks([(first + last) / 2 for first, last in group_bounds], group_bounds.index)
+    ax_land.set_xticks([])
+
+    max_val = dataframe_max(df_lks)
+    image = ax_heat.imshow(df_lks.to_numpy(), aspect="auto", cmap="YlOrRd", vmin=0, vmax=max_val, interpolation="none")
+    ax_heat.hlines([last + 0.5 for _, last in group_bounds[:-1]], -0.5, len(df_lks.columns) - 0.5, colors="black")
+    ax_heat.set_yticks([])
+    _set_date_ticks(ax_heat, df_lks.columns)
+    colorbar = fig.colorbar(image, ax=axes[:, 1].tolist(), fraction=0.02)
+    colorbar.set_label("Inzidenz fix" if fixed_values else "Inzidenz akt")
+
+    if df2 is not None:
+        axes[1][0].set_visible(False)
+        ax_hosp = axes[1][1]
+        positions = range(len(df2.columns))
+        for bundesland, values in df2.drop(DEUTSCHLAND).iterrows():
+            ax_hosp.plot(positions, values, color=colors_bundesland[bundesland], label=bundesland)
+        ax_hosp.plot(positions, df2.loc[DEUTSCHLAND], color="black", linewidth=2, label=DEUTSCHLAND)
+        ax_hosp.set_xlim(-0.5, len(df2.columns) - 0.5)
+        ax_hosp.set_ylim(bottom=0)
+        _set_date_ticks(ax_hosp, df2.columns)
+        ax_hosp.set_ylabel("Hospitalierung fix" if fixed_values else "Hospitalierung akt")
+        ax_hosp.legend(ncol=6, fontsize="small")
+
+    if title:
+        fig.suptitle(title)
+
+    save_or_show(output_file)
+
+
+def _set_date_ticks(ax, dates: Collection, max_ticks: int = 15):
+    positions = np.unique(np.linspace(0, len(dates) - 1, min(len(dates), max_ticks)).round().astype(int))
+    ax.set_xticks(positions, [date_formatter(dates[pos]) for pos in positions])
+
+
+def summarize_by_land(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns min, median and max of the last column of the Landkreise in df per Bundesland"""
+    df_lks = df.drop(DEUTSCHLAND)
+    last = df_lks.iloc[:, -1]
+    result = last.groupby([lk.land for lk in df_lks.index]).agg(["min", "median", "max"])
+    result.columns = ["Min", "Median", "Max"]
+    return result
+
+
+def prepare_and_show_heatmap(
+    inzidenzen_result: pd.DataFrame, result_hosp: Optional[pd.DataFrame], output_file: Optional[str], fixed_values: bool
+):
+    last_date = inzidenzen_result.columns[-1]
+    print(f"Landkreise pro Bundesland am {last_date.strftime('%d.%m.%Y')}")
+    print(df_to_string(summarize_by_land(inzidenzen_result)))
+    if result_hosp is not None:
+        print()
+        print(df_to_string(result_hosp.rename(columns=date_formatter).iloc[:, -8:]))
+    show_heatmap(inzidenzen_result, result_hosp, set_graph_title(last_date), output_file, fixed_values)
 
 
 def by_month(df: pd.DataFrame, **kwargs):
-    month_str = lambda date_obj: date_obj.strftime("%Y-%m")
-    df["Monat"] = df.index.to_series().apply(month_str)
-    df = _filter_by_min(df, "Monat", 7)
-    return df.boxplot(by="Monat", **kwargs)
+    return show_aggregates(aggregate(df, "month"), **kwargs)
 
 
 def format_to_week(date_obj: datetime):
@@ -426,26 +989,141 @@ def format_to_week(date_obj: datetime):
 
 
 def by_week(df: pd.DataFrame, **kwargs):
-    df["KW"] = df.index.to_series().apply(format_to_week)
-    df = _filter_by_min(df, "KW", 3)
-    return df.boxplot(by="KW", **kwargs)
+    return show_aggregates(aggregate(df, "week"), **kwargs)
+
 
+# name of the groups and minimal amount of days of a group by aggregation
+AGGREGATIONS = {"week": ("KW", 3), "month": ("Monat", 7)}
+AGGREGATE_COLUMNS = ["count", "mean", "min", "q1", "median", "q3", "max"]
 
-def show_boxplot(df: pd.DataFrame, method: str, output_file: Optional[str] = None):
+
+def _get_aggregation(method: str) -> str:
     if method.lower().startswith("m"):
-        axes_series_2dim = by_month(df, rot=45)
-    elif method.lower().startswith("w"):
-        axes_series_2dim = by_week(df, rot=45)
-    else:
-        raise ValueError("method does not start with 'w' or 'm'!")
-    for axes_series in axes_series_2dim:
-        if isinstance(axes_series, (pd.Series, np.ndarray)):
-            for ax in axes_series:
-                ax.set_ylim(bottom=0)
-        else:
-            axes_series.set_ylim(bottom=0)
+        return "month"
+    if method.lower().startswith("w"):
+        return "week"
+    raise ValueError("method does not start with 'w' or 'm'!")
 
-    save_or_show(output_file)
+
+def group_labels(dates: pd.DatetimeIndex, aggregation: str) -> pd.Index:
+    """Returns the group of every date without formatting every date on its own.
+
+    Args:
+        dates (pd.DatetimeIndex): Dates to group
+        aggregation (str): 'week' for the calendar week like format_to_week, 'month' for the month as "YYYY-MM"
+
+    Returns:
+        pd.Index: Labels of the groups, in the order of dates
+    """
+    if aggregation == "week":
+        iso = dates.isocalendar()
+        return pd.Index(iso["year"].astype(str) + "-" + iso["week"].astype(str).str.zfill(2))
+    return pd.Index(dates.to_period("M").astype(str))
+
+
+def aggregate(df: pd.DataFrame, method: str) -> pd.DataFrame:
+    """Aggregates the values of every column of df by week or month. Groups with less days than
+    required by AGGREGATIONS are dropped, e.g. the current week if it started yesterday.
+
+    Args:
+        df (pd.DataFrame): Values with the dates as index and the regions as columns
+        method (str): 'w' or 'week' to aggregate by calendar week, 'm' or 'month' to aggregate by month
+
+    Returns:
+        pd.DataFrame: AGGREGATE_COLUMNS indexed by region and group, the regions in the order of the columns of df
+    """
+    aggregation = _get_aggregation(method)
+    name, min_days = AGGREGATIONS[aggregation]
+    labels = group_labels(pd.DatetimeIndex(df.index), aggregation)
+    days = labels.value_counts()
+    keep = labels.isin(days.index[days >= min_days])
+    # grouped by the position of the regions, as Landkreise can not be sorted
+    values = df[keep].set_axis(labels[keep], axis=0).set_axis(range(len(df.columns)), axis=1).stack()
+    groups = values.groupby(level=[1, 0])
+    # the methods of the groupby are vectorized, unlike describe() which runs per group
+    stats = pd.DataFrame(
+        {
+            "count": groups.count(),
+            "mean": groups.mean(),
+            "min": groups.min(),
+            "q1": groups.quantile(0.25),
+            "median": groups.median(),
+            "q3": groups.quantile(0.75),
+            "max": groups.max(),
+        },
+        columns=AGGREGATE_COLUMNS,
+    )
+    positions, groups = stats.index.get_level_values(0), stats.index.get_level_values(1)
+    stats.index = pd.MultiIndex.from_arrays([df.columns[positions], groups], names=["region", name])
+    return stats
+
+
+def aggregates_to_json(stats: pd.DataFrame) -> str:
+    """Returns the result of aggregate() as json list with one object per region and group"""
+    _, group = stats.index.names
+    records = [
+        {"region": str(region), group: label, **values}
+        for (region, label), values in zip(stats.index, stats.to_dict("records"))
+    ]
+    return json.dumps(records, ensure_ascii=False)
+
+
+def show_aggregates(stats: pd.DataFrame, rot: int = 0):
+    """Draws a boxplot per region of the result of aggregate(), the whiskers show the min and max values.
+
+    Returns:
+        np.ndarray: Axes of the boxplots
+    """
+    import matplotlib.pyplot as plt
+
+    regions = stats.index.unique(level=0)
+    cols = max(math.ceil(math.sqrt(len(regions))), 1)
+    rows = max(math.ceil(len(regions) / cols), 1)
+    _, axes = plt.subplots(rows, cols, squeeze=False, figsize=(6 * cols, 4 * rows))
+    for ax, region in zip(axes.flat, regions):
+        region_stats = stats.loc[region]
+        boxes = [
+            {
+                "label": label,
+                "whislo": box["min"],
+                "q1": box["q1"],
+                "med": box["median"],
+                "q3": box["q3"],
+                "whishi": box["max"],
+                "mean": box["mean"],
+            }
+            for label, box in zip(region_stats.index, region_stats.to_dict("records"))
+        ]
+        ax.bxp(boxes, showfliers=False)
+        ax.set_title(str(region))
+        ax.set_xlabel(stats.index.names[1])
+        ax.tick_params(axis="x", labelrotation=rot)
+        ax.grid(True)
+    for ax in axes.flat[len(regions) :]:
+        ax.set_visible(False)
+    return axes
+
+
+def show_boxplot(
+    df: pd.DataFrame, method: str, output_file: Optional[str] = None, stats_format: Optional[str] = None
+) -> None:
+    """Shows the values of df by week or month as boxplot.
+
+    Args:
+        df (pd.DataFrame): Values with the dates as index and the regions as columns
+        method (str): 'w' or 'week' to aggregate by calendar week, 'm' or 'month' to aggregate by month
+        output_file (str, optional): Saves the boxplot with this name instead of showing it. Defaults to None.
+        stats_format (str, optional): 'text' or 'json' prints the statistics instead of the boxplot. Defaults to None.
+    """
+    stats = aggregate(df, method)
+    if stats_format == "text":
+        print(df_to_string(stats))
+    elif stats_format == "json":
+        print(aggregates_to_json(stats))
+    else:
+        for ax in show_aggregates(stats, rot=45).flat:
+            ax.set_ylim(bottom=0)
+        save_or_show(output_file)
 
 
 LANDKREISE = (
@@ -0,0 +1,130 @@
+"""Decoders of the json answers of the ArcGIS FeatureServer.
+
+'msgspec' decodes the answers with a typed schema straight into the results, without building a dict per feature.
+'orjson' builds the dicts faster than the json module of the standard library, 'json' needs no extra package.
+'auto' uses the fastest one installed, install them with 'pip install corona[msgspec]' or 'pip install corona[orjson]'.
+"""
+import json
+from collections.abc import Callable, Iterable
+from typing import Optional, TypeVar
+
+JSON_DECODERS = ("auto", "msgspec", "orjson", "json")
+T = TypeVar("T")
+
+
+def decode_features(features: Iterable[dict], factory: Callable[..., T]) -> list[T]:
+    """Calls factory with GEN, county, cases7_per_100k, last_update and OBJECTID of every decoded feature"""
+    results = []
+    for feature in features:
+        attributes = feature["attributes"]
+        results.append(
+            factory(
+                attributes["GEN"],
+                attributes["county"],
+                attributes["cases7_per_100k"],
+                attributes["last_update"],
+                attributes["OBJECTID"],
+            )
+        )
+    return results
+
+
+class JsonDecoder:
+    """Decodes with the json module of the standard library"""
+
+    name = "json"
+
+    def loads(self, data: bytes) -> dict:
+        return json.loads(data)
+
+    def decode_cases(self, data: bytes, factory: Callable[..., T]) -> tuple[list[T], bool]:
+        """Decodes an answer with features of Landkreise.
+
+        Args:
+            data (bytes): Body of the answer
+            factory (Callable[..., T]): Called with GEN, county, cases7_per_100k, last_update and OBJECTID of every
+                                        feature, e.g. CasesResult
+
+        Returns:
+            tuple[list[T], bool]: Result of factory per feature and whether exceededTransferLimit is set
+        """
+        response_json = self.loads(data)
+        results = decode_features(response_json["features"], factory)
+        return results, bool(response_json.get("exceededTransferLimit", False))
+
+
+class OrjsonDecoder(JsonDecoder):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, data: bytes) -> dict:
+        return self._loads(data)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """Decodes the answers with features with a typed schema, only the needed attributes are decoded"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        class Attributes(msgspec.Struct):
+            OBJECTID: int
+            GEN: str
+            county: str
+            cases7_per_100k: Optional[float]
+            last_update: str
+
+        class Feature(msgspec.Struct):
+            attributes: Attributes
+
+        class Answer(msgspec.Struct):
+            features: list[Feature]
+            exceededTransferLimit: bool = False
+
+        self._loads = msgspec.json.decode
+        self._answer_decoder = msgspec.json.Decoder(Answer)
+
+    def loads(self, data: bytes) -> dict:
+        return self._loads(data)
+
+    def decode_cases(self, data: bytes, factory: Callable[..., T]) -> tuple[list[T], bool]:
+        answer = self._answer_decoder.decode(data)
+        results = []
+        for feature in answer.features:
+            attributes = feature.attributes
+            results.append(
+                factory(
+                    attributes.GEN,
+                    attributes.county,
+                    attributes.cases7_per_100k,
+                    attributes.last_update,
+                    attributes.OBJECTID,
+                )
+            )
+        return results, answer.exceededTransferLimit
+
+
+_DECODERS = {"msgspec": MsgspecDecoder, "orjson": OrjsonDecoder, "json": JsonDecoder}
+
+
+def create_decoder(name: str = "auto") -> JsonDecoder:
+    """Returns the decoder name, one of JSON_DECODERS. 'auto' falls back to the next one if a package is missing.
+    Raises RuntimeError if the package of an explicitly requested decoder is not installed."""
+    if name == "auto":
+        for decoder in _DECODERS.values():
+            try:
+                return decoder()
+            except ImportError:
+                continue
+    if name not in _DECODERS:
+        raise ValueError(f"Unknown json decoder '{name}', must be one of {JSON_DECODERS}")
+    try:
+        return _DECODERS[name]()
+    except ImportError:
+        raise RuntimeError(f"The json decoder '{name}' requires {name}: pip install corona[{name}]") from None
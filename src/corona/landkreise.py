@@ -1,6 +1,6 @@
 import logging
 from enum import Enum
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional, Union
 
 LOG = logging.getLogger(__name__)
 
@@ -25,418 +25,418 @@ THURINGEN = "Thüringen"
 
 
 class Landkreise(Enum):
-    AHRWEILER = (144, "LK Ahrweiler")
-    AICHACH_FRIEDBERG = (309, "LK Aichach-Friedberg")
-    ALB_DONAU_KREIS = (218, "LK Alb-Donau-Kreis")
-    ALTENBURGER_LAND = (401, "LK Altenburger Land")
-    ALTENKIRCHEN_WESTERWALD = (145, "LK Altenkirchen")
-    ALTMARKKREIS_SALZWEDEL = (368, "LK Altmarkkreis Salzwedel")
-    ALTOETTING = (226, "LK Altötting")
-    ALZEY_WORMS = (169, "LK Alzey-Worms")
-    AMBERG = (258, "SK Amberg")
-    AMBERG_SULZBACH = (261, "LK Amberg-Sulzbach")
-    AMMERLAND = (50, "LK Ammerland")
-    ANHALT_BITTERFELD = (369, "LK Anhalt-Bitterfeld")
-    ANSBACH_SK = (281, "SK Ansbach")
-    ANSBACH_LK = (286, "LK Ansbach")
-    ASCHAFFENBURG_SK = (293, "SK Aschaffenburg")
-    ASCHAFFENBURG_LK = (296, "LK Aschaffenburg")
-    AUGSBURG_SK = (305, "SK Augsburg")
-    AUGSBURG_LK = (310, "LK Augsburg")
+    AHRWEILER = (144, "LK Ahrweiler", RP)
+    AICHACH_FRIEDBERG = (309, "LK Aichach-Friedberg", BAYERN)
+    ALB_DONAU_KREIS = (218, "LK Alb-Donau-Kreis", BW)
+    ALTENBURGER_LAND = (401, "LK Altenburger Land", THURINGEN)
+    ALTENKIRCHEN_WESTERWALD = (145, "LK Altenkirchen", RP)
+    ALTMARKKREIS_SALZWEDEL = (368, "LK Altmarkkreis Salzwedel", SA)
+    ALTOETTING = (226, "LK Altötting", BAYERN)
+    ALZEY_WORMS = (169, "LK Alzey-Worms", RP)
+    AMBERG = (258, "SK Amberg", BAYERN)
+    AMBERG_SULZBACH = (261, "LK Amberg-Sulzbach", BAYERN)
+    AMMERLAND = (50, "LK Ammerland", NIEDERSACHSEN)
+    ANHALT_BITTERFELD = (369, "LK Anhalt-Bitterfeld", SA)
+    ANSBACH_SK = (281, "SK Ansbach", BAYERN)
+    ANSBACH_LK = (286, "LK Ansbach", BAYERN)
+    ASCHAFFENBURG_SK = (293, "SK Aschaffenburg", BAYERN)
+    ASCHAFFENBURG_LK = (296, "LK Aschaffenburg", BAYERN)
+    AUGSBURG_SK = (305, "SK Augsburg", BAYERN)
+    AUGSBURG_LK = (310, "LK Augsburg", BAYERN)
     AURICH = (51, "LK Aurich", NIEDERSACHSEN)
-    BAD_DUERKHEIM = (170, "LK Bad Dürkheim")
-    BAD_KISSINGEN = (297, "LK Bad Kissingen")
-    BAD_KREUZNACH = (146, "LK Bad Kreuznach")
-    BAD_TOELZ_WOLFRATSHAUSEN = (228, "LK Bad Tölz-Wolfratshausen")
-    BADEN_BADEN = (192, "SK Baden-Baden")
-    BAMBERG_SK = (268, "SK Bamberg")
-    BAMBERG_LK = (272, "LK Bamberg")
-    BARNIM = (330, "LK Barnim")
-    BAUTZEN = (358, "LK Bautzen")
-    BAYREUTH_SK = (269, "SK Bayreuth")
-    BAYREUTH_LK = (273, "LK Bayreuth")
-    BERCHTESGADENER_LAND = (227, "LK Berchtesgadener Land")
-    BERGSTRASSE = (121, "LK Bergstraße")
-    BERLIN_CHARLOTTENBURG_WILMERSDORF = (405, "SK Berlin Charlottenburg-Wilmersdorf")
-    BERLIN_FRIEDRICHSHAIN_KREUZBERG = (414, "SK Berlin Friedrichshain-Kreuzberg")
-    BERLIN_LICHTENBERG = (409, "SK Berlin Lichtenberg")
-    BERLIN_MARZAHN_HELLERSDORF = (410, "SK Berlin Marzahn-Hellersdorf")
+    BAD_DUERKHEIM = (170, "LK Bad Dürkheim", RP)
+    BAD_KISSINGEN = (297, "LK Bad Kissingen", BAYERN)
+    BAD_KREUZNACH = (146, "LK Bad Kreuznach", RP)
+    BAD_TOELZ_WOLFRATSHAUSEN = (228, "LK Bad Tölz-Wolfratshausen", BAYERN)
+    BADEN_BADEN = (192, "SK Baden-Baden", BW)
+    BAMBERG_SK = (268, "SK Bamberg", BAYERN)
+    BAMBERG_LK = (272, "LK Bamberg", BAYERN)
+    BARNIM = (330, "LK Barnim", BRANDENBURG)
+    BAUTZEN = (358, "LK Bautzen", SACHSEN)
+    BAYREUTH_SK = (269, "SK Bayreuth", BAYERN)
+    BAYREUTH_LK = (273, "LK Bayreuth", BAYERN)
+    BERCHTESGADENER_LAND = (227, "LK Berchtesgadener Land", BAYERN)
+    BERGSTRASSE = (121, "LK Bergstraße", HESSEN)
+    BERLIN_CHARLOTTENBURG_WILMERSDORF = (405, "SK Berlin Charlottenburg-Wilmersdorf", BERLIN)
+    BERLIN_FRIEDRICHSHAIN_KREUZBERG = (414, "SK Berlin Friedrichshain-Kreuzberg", BERLIN)
+    BERLIN_LICHTENBERG = (409, "SK Berlin Lichtenberg", BERLIN)
+    BERLIN_MARZAHN_HELLERSDORF = (410, "SK Berlin Marzahn-Hellersdorf", BERLIN)
     BERLIN_MITTE = (413, "SK Berlin Mitte", BERLIN)
-    BERLIN_NEUKOELLN = (408, "SK Berlin Neukölln")
-    BERLIN_PANKOW = (407, "SK Berlin Pankow")
-    BERLIN_REINICKENDORF = (404, "SK Berlin Reinickendorf")
-    BERLIN_SPANDAU = (411, "SK Berlin Spandau")
-    BERLIN_STEGLITZ_ZEHLENDORF = (412, "SK Berlin Steglitz-Zehlendorf")
-    BERLIN_TEMPELHOF_SCHOENEBERG = (415, "SK Berlin Tempelhof-Schöneberg")
-    BERLIN_TREPTOW_KOEPENICK = (406, "SK Berlin Treptow-Köpenick")
-    BERNKASTEL_WITTLICH = (155, "LK Bernkastel-Wittlich")
-    BIBERACH = (219, "LK Biberach")
-    BIELEFELD = (98, "SK Bielefeld")
-    BIRKENFELD = (147, "LK Birkenfeld")
+    BERLIN_NEUKOELLN = (408, "SK Berlin Neukölln", BERLIN)
+    BERLIN_PANKOW = (407, "SK Berlin Pankow", BERLIN)
+    BERLIN_REINICKENDORF = (404, "SK Berlin Reinickendorf", BERLIN)
+    BERLIN_SPANDAU = (411, "SK Berlin Spandau", BERLIN)
+    BERLIN_STEGLITZ_ZEHLENDORF = (412, "SK Berlin Steglitz-Zehlendorf", BERLIN)
+    BERLIN_TEMPELHOF_SCHOENEBERG = (415, "SK Berlin Tempelhof-Schöneberg", BERLIN)
+    BERLIN_TREPTOW_KOEPENICK = (406, "SK Berlin Treptow-Köpenick", BERLIN)
+    BERNKASTEL_WITTLICH = (155, "LK Bernkastel-Wittlich", RP)
+    BIBERACH = (219, "LK Biberach", BW)
+    BIELEFELD = (98, "SK Bielefeld", NRW)
+    BIRKENFELD = (147, "LK Birkenfeld", RP)
     BOCHUM = (105, "SK Bochum", NRW)
-    BODENSEEKREIS = (220, "LK Bodenseekreis")
+    BODENSEEKREIS = (220, "LK Bodenseekreis", BW)
     BONN = (79, "SK Bonn", NRW)
-    BORKEN = (93, "LK Borken")
-    BOTTROP = (90, "SK Bottrop")
-    BRANDENBURG_HAVEL = (326, "SK Brandenburg a.d.Havel")
+    BORKEN = (93, "LK Borken", NRW)
+    BOTTROP = (90, "SK Bottrop", NRW)
+    BRANDENBURG_HAVEL = (326, "SK Brandenburg a.d.Havel", BRANDENBURG)
     BRAUNSCHWEIG = (17, "SK Braunschweig", NIEDERSACHSEN)
-    BREISGAU_HOCHSCHWARZWALD = (205, "LK Breisgau-Hochschwarzwald")
+    BREISGAU_HOCHSCHWARZWALD = (205, "LK Breisgau-Hochschwarzwald", BW)
     BREMEN = (62, "SK Bremen", BREMEN)
-    BREMERHAVEN = (63, "SK Bremerhaven", BREMEN)
-    BURGENLANDKREIS = (371, "LK Burgenlandkreis")
-    BOEBLINGEN = (180, "LK Böblingen")
-    BOERDE = (370, "LK Börde")
-    CALW = (201, "LK Calw")
+    BREMERHAVEN = (63, "SK Bremerhaven", "Bremen")  # BREMEN is the member above here, not the land
+    BURGENLANDKREIS = (371, "LK Burgenlandkreis", SA)
+    BOEBLINGEN = (180, "LK Böblingen", BW)
+    BOERDE = (370, "LK Börde", SA)
+    CALW = (201, "LK Calw", BW)
     CELLE = (34, "LK Celle", NIEDERSACHSEN)
-    CHAM = (262, "LK Cham")
-    CHEMNITZ = (352, "SK Chemnitz")
-    CLOPPENBURG = (52, "LK Cloppenburg")
-    COBURG_SK = (270, "SK Coburg")
-    COBURG_LK = (274, "LK Coburg")
-    COCHEM_ZELL = (148, "LK Cochem-Zell")
-    COESFELD = (94, "LK Coesfeld")
-    COTTBUS = (327, "SK Cottbus")
-    CUXHAVEN = (35, "LK Cuxhaven")
-    DACHAU = (229, "LK Dachau")
-    DAHME_SPREEWALD = (331, "LK Dahme-Spreewald")
-    DARMSTADT = (117, "SK Darmstadt")
-    DARMSTADT_DIEBURG = (122, "LK Darmstadt-Dieburg")
-    DEGGENDORF = (249, "LK Deggendorf")
-    DELMENHORST = (45, "SK Delmenhorst")
-    DESSAU_ROSSLAU = (365, "SK Dessau-Roßlau")
-    DIEPHOLZ = (28, "LK Diepholz")
-    DILLINGEN_DONAU = (311, "LK Dillingen a.d.Donau")
-    DINGOLFING_LANDAU = (257, "LK Dingolfing-Landau")
-    DITHMARSCHEN = (5, "LK Dithmarschen")
-    DONAU_RIES = (317, "LK Donau-Ries")
-    DONNERSBERGKREIS = (171, "LK Donnersbergkreis")
+    CHAM = (262, "LK Cham", BAYERN)
+    CHEMNITZ = (352, "SK Chemnitz", SACHSEN)
+    CLOPPENBURG = (52, "LK Cloppenburg", NIEDERSACHSEN)
+    COBURG_SK = (270, "SK Coburg", BAYERN)
+    COBURG_LK = (274, "LK Coburg", BAYERN)
+    COCHEM_ZELL = (148, "LK Cochem-Zell", RP)
+    COESFELD = (94, "LK Coesfeld", NRW)
+    COTTBUS = (327, "SK Cottbus", BRANDENBURG)
+    CUXHAVEN = (35, "LK Cuxhaven", NIEDERSACHSEN)
+    DACHAU = (229, "LK Dachau", BAYERN)
+    DAHME_SPREEWALD = (331, "LK Dahme-Spreewald", BRANDENBURG)
+    DARMSTADT = (117, "SK Darmstadt", HESSEN)
+    DARMSTADT_DIEBURG = (122, "LK Darmstadt-Dieburg", HESSEN)
+    DEGGENDORF = (249, "LK Deggendorf", BAYERN)
+    DELMENHORST = (45, "SK Delmenhorst", NIEDERSACHSEN)
+    DESSAU_ROSSLAU = (365, "SK Dessau-Roßlau", SA)
+    DIEPHOLZ = (28, "LK Diepholz", NIEDERSACHSEN)
+    DILLINGEN_DONAU = (311, "LK Dillingen a.d.Donau", BAYERN)
+    DINGOLFING_LANDAU = (257, "LK Dingolfing-Landau", BAYERN)
+    DITHMARSCHEN = (5, "LK Dithmarschen", SH)
+    DONAU_RIES = (317, "LK Donau-Ries", BAYERN)
+    DONNERSBERGKREIS = (171, "LK Donnersbergkreis", RP)
     DORTMUND = (106, "SK Dortmund", NRW)
     DRESDEN = (357, "SK Dresden", SACHSEN)
-    DUISBURG = (65, "SK Duisburg")
-    DUEREN = (83, "LK Düren")
-    DUESSELDORF = (64, "SK Düsseldorf")
-    EBERSBERG = (230, "LK Ebersberg")
-    EICHSFELD = (385, "LK Eichsfeld")
-    EICHSTAETT = (231, "LK Eichstätt")
-    EIFELKREIS_BITBURG_PRUEM = (156, "LK Bitburg-Prüm")
+    DUISBURG = (65, "SK Duisburg", NRW)
+    DUEREN = (83, "LK Düren", NRW)
+    DUESSELDORF = (64, "SK Düsseldorf", NRW)
+    EBERSBERG = (230, "LK Ebersberg", BAYERN)
+    EICHSFELD = (385, "LK Eichsfeld", THURINGEN)
+    EICHSTAETT = (231, "LK Eichstätt", BAYERN)
+    EIFELKREIS_BITBURG_PRUEM = (156, "LK Bitburg-Prüm", RP)
     # EISENACH = (384, "SK Eisenach")  # does no longer work
-    ELBE_ELSTER = (332, "LK Elbe-Elster")
-    EMDEN = (46, "SK Emden")
-    EMMENDINGEN = (206, "LK Emmendingen")
-    EMSLAND = (53, "LK Emsland")
-    ENNEPE_RUHR_KREIS = (110, "LK Ennepe-Ruhr-Kreis")
-    ENZKREIS = (202, "LK Enzkreis")
-    ERDING = (232, "LK Erding")
-    ERFURT = (379, "SK Erfurt")
-    ERLANGEN = (282, "SK Erlangen")
-    ERLANGEN_HOECHSTADT = (287, "LK Erlangen-Höchstadt")
-    ERZGEBIRGSKREIS = (353, "LK Erzgebirgskreis")
-    ESSEN = (66, "SK Essen")
-    ESSLINGEN = (181, "LK Esslingen")
-    EUSKIRCHEN = (85, "LK Euskirchen")
+    ELBE_ELSTER = (332, "LK Elbe-Elster", BRANDENBURG)
+    EMDEN = (46, "SK Emden", NIEDERSACHSEN)
+    EMMENDINGEN = (206, "LK Emmendingen", BW)
+    EMSLAND = (53, "LK Emsland", NIEDERSACHSEN)
+    ENNEPE_RUHR_KREIS = (110, "LK Ennepe-Ruhr-Kreis", NRW)
+    ENZKREIS = (202, "LK Enzkreis", BW)
+    ERDING = (232, "LK Erding", BAYERN)
+    ERFURT = (379, "SK Erfurt", THURINGEN)
+    ERLANGEN = (282, "SK Erlangen", BAYERN)
+    ERLANGEN_HOECHSTADT = (287, "LK Erlangen-Höchstadt", BAYERN)
+    ERZGEBIRGSKREIS = (353, "LK Erzgebirgskreis", SACHSEN)
+    ESSEN = (66, "SK Essen", NRW)
+    ESSLINGEN = (181, "LK Esslingen", BW)
+    EUSKIRCHEN = (85, "LK Euskirchen", NRW)
     FLENSBURG = (1, "SK Flensburg", SH)
-    FORCHHEIM = (275, "LK Forchheim")
-    FRANKENTHAL = (159, "SK Frankenthal")
-    FRANKFURT_ODER = (328, "SK Frankfurt (Oder)")
-    FRANKFURT_AM_MAIN = (118, "SK Frankfurt am Main")
-    FREIBURG_BREISGAU = (204, "SK Freiburg i.Breisgau")
-    FREISING = (233, "LK Freising")
-    FREUDENSTADT = (203, "LK Freudenstadt")
-    FREYUNG_GRAFENAU = (250, "LK Freyung-Grafenau")
-    FRIESLAND = (54, "LK Friesland")
-    FULDA = (137, "LK Fulda")
-    FUERSTENFELDBRUCK = (234, "LK Fürstenfeldbruck")
-    FUERTH_SK = (283, "SK Fürth")
-    FUERTH_LK = (288, "LK Fürth")
-    GARMISCH_PARTENKIRCHEN = (235, "LK Garmisch-Partenkirchen")
-    GELSENKIRCHEN = (91, "SK Gelsenkirchen")
-    GERA = (380, "SK Gera")
-    GERMERSHEIM = (172, "LK Germersheim")
-    GIESSEN = (131, "LK Gießen")
-    GIFHORN = (20, "LK Gifhorn")
-    GOSLAR = (21, "LK Goslar")
-    GOTHA = (391, "LK Gotha")
-    GRAFSCHAFT_BENTHEIM = (55, "LK Grafschaft Bentheim")
-    GREIZ = (400, "LK Greiz")
-    GROSS_GERAU = (123, "LK Groß-Gerau")
-    GOEPPINGEN = (182, "LK Göppingen")
-    GOERLITZ = (359, "LK Görlitz")
-    GOETTINGEN = (26, "LK Göttingen")
-    GUENZBURG = (312, "LK Günzburg")
-    GUETERSLOH = (99, "LK Gütersloh")
-    HAGEN = (107, "SK Hagen")
-    HALLE = (366, "SK Halle")
+    FORCHHEIM = (275, "LK Forchheim", BAYERN)
+    FRANKENTHAL = (159, "SK Frankenthal", RP)
+    FRANKFURT_ODER = (328, "SK Frankfurt (Oder)", BRANDENBURG)
+    FRANKFURT_AM_MAIN = (118, "SK Frankfurt am Main", HESSEN)
+    FREIBURG_BREISGAU = (204, "SK Freiburg i.Breisgau", BW)
+    FREISING = (233, "LK Freising", BAYERN)
+    FREUDENSTADT = (203, "LK Freudenstadt", BW)
+    FREYUNG_GRAFENAU = (250, "LK Freyung-Grafenau", BAYERN)
+    FRIESLAND = (54, "LK Friesland", NIEDERSACHSEN)
+    FULDA = (137, "LK Fulda", HESSEN)
+    FUERSTENFELDBRUCK = (234, "LK Fürstenfeldbruck", BAYERN)
+    FUERTH_SK = (283, "SK Fürth", BAYERN)
+    FUERTH_LK = (288, "LK Fürth", BAYERN)
+    GARMISCH_PARTENKIRCHEN = (235, "LK Garmisch-Partenkirchen", BAYERN)
+    GELSENKIRCHEN = (91, "SK Gelsenkirchen", NRW)
+    GERA = (380, "SK Gera", THURINGEN)
+    GERMERSHEIM = (172, "LK Germersheim", RP)
+    GIESSEN = (131, "LK Gießen", HESSEN)
+    GIFHORN = (20, "LK Gifhorn", NIEDERSACHSEN)
+    GOSLAR = (21, "LK Goslar", NIEDERSACHSEN)
+    GOTHA = (391, "LK Gotha", THURINGEN)
+    GRAFSCHAFT_BENTHEIM = (55, "LK Grafschaft Bentheim", NIEDERSACHSEN)
+    GREIZ = (400, "LK Greiz", THURINGEN)
+    GROSS_GERAU = (123, "LK Groß-Gerau", HESSEN)
+    GOEPPINGEN = (182, "LK Göppingen", BW)
+    GOERLITZ = (359, "LK Görlitz", SACHSEN)
+    GOETTINGEN = (26, "LK Göttingen", NIEDERSACHSEN)
+    GUENZBURG = (312, "LK Günzburg", BAYERN)
+    GUETERSLOH = (99, "LK Gütersloh", NRW)
+    HAGEN = (107, "SK Hagen", NRW)
+    HALLE = (366, "SK Halle", SA)
     HAMBURG = (16, "SK Hamburg", HAMBURG)
-    HAMELN_PYRMONT = (29, "LK Hameln-Pyrmont")
-    HAMM = (108, "SK Hamm")
+    HAMELN_PYRMONT = (29, "LK Hameln-Pyrmont", NIEDERSACHSEN)
+    HAMM = (108, "SK Hamm", NRW)
     HANNOVER = (27, "Region Hannover", NIEDERSACHSEN, "Hannover")
-    HARBURG = (36, "LK Harburg")
-    HARZ = (372, "LK Harz")
-    HAVELLAND = (333, "LK Havelland")
-    HASSBERGE = (299, "LK Haßberge")
-    HEIDEKREIS = (41, "LK Heidekreis")
-    HEIDELBERG = (196, "SK Heidelberg")
-    HEIDENHEIM = (190, "LK Heidenheim")
-    HEILBRONN_SK = (185, "SK Heilbronn")
-    HEILBRONN_LK = (186, "LK Heilbronn")
-    HEINSBERG = (86, "LK Heinsberg")
-    HELMSTEDT = (22, "LK Helmstedt")
-    HERFORD = (100, "LK Herford")
-    HERNE = (109, "SK Herne")
-    HERSFELD_ROTENBURG = (138, "LK Hersfeld-Rotenburg")
-    HERZOGTUM_LAUENBURG = (6, "LK Herzogtum Lauenburg")
-    HILDBURGHAUSEN = (393, "LK Hildburghausen")
-    HILDESHEIM = (30, "LK Hildesheim")
-    HOCHSAUERLANDKREIS = (111, "LK Hochsauerlandkreis")
-    HOCHTAUNUSKREIS = (124, "LK Hochtaunuskreis")
-    HOF_SK = (271, "SK Hof")
-    HOF_LK = (276, "LK Hof")
-    HOHENLOHEKREIS = (187, "LK Hohenlohekreis")
-    HOLZMINDEN = (31, "LK Holzminden")
-    HOEXTER = (101, "LK Höxter")
-    ILM_KREIS = (394, "LK Ilm-Kreis")
-    INGOLSTADT = (223, "SK Ingolstadt")
-    JENA = (381, "SK Jena")
-    JERICHOWER_LAND = (373, "LK Jerichower Land")
-    KAISERSLAUTERN_SK = (160, "SK Kaiserslautern")
-    KAISERSLAUTERN_LK = (173, "LK Kaiserslautern")
-    KARLSRUHE_SK = (193, "SK Karlsruhe")
-    KARLSRUHE_LK = (194, "LK Karlsruhe")
-    KASSEL_SK = (136, "SK Kassel")
-    KASSEL_LK = (139, "LK Kassel")
-    KAUFBEUREN = (306, "SK Kaufbeuren")
-    KELHEIM = (251, "LK Kelheim")
-    KEMPTEN = (307, "SK Kempten")
+    HARBURG = (36, "LK Harburg", NIEDERSACHSEN)
+    HARZ = (372, "LK Harz", SA)
+    HAVELLAND = (333, "LK Havelland", BRANDENBURG)
+    HASSBERGE = (299, "LK Haßberge", BAYERN)
+    HEIDEKREIS = (41, "LK Heidekreis", NIEDERSACHSEN)
+    HEIDELBERG = (196, "SK Heidelberg", BW)
+    HEIDENHEIM = (190, "LK Heidenheim", BW)
+    HEILBRONN_SK = (185, "SK Heilbronn", BW)
+    HEILBRONN_LK = (186, "LK Heilbronn", BW)
+    HEINSBERG = (86, "LK Heinsberg", NRW)
+    HELMSTEDT = (22, "LK Helmstedt", NIEDERSACHSEN)
+    HERFORD = (100, "LK Herford", NRW)
+    HERNE = (109, "SK Herne", NRW)
+    HERSFELD_ROTENBURG = (138, "LK Hersfeld-Rotenburg", HESSEN)
+    HERZOGTUM_LAUENBURG = (6, "LK Herzogtum Lauenburg", SH)
+    HILDBURGHAUSEN = (393, "LK Hildburghausen", THURINGEN)
+    HILDESHEIM = (30, "LK Hildesheim", NIEDERSACHSEN)
+    HOCHSAUERLANDKREIS = (111, "LK Hochsauerlandkreis", NRW)
+    HOCHTAUNUSKREIS = (124, "LK Hochtaunuskreis", HESSEN)
+    HOF_SK = (271, "SK Hof", BAYERN)
+    HOF_LK = (276, "LK Hof", BAYERN)
+    HOHENLOHEKREIS = (187, "LK Hohenlohekreis", BW)
+    HOLZMINDEN = (31, "LK Holzminden", NIEDERSACHSEN)
+    HOEXTER = (101, "LK Höxter", NRW)
+    ILM_KREIS = (394, "LK Ilm-Kreis", THURINGEN)
+    INGOLSTADT = (223, "SK Ingolstadt", BAYERN)
+    JENA = (381, "SK Jena", THURINGEN)
+    JERICHOWER_LAND = (373, "LK Jerichower Land", SA)
+    KAISERSLAUTERN_SK = (160, "SK Kaiserslautern", RP)
+    KAISERSLAUTERN_LK = (173, "LK Kaiserslautern", RP)
+    KARLSRUHE_SK = (193, "SK Karlsruhe", BW)
+    KARLSRUHE_LK = (194, "LK Karlsruhe", BW)
+    KASSEL_SK = (136, "SK Kassel", HESSEN)
+    KASSEL_LK = (139, "LK Kassel", HESSEN)
+    KAUFBEUREN = (306, "SK Kaufbeuren", BAYERN)
+    KELHEIM = (251, "LK Kelheim", BAYERN)
+    KEMPTEN = (307, "SK Kempten", BAYERN)
     KIEL = (2, "SK Kiel", SH)
-    KITZINGEN = (300, "LK Kitzingen")
-    KLEVE = (74, "LK Kleve")
-    KOBLENZ = (143, "SK Koblenz")
-    KONSTANZ = (211, "LK Konstanz")
-    KREFELD = (67, "SK Krefeld")
-    KRONACH = (277, "LK Kronach")
-    KULMBACH = (278, "LK Kulmbach")
-    KUSEL = (174, "LK Kusel")
-    KYFFHAEUSERKREIS = (389, "LK Kyffhäuserkreis")
+    KITZINGEN = (300, "LK Kitzingen", BAYERN)
+    KLEVE = (74, "LK Kleve", NRW)
+    KOBLENZ = (143, "SK Koblenz", RP)
+    KONSTANZ = (211, "LK Konstanz", BW)
+    KREFELD = (67, "SK Krefeld", NRW)
+    KRONACH = (277, "LK Kronach", BAYERN)
+    KULMBACH = (278, "LK Kulmbach", BAYERN)
+    KUSEL = (174, "LK Kusel", RP)
+    KYFFHAEUSERKREIS = (389, "LK Kyffhäuserkreis", THURINGEN)
     KOELN = (80, "SK Köln", NRW)
-    LAHN_DILL_KREIS = (132, "LK Lahn-Dill-Kreis")
-    LANDAU = (161, "SK Landau i.d.Pfalz")
-    LANDSBERG = (236, "LK Landsberg a.Lech")
-    LANDSHUT_SK = (246, "SK Landshut")
-    LANDSHUT_LK = (252, "LK Landshut")
-    LEER = (56, "LK Leer")
-    LEIPZIG_SK = (362, "SK Leipzig")
-    LEIPZIG_LK = (363, "LK Leipzig")
-    LEVERKUSEN = (81, "SK Leverkusen")
-    LICHTENFELS = (279, "LK Lichtenfels")
-    LIMBURG_WEILBURG = (133, "LK Limburg-Weilburg")
-    LINDAU = (314, "LK Lindau")
-    LIPPE = (102, "LK Lippe")
-    LUDWIGSBURG = (183, "LK Ludwigsburg")
-    LUDWIGSHAFEN = (162, "SK Ludwigshafen")
-    LUDWIGSLUST_PARCHIM = (351, "LK Ludwigslust-Parchim")
-    LOERRACH = (212, "LK Lörrach")
+    LAHN_DILL_KREIS = (132, "LK Lahn-Dill-Kreis", HESSEN)
+    LANDAU = (161, "SK Landau i.d.Pfalz", RP)
+    LANDSBERG = (236, "LK Landsberg a.Lech", BAYERN)
+    LANDSHUT_SK = (246, "SK Landshut", BAYERN)
+    LANDSHUT_LK = (252, "LK Landshut", BAYERN)
+    LEER = (56, "LK Leer", NIEDERSACHSEN)
+    LEIPZIG_SK = (362, "SK Leipzig", SACHSEN)
+    LEIPZIG_LK = (363, "LK Leipzig", SACHSEN)
+    LEVERKUSEN = (81, "SK Leverkusen", NRW)
+    LICHTENFELS = (279, "LK Lichtenfels", BAYERN)
+    LIMBURG_WEILBURG = (133, "LK Limburg-Weilburg", HESSEN)
+    LINDAU = (314, "LK Lindau", BAYERN)
+    LIPPE = (102, "LK Lippe", NRW)
+    LUDWIGSBURG = (183, "LK Ludwigsburg", BW)
+    LUDWIGSHAFEN = (162, "SK Ludwigshafen", RP)
+    LUDWIGSLUST_PARCHIM = (351, "LK Ludwigslust-Parchim", MV)
+    LOERRACH = (212, "LK Lörrach", BW)
     LUEBECK = (3, "SK Lübeck", SH)
-    LUECHOW_DANNENBERG = (37, "LK Lüchow-Dannenberg")
-    LUENEBURG = (38, "LK Lüneburg")
-    MAGDEBURG = (367, "SK Magdeburg")
-    MAIN_KINZIG_KREIS = (125, "LK Main-Kinzig-Kreis")
-    MAIN_SPESSART = (302, "LK Main-Spessart")
-    MAIN_TAUBER_KREIS = (189, "LK Main-Tauber-Kreis")
-    MAIN_TAUNUS_KREIS = (126, "LK Main-Taunus-Kreis")
-    MAINZ = (163, "SK Mainz")
-    MAINZ_BINGEN = (177, "LK Mainz-Bingen")
-    MANNHEIM = (197, "SK Mannheim")
-    MANSFELD_SUEDHARZ = (374, "LK Mansfeld-Südharz")
-    MARBURG_BIEDENKOPF = (134, "LK Marburg-Biedenkopf")
-    MAYEN_KOBLENZ = (149, "LK Mayen-Koblenz")
-    MECKLENBURGISCHE_SEENPLATTE = (346, "LK Mecklenburgische Seenplatte")
-    MEISSEN = (360, "LK Meißen")
-    MEMMINGEN = (308, "SK Memmingen")
-    MERZIG_WADERN = (320, "LK Merzig-Wadern")
-    METTMANN = (75, "LK Mettmann")
-    MIESBACH = (237, "LK Miesbach")
-    MILTENBERG = (301, "LK Miltenberg")
-    MINDEN_LUEBBECKE = (103, "LK Minden-Lübbecke")
-    MITTELSACHSEN = (354, "LK Mittelsachsen")
-    MAERKISCH_ODERLAND = (334, "LK Märkisch-Oderland")
-    MAERKISCHER_KREIS = (112, "LK Märkischer Kreis")
-    MOENCHENGLADBACH = (68, "SK Mönchengladbach")
-    MUEHLDORF_INN = (238, "LK Mühldorf a.Inn")
-    MUELHEIM_AN_DER_RUHR = (69, "SK Mülheim a.d.Ruhr")
+    LUECHOW_DANNENBERG = (37, "LK Lüchow-Dannenberg", NIEDERSACHSEN)
+    LUENEBURG = (38, "LK Lüneburg", NIEDERSACHSEN)
+    MAGDEBURG = (367, "SK Magdeburg", SA)
+    MAIN_KINZIG_KREIS = (125, "LK Main-Kinzig-Kreis", HESSEN)
+    MAIN_SPESSART = (302, "LK Main-Spessart", BAYERN)
+    MAIN_TAUBER_KREIS = (189, "LK Main-Tauber-Kreis", BW)
+    MAIN_TAUNUS_KREIS = (126, "LK Main-Taunus-Kreis", HESSEN)
+    MAINZ = (163, "SK Mainz", RP)
+    MAINZ_BINGEN = (177, "LK Mainz-Bingen", RP)
+    MANNHEIM = (197, "SK Mannheim", BW)
+    MANSFELD_SUEDHARZ = (374, "LK Mansfeld-Südharz", SA)
+    MARBURG_BIEDENKOPF = (134, "LK Marburg-Biedenkopf", HESSEN)
+    MAYEN_KOBLENZ = (149, "LK Mayen-Koblenz", RP)
+    MECKLENBURGISCHE_SEENPLATTE = (346, "LK Mecklenburgische Seenplatte", MV)
+    MEISSEN = (360, "LK Meißen", SACHSEN)
+    MEMMINGEN = (308, "SK Memmingen", BAYERN)
+    MERZIG_WADERN = (320, "LK Merzig-Wadern", SAARLAND)
+    METTMANN = (75, "LK Mettmann", NRW)
+    MIESBACH = (237, "LK Miesbach", BAYERN)
+    MILTENBERG = (301, "LK Miltenberg", BAYERN)
+    MINDEN_LUEBBECKE = (103, "LK Minden-Lübbecke", NRW)
+    MITTELSACHSEN = (354, "LK Mittelsachsen", SACHSEN)
+    MAERKISCH_ODERLAND = (334, "LK Märkisch-Oderland", BRANDENBURG)
+    MAERKISCHER_KREIS = (112, "LK Märkischer Kreis", NRW)
+    MOENCHENGLADBACH = (68, "SK Mönchengladbach", NRW)
+    MUEHLDORF_INN = (238, "LK Mühldorf a.Inn", BAYERN)
+    MUELHEIM_AN_DER_RUHR = (69, "SK Mülheim a.d.Ruhr", NRW)
     MUENCHEN_SK = (224, "SK München", BAYERN)
     MUENCHEN_LK = (239, "LK München", BAYERN)
-    MUENSTER = (92, "SK Münster")
-    NECKAR_ODENWALD_KREIS = (198, "LK Neckar-Odenwald-Kreis")
-    NEU_ULM = (313, "LK Neu-Ulm")
-    NEUBURG_SCHROBENHAUSEN = (240, "LK Neuburg-Schrobenhausen")
-    NEUMARKT_OPF = (263, "LK Neumarkt i.d.OPf.")
-    NEUMUENSTER = (4, "SK Neumünster")
-    NEUNKIRCHEN = (321, "LK Neunkirchen")
-    NEUSTADT_AISCH_BAD_WINDSHEIM = (290, "LK Neustadt a.d.Aisch-Bad Windsheim")
-    NEUSTADT_WALDNAAB = (264, "LK Neustadt a.d.Waldnaab")
-    NEUSTADT_WEINSTRASSE = (164, "SK Neustadt a.d.Weinstraße")
-    NEUWIED = (150, "LK Neuwied")
-    NIENBURG_WESER = (32, "LK Nienburg (Weser)")
+    MUENSTER = (92, "SK Münster", NRW)
+    NECKAR_ODENWALD_KREIS = (198, "LK Neckar-Odenwald-Kreis", BW)
+    NEU_ULM = (313, "LK Neu-Ulm", BAYERN)
+    NEUBURG_SCHROBENHAUSEN = (240, "LK Neuburg-Schrobenhausen", BAYERN)
+    NEUMARKT_OPF = (263, "LK Neumarkt i.d.OPf.", BAYERN)
+    NEUMUENSTER = (4, "SK Neumünster", SH)
+    NEUNKIRCHEN = (321, "LK Neunkirchen", SAARLAND)
+    NEUSTADT_AISCH_BAD_WINDSHEIM = (290, "LK Neustadt a.d.Aisch-Bad Windsheim", BAYERN)
+    NEUSTADT_WALDNAAB = (264, "LK Neustadt a.d.Waldnaab", BAYERN)
+    NEUSTADT_WEINSTRASSE = (164, "SK Neustadt a.d.Weinstraße", RP)
+    NEUWIED = (150, "LK Neuwied", RP)
+    NIENBURG_WESER = (32, "LK Nienburg (Weser)", NIEDERSACHSEN)
     NORDFRIESLAND = (7, "LK Nordfriesland", SH)
-    NORDHAUSEN = (386, "LK Nordhausen")
-    NORDSACHSEN = (364, "LK Nordsachsen")
-    NORDWESTMECKLENBURG = (349, "LK Nordwestmecklenburg")
-    NORTHEIM = (23, "LK Northeim")
-    NUERNBERG = (284, "SK Nürnberg")
-    NUERNBERGER_LAND = (289, "LK Nürnberger Land")
-    OBERALLGAEU = (318, "LK Oberallgäu")
+    NORDHAUSEN = (386, "LK Nordhausen", THURINGEN)
+    NORDSACHSEN = (364, "LK Nordsachsen", SACHSEN)
+    NORDWESTMECKLENBURG = (349, "LK Nordwestmecklenburg", MV)
+    NORTHEIM = (23, "LK Northeim", NIEDERSACHSEN)
+    NUERNBERG = (284, "SK Nürnberg", BAYERN)
+    NUERNBERGER_LAND = (289, "LK Nürnberger Land", BAYERN)
+    OBERALLGAEU = (318, "LK Oberallgäu", BAYERN)
     OBERBERGISCHER_KREIS = (87, "LK Oberbergischer Kreis", NRW)
-    OBERHAUSEN = (70, "SK Oberhausen")
-    OBERHAVEL = (335, "LK Oberhavel")
-    OBERSPREEWALD_LAUSITZ = (336, "LK Oberspreewald-Lausitz")
-    ODENWALDKREIS = (127, "LK Odenwaldkreis")
-    ODER_SPREE = (337, "LK Oder-Spree")
-    OFFENBACH_LK = (128, "LK Offenbach")
-    OFFENBACH_SK = (119, "SK Offenbach")
-    OLDENBURG_LK = (57, "LK Oldenburg")
-    OLDENBURG_SK = (47, "SK Oldenburg")
-    OLPE = (113, "LK Olpe")
-    ORTENAUKREIS = (207, "LK Ortenaukreis")
-    OSNABRUECK_SK = (48, "SK Osnabrück")
-    OSNABRUECK_LK = (58, "LK Osnabrück")
-    OSTALBKREIS = (191, "LK Ostalbkreis")
-    OSTALLGAEU = (315, "LK Ostallgäu")
-    OSTERHOLZ = (39, "LK Osterholz")
+    OBERHAUSEN = (70, "SK Oberhausen", NRW)
+    OBERHAVEL = (335, "LK Oberhavel", BRANDENBURG)
+    OBERSPREEWALD_LAUSITZ = (336, "LK Oberspreewald-Lausitz", BRANDENBURG)
+    ODENWALDKREIS = (127, "LK Odenwaldkreis", HESSEN)
+    ODER_SPREE = (337, "LK Oder-Spree", BRANDENBURG)
+    OFFENBACH_LK = (128, "LK Offenbach", HESSEN)
+    OFFENBACH_SK = (119, "SK Offenbach", HESSEN)
+    OLDENBURG_LK = (57, "LK Oldenburg", NIEDERSACHSEN)
+    OLDENBURG_SK = (47, "SK Oldenburg", NIEDERSACHSEN)
+    OLPE = (113, "LK Olpe", NRW)
+    ORTENAUKREIS = (207, "LK Ortenaukreis", BW)
+    OSNABRUECK_SK = (48, "SK Osnabrück", NIEDERSACHSEN)
+    OSNABRUECK_LK = (58, "LK Osnabrück", NIEDERSACHSEN)
+    OSTALBKREIS = (191, "LK Ostalbkreis", BW)
+    OSTALLGAEU = (315, "LK Ostallgäu", BAYERN)
+    OSTERHOLZ = (39, "LK Osterholz", NIEDERSACHSEN)
     OSTHOLSTEIN = (8, "LK Ostholstein", SH)
-    OSTPRIGNITZ_RUPPIN = (338, "LK Ostprignitz-Ruppin")
-    PADERBORN = (104, "LK Paderborn")
-    PASSAU_SK = (247, "SK Passau")
-    PASSAU_LK = (253, "LK Passau")
-    PEINE = (24, "LK Peine")
-    PFAFFENHOFEN_ILM = (241, "LK Pfaffenhofen a.d.Ilm")
-    PFORZHEIM = (200, "SK Pforzheim")
-    PINNEBERG = (9, "LK Pinneberg")
-    PIRMASENS = (165, "SK Pirmasens")
-    PLOEN = (10, "LK Plön")
-    POTSDAM = (329, "SK Potsdam")
-    POTSDAM_MITTELMARK = (339, "LK Potsdam-Mittelmark")
-    PRIGNITZ = (340, "LK Prignitz")
-    RASTATT = (195, "LK Rastatt")
-    RAVENSBURG = (221, "LK Ravensburg")
-    RECKLINGHAUSEN = (95, "LK Recklinghausen")
-    REGEN = (254, "LK Regen")
+    OSTPRIGNITZ_RUPPIN = (338, "LK Ostprignitz-Ruppin", BRANDENBURG)
+    PADERBORN = (104, "LK Paderborn", NRW)
+    PASSAU_SK = (247, "SK Passau", BAYERN)
+    PASSAU_LK = (253, "LK Passau", BAYERN)
+    PEINE = (24, "LK Peine", NIEDERSACHSEN)
+    PFAFFENHOFEN_ILM = (241, "LK Pfaffenhofen a.d.Ilm", BAYERN)
+    PFORZHEIM = (200, "SK Pforzheim", BW)
+    PINNEBERG = (9, "LK Pinneberg", SH)
+    PIRMASENS = (165, "SK Pirmasens", RP)
+    PLOEN = (10, "LK Plön", SH)
+    POTSDAM = (329, "SK Potsdam", BRANDENBURG)
+    POTSDAM_MITTELMARK = (339, "LK Potsdam-Mittelmark", BRANDENBURG)
+    PRIGNITZ = (340, "LK Prignitz", BRANDENBURG)
+    RASTATT = (195, "LK Rastatt", BW)
+    RAVENSBURG = (221, "LK Ravensburg", BW)
+    RECKLINGHAUSEN = (95, "LK Recklinghausen", NRW)
+    REGEN = (254, "LK Regen", BAYERN)
     REGENSBURG_SK = (259, "SK Regensburg", BAYERN)
     REGENSBURG_LK = (265, "LK Regensburg", BAYERN)
-    REGIONALVERBAND_SAARBRUECKEN = (319, "LK Stadtverband Saarbrücken")
-    REMS_MURR_KREIS = (184, "LK Rems-Murr-Kreis")
-    REMSCHEID = (71, "SK Remscheid")
-    RENDSBURG_ECKERNFOERDE = (11, "LK Rendsburg-Eckernförde")
-    REUTLINGEN = (214, "LK Reutlingen")
-    RHEIN_ERFT_KREIS = (84, "LK Rhein-Erft-Kreis")
-    RHEIN_HUNSRUECK_KREIS = (151, "LK Rhein-Hunsrück-Kreis")
-    RHEIN_KREIS_NEUSS = (76, "LK Rhein-Kreis Neuss")
-    RHEIN_LAHN_KREIS = (152, "LK Rhein-Lahn-Kreis")
-    RHEIN_NECKAR_KREIS = (199, "LK Rhein-Neckar-Kreis")
-    RHEIN_PFALZ_KREIS = (176, "LK Rhein-Pfalz-Kreis")
-    RHEIN_SIEG_KREIS = (89, "LK Rhein-Sieg-Kreis")
-    RHEINGAU_TAUNUS_KREIS = (129, "LK Rheingau-Taunus-Kreis")
-    RHEINISCH_BERGISCHER_KREIS = (88, "LK Rheinisch-Bergischer Kreis")
-    RHOEN_GRABFELD = (298, "LK Rhön-Grabfeld")
-    ROSENHEIM_SK = (225, "SK Rosenheim")
-    ROSENHEIM_LK = (242, "LK Rosenheim")
-    ROSTOCK_SK = (344, "SK Rostock")
-    ROSTOCK_LK = (347, "LK Rostock")
-    ROTENBURG_WUEMME = (40, "LK Rotenburg (Wümme)")
-    ROTH = (291, "LK Roth")
-    ROTTAL_INN = (255, "LK Rottal-Inn")
-    ROTTWEIL = (208, "LK Rottweil")
-    SAALE_HOLZLAND_KREIS = (398, "LK Saale-Holzland-Kreis")
-    SAALE_ORLA_KREIS = (399, "LK Saale-Orla-Kreis")
-    SAALEKREIS = (375, "LK Saalekreis")
-    SAALFELD_RUDOLSTADT = (397, "LK Saalfeld-Rudolstadt")
-    SAARLOUIS = (322, "LK Saarlouis")
-    SAARPFALZ_KREIS = (323, "LK Saarpfalz-Kreis")
-    SALZGITTER = (18, "SK Salzgitter")
-    SALZLANDKREIS = (376, "LK Salzlandkreis")
-    SCHAUMBURG = (33, "LK Schaumburg")
-    SCHLESWIG_FLENSBURG = (12, "LK Schleswig-Flensburg")
-    SCHMALKALDEN_MEININGEN = (390, "LK Schmalkalden-Meiningen")
-    SCHWABACH = (285, "SK Schwabach")
-    SCHWALM_EDER_KREIS = (140, "LK Schwalm-Eder-Kreis")
-    SCHWANDORF = (266, "LK Schwandorf")
-    SCHWARZWALD_BAAR_KREIS = (209, "LK Schwarzwald-Baar-Kreis")
-    SCHWEINFURT_SK = (294, "SK Schweinfurt")
-    SCHWEINFURT_LK = (303, "LK Schweinfurt")
-    SCHWERIN = (345, "SK Schwerin")
-    SCHWAEBISCH_HALL = (188, "LK Schwäbisch Hall")
-    SEGEBERG = (13, "LK Segeberg")
-    SIEGEN_WITTGENSTEIN = (114, "LK Siegen-Wittgenstein")
-    SIGMARINGEN = (222, "LK Sigmaringen")
-    SOEST = (115, "LK Soest")
-    SOLINGEN = (72, "SK Solingen")
-    SONNEBERG = (396, "LK Sonneberg")
-    SPEYER = (166, "SK Speyer")
-    SPREE_NEISSE = (341, "LK Spree-Neiße")
-    ST_WENDEL = (324, "LK Sankt Wendel")
-    STADE = (42, "LK Stade")
-    STARNBERG = (243, "LK Starnberg")
-    STEINBURG = (14, "LK Steinburg")
-    STEINFURT = (96, "LK Steinfurt")
-    STENDAL = (377, "LK Stendal")
-    STORMARN = (15, "LK Stormarn")
-    STRAUBING = (248, "SK Straubing")
-    STRAUBING_BOGEN = (256, "LK Straubing-Bogen")
-    STUTTGART = (179, "SK Stuttgart")
-    STAEDTEREGION_AACHEN = (82, "StädteRegion Aachen")
-    SUHL = (382, "SK Suhl")
-    SAECHSISCHE_SCHWEIZ_OSTERZGEBIRGE = (361, "LK Sächsische Schweiz-Osterzgebirge")
-    SOEMMERDA = (392, "LK Sömmerda")
-    SUEDLICHE_WEINSTRASSE = (175, "LK Südliche Weinstraße")
-    SUEDWESTPFALZ = (178, "LK Südwestpfalz")
-    TELTOW_FLAEMING = (342, "LK Teltow-Fläming")
-    TIRSCHENREUTH = (267, "LK Tirschenreuth")
-    TRAUNSTEIN = (244, "LK Traunstein")
-    TRIER = (154, "SK Trier")
-    TRIER_SAARBURG = (158, "LK Trier-Saarburg")
-    TUTTLINGEN = (210, "LK Tuttlingen")
-    TUEBINGEN = (215, "LK Tübingen")
-    UCKERMARK = (343, "LK Uckermark")
-    UELZEN = (43, "LK Uelzen")
-    ULM = (217, "SK Ulm")
-    UNNA = (116, "LK Unna")
-    UNSTRUT_HAINICH_KREIS = (388, "LK Unstrut-Hainich-Kreis")
-    UNTERALLGAEU = (316, "LK Unterallgäu")
-    VECHTA = (59, "LK Vechta")
-    VERDEN = (44, "LK Verden")
-    VIERSEN = (77, "LK Viersen")
-    VOGELSBERGKREIS = (135, "LK Vogelsbergkreis")
-    VOGTLANDKREIS = (355, "LK Vogtlandkreis")
-    VORPOMMERN_GREIFSWALD = (350, "LK Vorpommern-Greifswald")
-    VORPOMMERN_RUEGEN = (348, "LK Vorpommern-Rügen")
-    VULKANEIFEL = (157, "LK Vulkaneifel")
-    WALDECK_FRANKENBERG = (141, "LK Waldeck-Frankenberg")
-    WALDSHUT = (213, "LK Waldshut")
-    WARENDORF = (97, "LK Warendorf")
-    WARTBURGKREIS = (387, "LK Wartburgkreis")
-    WEIDEN_OPF = (260, "SK Weiden i.d.OPf.")
-    WEILHEIM_SCHONGAU = (245, "LK Weilheim-Schongau")
-    WEIMAR = (383, "SK Weimar")
-    WEIMARER_LAND = (395, "LK Weimarer Land")
-    WEISSENBURG_GUNZENHAUSEN = (292, "LK Weißenburg-Gunzenhausen")
-    WERRA_MEISSNER_KREIS = (142, "LK Werra-Meißner-Kreis")
-    WESEL = (78, "LK Wesel")
-    WESERMARSCH = (60, "LK Wesermarsch")
-    WESTERWALDKREIS = (153, "LK Westerwaldkreis")
-    WETTERAUKREIS = (130, "LK Wetteraukreis")
-    WIESBADEN = (120, "SK Wiesbaden")
-    WILHELMSHAVEN = (49, "SK Wilhelmshaven")
-    WITTENBERG = (378, "LK Wittenberg")
-    WITTMUND = (61, "LK Wittmund")
+    REGIONALVERBAND_SAARBRUECKEN = (319, "LK Stadtverband Saarbrücken", SAARLAND)
+    REMS_MURR_KREIS = (184, "LK Rems-Murr-Kreis", BW)
+    REMSCHEID = (71, "SK Remscheid", NRW)
+    RENDSBURG_ECKERNFOERDE = (11, "LK Rendsburg-Eckernförde", SH)
+    REUTLINGEN = (214, "LK Reutlingen", BW)
+    RHEIN_ERFT_KREIS = (84, "LK Rhein-Erft-Kreis", NRW)
+    RHEIN_HUNSRUECK_KREIS = (151, "LK Rhein-Hunsrück-Kreis", RP)
+    RHEIN_KREIS_NEUSS = (76, "LK Rhein-Kreis Neuss", NRW)
+    RHEIN_LAHN_KREIS = (152, "LK Rhein-Lahn-Kreis", RP)
+    RHEIN_NECKAR_KREIS = (199, "LK Rhein-Neckar-Kreis", BW)
+    RHEIN_PFALZ_KREIS = (176, "LK Rhein-Pfalz-Kreis", RP)
+    RHEIN_SIEG_KREIS = (89, "LK Rhein-Sieg-Kreis", NRW)
+    RHEINGAU_TAUNUS_KREIS = (129, "LK Rheingau-Taunus-Kreis", HESSEN)
+    RHEINISCH_BERGISCHER_KREIS = (88, "LK Rheinisch-Bergischer Kreis", NRW)
+    RHOEN_GRABFELD = (298, "LK Rhön-Grabfeld", BAYERN)
+    ROSENHEIM_SK = (225, "SK Rosenheim", BAYERN)
+    ROSENHEIM_LK = (242, "LK Rosenheim", BAYERN)
+    ROSTOCK_SK = (344, "SK Rostock", MV)
+    ROSTOCK_LK = (347, "LK Rostock", MV)
+    ROTENBURG_WUEMME = (40, "LK Rotenburg (Wümme)", NIEDERSACHSEN)
+    ROTH = (291, "LK Roth", BAYERN)
+    ROTTAL_INN = (255, "LK Rottal-Inn", BAYERN)
+    ROTTWEIL = (208, "LK Rottweil", BW)
+    SAALE_HOLZLAND_KREIS = (398, "LK Saale-Holzland-Kreis", THURINGEN)
+    SAALE_ORLA_KREIS = (399, "LK Saale-Orla-Kreis", THURINGEN)
+    SAALEKREIS = (375, "LK Saalekreis", SA)
+    SAALFELD_RUDOLSTADT = (397, "LK Saalfeld-Rudolstadt", THURINGEN)
+    SAARLOUIS = (322, "LK Saarlouis", SAARLAND)
+    SAARPFALZ_KREIS = (323, "LK Saarpfalz-Kreis", SAARLAND)
+    SALZGITTER = (18, "SK Salzgitter", NIEDERSACHSEN)
+    SALZLANDKREIS = (376, "LK Salzlandkreis", SA)
+    SCHAUMBURG = (33, "LK Schaumburg", NIEDERSACHSEN)
+    SCHLESWIG_FLENSBURG = (12, "LK Schleswig-Flensburg", SH)
+    SCHMALKALDEN_MEININGEN = (390, "LK Schmalkalden-Meiningen", THURINGEN)
+    SCHWABACH = (285, "SK Schwabach", BAYERN)
+    SCHWALM_EDER_KREIS = (140, "LK Schwalm-Eder-Kreis", HESSEN)
+    SCHWANDORF = (266, "LK Schwandorf", BAYERN)
+    SCHWARZWALD_BAAR_KREIS = (209, "LK Schwarzwald-Baar-Kreis", BW)
+    SCHWEINFURT_SK = (294, "SK Schweinfurt", BAYERN)
+    SCHWEINFURT_LK = (303, "LK Schweinfurt", BAYERN)
+    SCHWERIN = (345, "SK Schwerin", MV)
+    SCHWAEBISCH_HALL = (188, "LK Schwäbisch Hall", BW)
+    SEGEBERG = (13, "LK Segeberg", SH)
+    SIEGEN_WITTGENSTEIN = (114, "LK Siegen-Wittgenstein", NRW)
+    SIGMARINGEN = (222, "LK Sigmaringen", BW)
+    SOEST = (115, "LK Soest", NRW)
+    SOLINGEN = (72, "SK Solingen", NRW)
+    SONNEBERG = (396, "LK Sonneberg", THURINGEN)
+    SPEYER = (166, "SK Speyer", RP)
+    SPREE_NEISSE = (341, "LK Spree-Neiße", BRANDENBURG)
+    ST_WENDEL = (324, "LK Sankt Wendel", SAARLAND)
+    STADE = (42, "LK Stade", NIEDERSACHSEN)
+    STARNBERG = (243, "LK Starnberg", BAYERN)
+    STEINBURG = (14, "LK Steinburg", SH)
+    STEINFURT = (96, "LK Steinfurt", NRW)
+    STENDAL = (377, "LK Stendal", SA)
+    STORMARN = (15, "LK Stormarn", SH)
+    STRAUBING = (248, "SK Straubing", BAYERN)
+    STRAUBING_BOGEN = (256, "LK Straubing-Bogen", BAYERN)
+    STUTTGART = (179, "SK Stuttgart", BW)
+    STAEDTEREGION_AACHEN = (82, "StädteRegion Aachen", NRW)
+    SUHL = (382, "SK Suhl", THURINGEN)
+    SAECHSISCHE_SCHWEIZ_OSTERZGEBIRGE = (361, "LK Sächsische Schweiz-Osterzgebirge", SACHSEN)
+    SOEMMERDA = (392, "LK Sömmerda", THURINGEN)
+    SUEDLICHE_WEINSTRASSE = (175, "LK Südliche Weinstraße", RP)
+    SUEDWESTPFALZ = (178, "LK Südwestpfalz", RP)
+    TELTOW_FLAEMING = (342, "LK Teltow-Fläming", BRANDENBURG)
+    TIRSCHENREUTH = (267, "LK Tirschenreuth", BAYERN)
+    TRAUNSTEIN = (244, "LK Traunstein", BAYERN)
+    TRIER = (154, "SK Trier", RP)
+    TRIER_SAARBURG = (158, "LK Trier-Saarburg", RP)
+    TUTTLINGEN = (210, "LK Tuttlingen", BW)
+    TUEBINGEN = (215, "LK Tübingen", BW)
+    UCKERMARK = (343, "LK Uckermark", BRANDENBURG)
+    UELZEN = (43, "LK Uelzen", NIEDERSACHSEN)
+    ULM = (217, "SK Ulm", BW)
+    UNNA = (116, "LK Unna", NRW)
+    UNSTRUT_HAINICH_KREIS = (388, "LK Unstrut-Hainich-Kreis", THURINGEN)
+    UNTERALLGAEU = (316, "LK Unterallgäu", BAYERN)
+    VECHTA = (59, "LK Vechta", NIEDERSACHSEN)
+    VERDEN = (44, "LK Verden", NIEDERSACHSEN)
+    VIERSEN = (77, "LK Viersen", NRW)
+    VOGELSBERGKREIS = (135, "LK Vogelsbergkreis", HESSEN)
+    VOGTLANDKREIS = (355, "LK Vogtlandkreis", SACHSEN)
+    VORPOMMERN_GREIFSWALD = (350, "LK Vorpommern-Greifswald", MV)
+    VORPOMMERN_RUEGEN = (348, "LK Vorpommern-Rügen", MV)
+    VULKANEIFEL = (157, "LK Vulkaneifel", RP)
+    WALDECK_FRANKENBERG = (141, "LK Waldeck-Frankenberg", HESSEN)
+    WALDSHUT = (213, "LK Waldshut", BW)
+    WARENDORF = (97, "LK Warendorf", NRW)
+    WARTBURGKREIS = (387, "LK Wartburgkreis", THURINGEN)
+    WEIDEN_OPF = (260, "SK Weiden i.d.OPf.", BAYERN)
+    WEILHEIM_SCHONGAU = (245, "LK Weilheim-Schongau", BAYERN)
+    WEIMAR = (383, "SK Weimar", THURINGEN)
+    WEIMARER_LAND = (395, "LK Weimarer Land", THURINGEN)
+    WEISSENBURG_GUNZENHAUSEN = (292, "LK Weißenburg-Gunzenhausen", BAYERN)
+    WERRA_MEISSNER_KREIS = (142, "LK Werra-Meißner-Kreis", HESSEN)
+    WESEL = (78, "LK Wesel", NRW)
+    WESERMARSCH = (60, "LK Wesermarsch", NIEDERSACHSEN)
+    WESTERWALDKREIS = (153, "LK Westerwaldkreis", RP)
+    WETTERAUKREIS = (130, "LK Wetteraukreis", HESSEN)
+    WIESBADEN = (120, "SK Wiesbaden", HESSEN)
+    WILHELMSHAVEN = (49, "SK Wilhelmshaven", NIEDERSACHSEN)
+    WITTENBERG = (378, "LK Wittenberg", SA)
+    WITTMUND = (61, "LK Wittmund", NIEDERSACHSEN)
     WOLFENBUETTEL = (25, "LK Wolfenbüttel", NIEDERSACHSEN)
     WOLFSBURG = (19, "SK Wolfsburg", NIEDERSACHSEN)
-    WORMS = (167, "SK Worms")
-    WUNSIEDEL_FICHTELGEBIRGE = (280, "LK Wunsiedel i.Fichtelgebirge")
-    WUPPERTAL = (73, "SK Wuppertal")
-    WUERZBURG_SK = (295, "SK Würzburg")
-    WUERZBURG_LK = (304, "LK Würzburg")
-    ZOLLERNALBKREIS = (216, "LK Zollernalbkreis")
-    ZWEIBRUECKEN = (168, "SK Zweibrücken")
-    ZWICKAU = (356, "LK Zwickau")
+    WORMS = (167, "SK Worms", RP)
+    WUNSIEDEL_FICHTELGEBIRGE = (280, "LK Wunsiedel i.Fichtelgebirge", BAYERN)
+    WUPPERTAL = (73, "SK Wuppertal", NRW)
+    WUERZBURG_SK = (295, "SK Würzburg", BAYERN)
+    WUERZBURG_LK = (304, "LK Würzburg", BAYERN)
+    ZOLLERNALBKREIS = (216, "LK Zollernalbkreis", BW)
+    ZWEIBRUECKEN = (168, "SK Zweibrücken", RP)
+    ZWICKAU = (356, "LK Zwickau", SACHSEN)
 
     def __init__(self, lk_id: int, lk_name: str, land: Optional[str] = "", name: Optional[str] = None):
         """Inits a Landkreis.
@@ -472,12 +472,17 @@ class Landkreise(Enum):
     def id(self) -> int:
         return self._value_
 
+    @classmethod
+    def _missing_(cls, value) -> Optional["Landkreise"]:
+        """Finds the member by id, as the value of the members is the id set in __init__. Used e.g. by pickle."""
+        return _BY_ID.get(value) if isinstance(value, int) else None
+
     @staticmethod
     def find_by_id(lk_id: int) -> "Landkreise":
-        result = tuple(lk for lk in Landkreise if lk.id == lk_id)
-        if len(result) != 1:
-            raise ValueError(f"lk_id {lk_id} does not exist")
-        return result[0]
+        try:
+            return _BY_ID[lk_id]
+        except (KeyError, TypeError):
+            raise ValueError(f"lk_id {lk_id} does not exist") from None
 
     @classmethod
     def find_by_ids(cls, lk_ids: Iterable[int]) -> list["Landkreise"]:
@@ -495,7 +500,7 @@ class Landkreise(Enum):
 
     @staticmethod
     def find_by_lk_name(lk_name) -> Optional["Landkreise"]:
-        return result[0] if len(result := tuple(lk for lk in Landkreise if lk.lk_name == lk_name)) == 1 else None
+        return _BY_LK_NAME.get(lk_name)
 
     @classmethod
     def find_by_lk_names(cls, lk_names: Iterable[str]) -> Iterable["Landkreise"]:
@@ -511,5 +516,44 @@ class Landkreise(Enum):
         """
         return (landkreis for lk_name in lk_names if (landkreis := cls.find_by_lk_name(lk_name)) is not None)
 
+    @staticmethod
+    def map_lk_names(lk_names: Iterable) -> list[Union["Landkreise", object]]:
+        """Will return the Landkreis of every lk_name in a single pass, e.g. to replace the labels of a pandas Index.
+        Values which are not an lk_name are kept as they are.
+
+        Args:
+            lk_names (Iterable): lk_names to convert to Landkreise
+
+        Returns:
+            list[Landkreise|object]: list with the same length as lk_names
+        """
+        get = _BY_LK_NAME.get
+        return [get(lk_name, lk_name) for lk_name in lk_names]
+
+    @staticmethod
+    def find_by_name(name: str) -> tuple["Landkreise", ...]:
+        """Will return all Landkreise with the given display name, e.g. the SK and LK of the same city."""
+        return _BY_NAME.get(name, ())
+
+    @staticmethod
+    def find_by_land(land: str) -> tuple["Landkreise", ...]:
+        """Will return all Landkreise which are configured to be located in land."""
+        return _BY_LAND.get(land, ())
+
     def __str__(self) -> str:
         return self.name
+
+
+def _group_by(key: Callable[[Landkreise], Optional[str]]) -> dict[str, tuple[Landkreise, ...]]:
+    result: dict[str, list[Landkreise]] = {}
+    for landkreis in Landkreise:
+        if value := key(landkreis):
+            result.setdefault(value, []).append(landkreis)
+    return {value: tuple(landkreise) for value, landkreise in result.items()}
+
+
+# lookup indexes, built once as the members never change
+_BY_ID: dict[int, Landkreise] = {landkreis.id: landkreis for landkreis in Landkreise}
+_BY_LK_NAME: dict[str, Landkreise] = {landkreis.lk_name: landkreis for landkreis in Landkreise}
+_BY_NAME = _group_by(lambda landkreis: landkreis.name)
+_BY_LAND = _group_by(lambda landkreis: landkreis._land)  # not the property, it warns about missing lands
@@ -0,0 +1,216 @@
+"""In-process metrics of the requests, caches and excel parsing in the Prometheus text exposition format.
+
+The metrics are collected in REGISTRY all the time. 'corona serve' exposes them as /metrics, one-shot runs write
+them to a file with 'corona --metrics-file FILE <command>'. No client library or service is needed.
+"""
+import abc
+import asyncio
+import bisect
+import contextlib
+import functools
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Callable, Union
+
+# seconds, from a fast request to parsing the archive
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str]) -> str:
+    if not labelnames:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)) + "}"
+
+
+class Metric(abc.ABC):
+    """Values of a metric by label values. Thread safe, excel files are parsed in executor threads."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' requires the labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[tuple[str, tuple[str, ...], tuple[str, ...], float]]:
+        """Yields name, label names, label values and value of every sample"""
+
+    def expose(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be increased")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for labelvalues, value in values:
+            yield self.name, self.labelnames, labelvalues, value
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # counts per bucket (not cumulative, the last one is +Inf), sum and count by label values
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if (entry := self._values.get(key)) is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    @contextlib.contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observes the seconds the block takes, also if it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return 0 if entry is None else sum(entry[0])
+
+    def samples(self):
+        with self._lock:
+            values = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+        bucket_labelnames = (*self.labelnames, "le")
+        for labelvalues, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", bucket_labelnames, (*labelvalues, _format_value(bound)), cumulative
+            yield f"{self.name}_sum", self.labelnames, labelvalues, total
+            yield f"{self.name}_count", self.labelnames, labelvalues, cumulative
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def _register(self, metric: Metric) -> Metric:
+        if (existing := self._metrics.get(metric.name)) is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric '{metric.name}' is registered already with another type or labels")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Returns the counter name, creates it if it is not registered yet"""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Returns the histogram name, creates it if it is not registered yet"""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def expose(self) -> str:
+        """Returns all metrics in the Prometheus text exposition format"""
+        return "".join(metric.expose() for metric in self._metrics.values())
+
+    def write(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(self.expose(), encoding="utf-8")
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "corona_http_request_duration_seconds",
+    "Seconds until the headers of a response arrived, per attempt",
+    ("host", "status"),
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "corona_http_requests_total", "Attempted requests by status code, or 'error' without response", ("host", "status")
+)
+HTTP_RETRIES = REGISTRY.counter("corona_http_retries_total", "Retried requests", ("host",))
+HTTP_RESPONSE_BYTES = REGISTRY.counter(
+    "corona_http_response_bytes_total", "Bytes of the bodies read, after decompression", ("host",)
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "corona_cache_requests_total", "Lookups of the caches by result: hit, miss or revalidated", ("cache", "result")
+)
+FETCH_BINARY_SECONDS = REGISTRY.histogram(
+    "corona_fetch_binary_duration_seconds", "Seconds to get an excel file, from the cache or downloaded"
+)
+COALESCED_CALLS = REGISTRY.counter(
+    "corona_coalesced_calls_total",
+    "Calls of the Connector answered by an equal call in flight or by its memorized result: joined or memo",
+    ("result",),
+)
+READ_EXCEL_SECONDS = REGISTRY.histogram(
+    "corona_read_excel_duration_seconds", "Seconds to parse an excel file and select the values", ("engine",)
+)
+
+
+def timed(histogram: Histogram, **labels) -> Callable[[Callable], Callable]:
+    """Decorator observing the seconds of every call of a function or coroutine function in histogram"""
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with histogram.time(**labels):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
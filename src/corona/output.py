@@ -0,0 +1,184 @@
+"""Machine readable output of today and history as JSON Lines, CSV or Arrow IPC stream.
+
+Does not import pandas, so today can stream its rows without loading it. pyarrow is optional and only imported
+for the arrow format, install it with 'pip install corona[arrow]'.
+"""
+import abc
+import contextlib
+import csv
+import io
+import json
+import sys
+from collections.abc import Iterator, Sequence
+from typing import BinaryIO, Optional
+
+import asyncclick as click
+
+OUTPUT_FORMATS = ("table", "jsonl", "csv", "arrow")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401 - makes pa.ipc available
+    except ImportError:
+        raise RuntimeError("The arrow output format requires pyarrow: pip install corona[arrow]") from None
+    return pa
+
+
+def check_output_format(output_format: str) -> None:
+    """Raises a RuntimeError if output_format can not be written, call it before opening the output file"""
+    if output_format == "arrow":
+        _import_pyarrow()
+
+
+def validate_output_format(ctx: click.Context, param: click.Parameter, value: str) -> str:
+    """Callback of the output format options, fails before the output file is opened"""
+    try:
+        check_output_format(value)
+    except RuntimeError as e:
+        raise click.BadParameter(str(e), ctx, param) from None
+    return value
+
+
+def _arrow_type(pa, python_type: type):
+    return {str: pa.string(), float: pa.float64(), int: pa.int64(), bool: pa.bool_()}[python_type]
+
+
+def _frame_schema(pa, df):
+    """Returns the arrow schema of the columns of df by their dtypes, object columns are strings"""
+    fields = []
+    for name, dtype in df.dtypes.items():
+        if dtype == object:
+            arrow_type = pa.string()
+        else:  # the nullable extension dtypes like Int64 have a numpy_dtype
+            arrow_type = pa.from_numpy_dtype(getattr(dtype, "numpy_dtype", dtype))
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+@contextlib.contextmanager
+def open_output(output_file: Optional[str] = None) -> Iterator[BinaryIO]:
+    """Opens output_file for writing, or returns stdout if it is empty or None"""
+    if not output_file:
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+        return
+    with open(output_file, "wb") as file:
+        yield file
+
+
+class RowWriter(abc.ABC):
+    """Writes rows one by one as they arrive. The text formats flush every row, so a pipe reads it immediately."""
+
+    def __init__(self, file: BinaryIO, fields: Sequence[str], types: Sequence[type]):
+        self.file = file
+        self.fields = tuple(fields)
+        self.types = tuple(types)
+
+    @abc.abstractmethod
+    def write(self, row: Sequence) -> None:
+        """Writes the values of row, in the order of fields"""
+
+    def close(self) -> None:
+        self.file.flush()
+
+    def __enter__(self) -> "RowWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _json_line(record: dict) -> bytes:
+    """Returns record as a line of JSON Lines, floats are written with repr and read back exactly"""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class JsonLinesWriter(RowWriter):
+    def write(self, row: Sequence) -> None:
+        self.file.write(_json_line(dict(zip(self.fields, row))))
+        self.file.flush()
+
+
+class CsvWriter(RowWriter):
+    def __init__(self, file: BinaryIO, fields: Sequence[str], types: Sequence[type]):
+        super().__init__(file, fields, types)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self.write(self.fields)
+
+    def write(self, row: Sequence) -> None:
+        self._writer.writerow(row)
+        self.file.write(self._buffer.getvalue().encode("utf-8"))
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self.file.flush()
+
+
+class ArrowWriter(RowWriter):
+    """Writes an Arrow IPC stream, the rows are collected into record batches of batch_size rows.
+    The schema is given by types, so columns without any value in a batch keep their type."""
+
+    def __init__(self, file: BinaryIO, fields: Sequence[str], types: Sequence[type], batch_size: int = 1024):
+        super().__init__(file, fields, types)
+        pa = self._pa = _import_pyarrow()
+        self.batch_size = batch_size
+        self._rows: list[Sequence] = []
+        self._schema = pa.schema([pa.field(name, _arrow_type(pa, t)) for name, t in zip(self.fields, self.types)])
+        self._writer = None
+
+    def _write_batch(self) -> None:
+        pa = self._pa
+        if self._writer is None:
+            self._writer = pa.ipc.new_stream(self.file, self._schema)
+        columns = list(zip(*self._rows)) if self._rows else [()] * len(self.fields)
+        arrays = [pa.array(column, type=field.type) for column, field in zip(columns, self._schema)]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+        self._rows = []
+
+    def write(self, row: Sequence) -> None:
+        self._rows.append(tuple(row))
+        if len(self._rows) >= self.batch_size:
+            self._write_batch()
+
+    def close(self) -> None:
+        if self._rows or self._writer is None:
+            self._write_batch()
+        self._writer.close()
+        super().close()
+
+
+_WRITERS = {"jsonl": JsonLinesWriter, "csv": CsvWriter, "arrow": ArrowWriter}
+
+
+def create_writer(output_format: str, file: BinaryIO, fields: Sequence[str], types: Sequence[type]) -> RowWriter:
+    """Returns the RowWriter of output_format, one of OUTPUT_FORMATS except 'table'.
+
+    Args:
+        output_format (str): Format to write
+        file (BinaryIO): File to write to
+        fields (Sequence[str]): Names of the values of the rows
+        types (Sequence[type]): Python types of the values of the rows, str, float, int or bool. Values may be None.
+    """
+    if output_format not in _WRITERS:
+        raise ValueError(f"Unknown output format '{output_format}', must be one of {tuple(_WRITERS)}")
+    return _WRITERS[output_format](file, fields, types)
+
+
+def write_frame(df, output_format: str, file: BinaryIO) -> None:
+    """Writes the pandas DataFrame df at once without its index, missing values are written as null or empty"""
+    if output_format == "jsonl":
+        # written like JsonLinesWriter, to_json of pandas would round the floats
+        records = df.astype(object).where(df.notna(), None).to_dict("records")
+        file.write(b"".join(_json_line(record) for record in records))
+    elif output_format == "csv":
+        file.write(df.to_csv(index=False, lineterminator="\n").encode("utf-8"))
+    elif output_format == "arrow":
+        pa = _import_pyarrow()
+        table = pa.Table.from_pandas(df, schema=_frame_schema(pa, df), preserve_index=False)
+        with pa.ipc.new_stream(file, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unknown output format '{output_format}', must be one of {tuple(_WRITERS)}")
+    file.flush()
@@ -0,0 +1,199 @@
+"""Timing of the phases of a run, enabled by 'corona --profile'.
+
+Functions decorated with profiled record a span per call: wall time, bytes, rows and the peak of memory traced by
+tracemalloc. Spans of the same name are summarized at the end of the run. Without a running Profiler the decorator
+only calls the function. Peak memory is approximate for concurrent spans, e.g. the requests of get_cases.
+"""
+import asyncio
+import contextlib
+import contextvars
+import functools
+import json
+import time
+import tracemalloc
+from collections import namedtuple
+from collections.abc import Iterator
+from typing import Callable, Optional
+
+PROFILE_FORMATS = ("table", "json")
+PhaseSummary = namedtuple("PhaseSummary", ("name", "calls", "seconds", "max_seconds", "size", "rows", "peak_memory"))
+
+
+class Span:
+    """Measurements of a single call, size and rows may be set while the span is open"""
+
+    __slots__ = ("name", "seconds", "size", "rows", "peak_memory")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.size: Optional[int] = None
+        self.rows: Optional[int] = None
+        self.peak_memory: Optional[int] = None
+
+
+# innermost open span of the current task, its peak memory includes the peaks of nested spans
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+_profiler: Optional["Profiler"] = None
+
+
+class Profiler:
+    def __init__(self, trace_memory: bool = True):
+        """Inits the Profiler.
+
+        Args:
+            trace_memory (bool, optional): Whether to measure peak memory with tracemalloc, which slows python down.
+                                           Defaults to True.
+        """
+        self.trace_memory = trace_memory
+        self.spans: list[Span] = []
+        self.seconds = 0.0
+        self._start = 0.0
+        self._started_tracemalloc = False
+
+    def start(self) -> "Profiler":
+        """Makes this the active Profiler recording all spans"""
+        global _profiler
+        if _profiler is not None:
+            raise RuntimeError("Another Profiler is running already")
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        _profiler = self
+        self._start = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        global _profiler
+        self.seconds = time.perf_counter() - self._start
+        if _profiler is self:
+            _profiler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def summary(self) -> list[PhaseSummary]:
+        """Returns the spans summarized by name, in the order of their first call"""
+        phases: dict[str, list[Span]] = {}
+        for span in self.spans:
+            phases.setdefault(span.name, []).append(span)
+
+        def total(values: list[Optional[int]], func: Callable = sum) -> Optional[int]:
+            values = [value for value in values if value is not None]
+            return func(values) if values else None
+
+        return [
+            PhaseSummary(
+                name,
+                len(spans),
+                sum(span.seconds for span in spans),
+                max(span.seconds for span in spans),
+                total([span.size for span in spans]),
+                total([span.rows for span in spans]),
+                total([span.peak_memory for span in spans], max),
+            )
+            for name, spans in phases.items()
+        ]
+
+    def to_json(self) -> str:
+        phases = [phase._asdict() for phase in self.summary()]
+        return json.dumps({"seconds": self.seconds, "phases": phases})
+
+    def format_table(self) -> str:
+        lines = [f"{'Phase':30} {'Aufrufe':>7} {'Summe s':>9} {'Max s':>9} {'Bytes':>11} {'Zeilen':>7} {'Peak MiB':>9}"]
+        for phase in self.summary():
+            size = "" if phase.size is None else phase.size
+            rows = "" if phase.rows is None else phase.rows
+            peak = "" if phase.peak_memory is None else f"{phase.peak_memory / 1024 / 1024:.1f}"
+            lines.append(
+                f"{phase.name:30} {phase.calls:7} {phase.seconds:9.3f} {phase.max_seconds:9.3f} {size:>11} {rows:>7} "
+                f"{peak:>9}"
+            )
+        lines.append(f"{'Gesamt':30} {'':7} {self.seconds:9.3f}")
+        return "\n".join(lines)
+
+    def format(self, profile_format: str = "table") -> str:
+        if profile_format not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format '{profile_format}', must be one of {PROFILE_FORMATS}")
+        return self.to_json() if profile_format == "json" else self.format_table()
+
+
+@contextlib.contextmanager
+def span(name: str) -> Iterator[Span]:
+    """Records the wall time and peak memory of the block as a span named name, if a Profiler is running"""
+    result = Span(name)
+    profiler = _profiler
+    if profiler is None:
+        yield result
+        return
+    tracing = profiler.trace_memory and tracemalloc.is_tracing()
+    parent = _current_span.get()
+    if tracing:
+        if parent is not None:  # keeps the peak of the parent before measuring this span
+            parent.peak_memory = max(parent.peak_memory or 0, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    token = _current_span.set(result)
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - start
+        _current_span.reset(token)
+        if tracing:
+            result.peak_memory = max(result.peak_memory or 0, tracemalloc.get_traced_memory()[1])
+            if parent is not None:
+                parent.peak_memory = max(parent.peak_memory or 0, result.peak_memory)
+        profiler.spans.append(result)
+
+
+def profiled(
+    name: Optional[str] = None, size: Optional[Callable[..., int]] = None, rows: Optional[Callable[..., int]] = None
+) -> Callable[[Callable], Callable]:
+    """Decorator recording a span per call of a function or coroutine function.
+
+    Args:
+        name (str, optional): Name of the span. Defaults to the qualified name of the function.
+        size (Callable, optional): Returns the bytes of the result of the function. Defaults to None.
+        rows (Callable, optional): Returns the rows of the result of the function. Defaults to None.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        def measure(record: Span, result) -> None:
+            if size is not None:
+                record.size = size(result)
+            if rows is not None:
+                record.rows = rows(result)
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _profiler is None:
+                    return await func(*args, **kwargs)
+                with span(span_name) as record:
+                    result = await func(*args, **kwargs)
+                    measure(record, result)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with span(span_name) as record:
+                result = func(*args, **kwargs)
+                measure(record, result)
+            return result
+
+        return wrapper
+
+    return decorator
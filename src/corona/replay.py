@@ -0,0 +1,96 @@
+"""Recorded responses of the ArcGIS and RKI servers, to run without network access.
+
+A directory of recorded responses contains files named like tests/test_data: 'all.json' with all Landkreise,
+'{id}.json' with a single Landkreis, 'de.json' with Deutschland and the excel files with their names of the urls.
+The Connector replays such a directory instead of sending requests, or records its responses into it.
+"""
+import json
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Union
+from urllib.parse import urlsplit
+
+from corona.cache import _write_atomic
+
+LOG = logging.getLogger(__name__)
+# environment variables selecting the directory to replay from or to record into
+REPLAY_DIR_ENV = "CORONA_REPLAY_DIR"
+RECORD_DIR_ENV = "CORONA_RECORD_DIR"
+ALL_CASES = "all.json"
+GERMANY = "de.json"
+
+
+def case_name(region_id: int) -> str:
+    return f"{region_id}.json"
+
+
+def excel_name(url: str) -> str:
+    """Returns the file name of the excel url, e.g. 'Fallzahlen_Kum_Tab_aktuell.xlsx'"""
+    return urlsplit(url).path.rsplit("/", 1)[-1]
+
+
+def cases_to_features(cases: Iterable[tuple]) -> list[dict]:
+    """Returns the features of an answer with the attributes of cases, CasesResults or tuples in their order"""
+    return [
+        {
+            "attributes": {
+                "OBJECTID": region_id,
+                "GEN": city_name,
+                "county": county,
+                "cases7_per_100k": value,
+                "last_update": last_update,
+            }
+        }
+        for city_name, county, value, last_update, region_id in cases
+    ]
+
+
+class ResponseDirectory:
+    """Directory of recorded responses"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def read(self, name: str) -> bytes:
+        try:
+            return (self.path / name).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No recorded response '{name}' in '{self.path}'") from None
+
+    def read_json(self, name: str) -> dict:
+        return json.loads(self.read(name))
+
+    def write(self, name: str, content: bytes) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.path / name, content)
+        LOG.debug("Recorded '%s' in '%s'", name, self.path)
+
+    def write_json(self, name: str, response_json: dict) -> None:
+        self.write(name, json.dumps(response_json, ensure_ascii=False).encode("utf-8"))
+
+    def cases_json(self, region_ids: Iterable[int]) -> dict:
+        """Returns an answer with the features of region_ids, like the answer of a request for these ids.
+        The feature of a Landkreis is taken from its own file, or from all.json if it was not recorded on its own.
+        Landkreise without any recorded feature are missing in the answer."""
+        features = []
+        all_features = None
+        for region_id in region_ids:
+            if (self.path / case_name(region_id)).exists():
+                features.extend(self.read_json(case_name(region_id))["features"])
+                continue
+            if all_features is None:
+                all_features = {feature["attributes"]["OBJECTID"]: feature for feature in self.all_features()}
+            if (feature := all_features.get(region_id)) is not None:
+                features.append(feature)
+        return {"features": features}
+
+    def all_features(self) -> list[dict]:
+        if not (self.path / ALL_CASES).exists():
+            return []
+        return self.read_json(ALL_CASES)["features"]
+
+    def write_cases(self, response_json: dict) -> None:
+        """Records every feature of an answer as the answer of its Landkreis"""
+        for feature in response_json["features"]:
+            self.write_json(case_name(feature["attributes"]["OBJECTID"]), {"features": [feature]})
@@ -1,19 +1,102 @@
 import asyncio
+import contextlib
+import importlib.util
 import logging
+import math
 import os
+import time
 from collections import namedtuple
-from collections.abc import AsyncIterable, Iterable
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Sequence
+from typing import Optional, TypeVar
+from urllib.parse import urlsplit
 
 import aiohttp  # pip install aiohttp OPTIONAL: pip install aiodns
 
+from corona.cache import HttpCache
+from corona.json_decoder import JsonDecoder, create_decoder, decode_features
 from corona.landkreise import Landkreise
+from corona.metrics import (
+    CACHE_REQUESTS,
+    FETCH_BINARY_SECONDS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS,
+    HTTP_RESPONSE_BYTES,
+    HTTP_RETRIES,
+    timed,
+)
+from corona.profiling import profiled
+from corona.replay import (
+    ALL_CASES,
+    GERMANY,
+    RECORD_DIR_ENV,
+    REPLAY_DIR_ENV,
+    ResponseDirectory,
+    cases_to_features,
+    excel_name,
+)
+from corona.scheduler import RequestScheduler
+from corona.single_flight import SingleFlight, coalesced
 
 LOG = logging.getLogger(__name__)
+T = TypeVar("T")
 CasesResult = namedtuple("CasesResult", ("city_name", "county", "cases7_per_100k", "updated", "region_id"))
+CASES_RESULT_TYPES = (str, str, float, str, int)
+# keeps the url short and the answer below the maxRecordCount of the FeatureServer
+MAX_IDS_PER_REQUEST = 100
+# features per page of get_all_cases, pages cut by the maxRecordCount of the FeatureServer are completed
+PAGE_SIZE = 1000
+ConnectorConfig = namedtuple(
+    "ConnectorConfig",
+    ("limit", "limit_per_host", "keepalive_timeout", "ttl_dns_cache", "use_aiodns", "compress", "timeout"),
+    defaults=(100, 10, 60, 600, True, True, 120),
+)
+ConnectorConfig.__doc__ = """Settings of the http session created by the Connector
+
+Args:
+    limit (int): Max open connections. Defaults to 100.
+    limit_per_host (int): Max open connections per host. Defaults to 10.
+    keepalive_timeout (float): Seconds an idle connection is kept open for reuse. Defaults to 60.
+    ttl_dns_cache (int): Seconds resolved host names are cached. Defaults to 600.
+    use_aiodns (bool): Resolve host names with aiodns, if it is installed. Defaults to True.
+    compress (bool): Ask the servers for compressed answers. Defaults to True.
+    timeout (float): Max seconds of a single request. Defaults to 120.
+"""
 
 
 class Connector:
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[HttpCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        config: Optional[ConnectorConfig] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        replay_dir: Optional[str] = None,
+        record_dir: Optional[str] = None,
+        decoder: Optional[JsonDecoder] = None,
+        memo_ttl: float = 0,
+    ):
+        """Inits the Connector.
+
+        Args:
+            cache (HttpCache, optional): If set, downloaded excel files will be cached and revalidated with it.
+                                         Defaults to None.
+            scheduler (RequestScheduler, optional): Limits concurrent requests per host and retries failed requests.
+                                                    Defaults to a RequestScheduler with default settings.
+            config (ConnectorConfig, optional): Settings of the session created when entering the context.
+                                                Defaults to ConnectorConfig().
+            session (aiohttp.ClientSession, optional): Long-lived session to use instead of creating one when entering
+                                                       the context, it is not closed when leaving the context.
+                                                       Should be created with create_session. Defaults to None.
+            replay_dir (str, optional): Directory of recorded responses to answer from instead of sending requests,
+                                        see corona.replay. Defaults to the environment variable CORONA_REPLAY_DIR.
+            record_dir (str, optional): Directory to record the responses into, see corona.replay.
+                                        Defaults to the environment variable CORONA_RECORD_DIR.
+            decoder (JsonDecoder, optional): Decodes the json answers, see corona.json_decoder.
+                                             Defaults to the fastest installed decoder.
+            memo_ttl (float, optional): Concurrent calls loading the same data share one request and its result, see
+                                        corona.single_flight. Seconds the results also answer later calls, 0 only
+                                        shares calls in flight. Defaults to 0.
+        """
         fields = (
             "OBJECTID",
             "GEN",
@@ -38,11 +121,27 @@ class Connector:
             f"RKI_Landkreisdaten/FeatureServer/0/query?where=OBJECTID={{}}&outFields={fieldstr}"
             "&returnGeometry=false&outSR=&f=json"
         )
+        self.url_ids = (
+            "https://services7.arcgis.com/mOBPykOjAyBO2ZKk/arcgis/rest/services/"
+            f"RKI_Landkreisdaten/FeatureServer/0/query?where=OBJECTID IN ({{}})&outFields={fieldstr}"
+            "&returnGeometry=false&outSR=&f=json"
+        )
         self.url_all = (
             "https://services7.arcgis.com/mOBPykOjAyBO2ZKk/arcgis/rest/services/"
             f"RKI_Landkreisdaten/FeatureServer/0/query?where=1=1&outFields={fieldstr}"
             "&returnGeometry=false&outSR=&f=json"
         )
+        self.url_count = (
+            "https://services7.arcgis.com/mOBPykOjAyBO2ZKk/arcgis/rest/services/"
+            "RKI_Landkreisdaten/FeatureServer/0/query?where=1=1&returnCountOnly=true&f=json"
+        )
+        # distinct last updates of all Landkreise, a small answer to check whether the data changed
+        self.url_updates = (
+            "https://services7.arcgis.com/mOBPykOjAyBO2ZKk/arcgis/rest/services/"
+            "RKI_Landkreisdaten/FeatureServer/0/query?where=1=1&outFields=last_update&returnDistinctValues=true"
+            "&returnGeometry=false&f=json"
+        )
+        self.url_page = f"{self.url_all}&orderByFields=OBJECTID&resultOffset={{}}&resultRecordCount={{}}"
         excel_urls = "https://www.rki.de/DE/Content/InfAZ/N/Neuartiges_Coronavirus/Daten/"
         self.url_excel = f"{excel_urls}Fallzahlen_Inzidenz_aktualisiert.xlsx?__blob=publicationFile"
         self.url_excel_fixed = f"{excel_urls}Fallzahlen_Kum_Tab_aktuell.xlsx?__blob=publicationFile"
@@ -53,7 +152,19 @@ class Connector:
             "rki_key_data_v/FeatureServer/0/query?f=json&where=ObjectId=1&returnGeometry=false&outFields=Inz7T"
         )
         self._session = None
+        self._shared_session = session
+        self.config = ConnectorConfig() if config is None else config
         self.proxy = os.getenv("HTTP_PROXY")
+        self.cache = cache
+        self.scheduler = RequestScheduler() if scheduler is None else scheduler
+        replay_dir = os.getenv(REPLAY_DIR_ENV) if replay_dir is None else replay_dir
+        record_dir = os.getenv(RECORD_DIR_ENV) if record_dir is None else record_dir
+        if replay_dir and record_dir:
+            raise ValueError("Responses can not be replayed and recorded at the same time")
+        self.replay = ResponseDirectory(replay_dir) if replay_dir else None
+        self.recorder = ResponseDirectory(record_dir) if record_dir else None
+        self.decoder = create_decoder() if decoder is None else decoder
+        self.single_flight = SingleFlight(memo_ttl)
 
     @classmethod
     def parse_answer(cls, response_json) -> CasesResult:
@@ -74,42 +185,268 @@ class Connector:
             result.append(CasesResult(bereich, county, cases7_per_100k, last_update, region_id))
         return result
 
-    def get(self, url):
+    @contextlib.asynccontextmanager
+    async def get(self, url, headers: Optional[dict[str, str]] = None) -> AsyncIterator[aiohttp.ClientResponse]:
         if self._session is None:
             raise RuntimeError("Context was never opend")
-        return self._session.get(url, proxy=self.proxy)
+        host = urlsplit(url).netloc
+        attempts = 0
+        async with contextlib.AsyncExitStack() as stack:
 
-    async def get_case(self, landkreis: Landkreise) -> CasesResult:
-        url = self.url.format(landkreis.id)
-        LOG.info("Url: '%s'", url)
+            async def request() -> aiohttp.ClientResponse:
+                nonlocal attempts
+                if attempts:
+                    HTTP_RETRIES.inc(host=host)
+                attempts += 1
+                status = "error"
+                start = time.perf_counter()
+                try:
+                    response = await stack.enter_async_context(
+                        self._session.get(url, proxy=self.proxy, headers=headers)
+                    )
+                    status = response.status
+                    return response
+                except aiohttp.ClientResponseError as err:
+                    status = err.status
+                    raise
+                finally:
+                    HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, host=host, status=status)
+                    HTTP_REQUESTS.inc(host=host, status=status)
+
+            response = await self.scheduler.run(request, url)
+            yield response
+            if isinstance(size := getattr(response.content, "total_bytes", None), int):
+                HTTP_RESPONSE_BYTES.inc(size, host=host)
+
+    async def _read(self, url: str) -> bytes:
         async with self.get(url) as response:
-            response_json = await response.json(encoding="utf-8")
+            return await response.read()
+
+    async def _get_json(self, url: str, name: str) -> dict:
+        """Requests url, or replays the recorded response name. Records the response as name if recording."""
+        if self.replay is not None:
+            return self.replay.read_json(name)
+        response_json = self.decoder.loads(await self._read(url))
+        if self.recorder is not None:
+            self.recorder.write_json(name, response_json)
+        return response_json
+
+    async def _get_cases(self, url: str, factory: Callable[..., T] = CasesResult) -> tuple[list[T], bool]:
+        """Requests url and decodes the features of the answer with factory, see JsonDecoder.decode_cases, without
+        building dicts if the decoder supports it. Returns the results and whether exceededTransferLimit is set."""
+        LOG.info("Url: '%s'", url)
+        return self.decoder.decode_cases(await self._read(url), factory)
+
+    def _record_cases(self, results: list[CasesResult]) -> None:
+        if self.recorder is not None:
+            self.recorder.write_cases({"features": cases_to_features(results)})
+
+    @coalesced(lambda self, landkreis: landkreis.id)
+    @profiled()
+    async def get_case(self, landkreis: Landkreise) -> CasesResult:
+        if self.replay is not None:
+            results = self.parse_answer_all(self.replay.cases_json((landkreis.id,)))
+        else:
+            results, _ = await self._get_cases(self.url.format(landkreis.id))
+            self._record_cases(results)
         LOG.debug("%i loaded", landkreis.id)
-        response = self.parse_answer(response_json)
+        if len(results) != 1:
+            raise RuntimeError(f"length of results does not match, expected 1 and got {len(results)}")
+        self._check_case(landkreis, results[0])
+        return results[0]
+
+    @staticmethod
+    def _check_case(landkreis: Landkreise, response: CasesResult) -> None:
         if response.county != landkreis.lk_name:
             raise RuntimeError(f"Wrong lk_name was returned: requested {landkreis.lk_name}, returned {response.county}")
         if response.region_id != landkreis.id:
             raise RuntimeError(f"Wrong id was returned: requested {landkreis.id}, returned {response.region_id}")
-        return response
+
+    @coalesced(lambda self, landkreise: tuple(landkreis.id for landkreis in landkreise))
+    @profiled(rows=len)
+    async def get_cases_chunk(self, landkreise: Sequence[Landkreise]) -> list[CasesResult]:
+        """Loads all landkreise with a single request
+
+        Args:
+            landkreise (Sequence[Landkreise]): Landkreise to load, should not be more than MAX_IDS_PER_REQUEST
+
+        Returns:
+            list[CasesResult]: Results in the same order as landkreise
+        """
+        if self.replay is not None:
+            cases = self.parse_answer_all(self.replay.cases_json(landkreis.id for landkreis in landkreise))
+        else:
+            url = self.url_ids.format(",".join(str(landkreis.id) for landkreis in landkreise))
+            cases, exceeded = await self._get_cases(url)
+            if exceeded:
+                raise RuntimeError(f"Too many ids requested at once: {len(landkreise)}")
+            self._record_cases(cases)
+        results = {result.region_id: result for result in cases}
+        LOG.debug("%i loaded", len(results))
+        ordered_results = []
+        for landkreis in landkreise:
+            if (result := results.get(landkreis.id)) is None:
+                raise RuntimeError(f"No result was returned for id {landkreis.id}")
+            self._check_case(landkreis, result)
+            ordered_results.append(result)
+        return ordered_results
 
     async def get_cases(
-        self, landkreise: Iterable[Landkreise], force_order: bool = False
+        self, landkreise: Iterable[Landkreise], force_order: bool = False, bulk: bool = False
     ) -> AsyncIterable[CasesResult]:
-        tasks = tuple(map(asyncio.create_task, map(self.get_case, landkreise)))
+        """Loads the cases of landkreise concurrently
+
+        Args:
+            landkreise (Iterable[Landkreise]): Landkreise to load
+            force_order (bool, optional): If True results are yielded in order of landkreise, otherwise as soon as they
+                                          are loaded. Defaults to False.
+            bulk (bool, optional): If True up to MAX_IDS_PER_REQUEST landkreise are loaded with a single request,
+                                   otherwise every landkreis is loaded with its own request. Defaults to False.
+
+        Yields:
+            CasesResult: Result of each landkreis
+        """
+        if bulk:
+            landkreise = tuple(landkreise)
+            chunks = (landkreise[i : i + MAX_IDS_PER_REQUEST] for i in range(0, len(landkreise), MAX_IDS_PER_REQUEST))
+            tasks = tuple(map(asyncio.create_task, map(self.get_cases_chunk, chunks)))
+        else:
+            tasks = tuple(map(asyncio.create_task, map(self.get_case, landkreise)))
         if not force_order:
             tasks = asyncio.as_completed(tasks)
         for task in tasks:
-            yield await task
+            if bulk:
+                for result in await task:
+                    yield result
+            else:
+                yield await task
+
+    async def get_count(self) -> int:
+        """Returns the amount of features of get_all_cases"""
+        return self.decoder.loads(await self._read(self.url_count))["count"]
+
+    @coalesced()
+    async def get_updates(self) -> frozenset[str]:
+        """Returns the distinct last_update of all Landkreise. Changes once the RKI published new data, without loading
+        the cases. If replaying, the last updates of the recorded Landkreise are returned."""
+        if self.replay is not None:
+            return frozenset(feature["attributes"]["last_update"] for feature in self.replay.all_features())
+        response_json = self.decoder.loads(await self._read(self.url_updates))
+        return frozenset(feature["attributes"]["last_update"] for feature in response_json["features"])
+
+    async def get_page(self, offset: int, count: int, factory: Callable[..., T] = CasesResult) -> list[T]:
+        """Returns the cases of the features offset to offset + count in OBJECTID order, decoded with factory. If the
+        server cuts the page at its maxRecordCount, signaled by exceededTransferLimit, the rest is requested until the
+        page is complete."""
+        results = []
+        while count > 0:
+            page, exceeded = await self._get_cases(self.url_page.format(offset, count), factory)
+            results.extend(page)
+            if not page or not exceeded:
+                break
+            offset += len(page)
+            count -= len(page)
+        return results
+
+    async def iter_all_pages(
+        self, page_size: int = PAGE_SIZE, factory: Callable[..., T] = CasesResult
+    ) -> AsyncIterator[list[T]]:
+        """Loads the cases of all Landkreise. Once their amount is known, all pages are requested concurrently.
+
+        Args:
+            page_size (int, optional): Features per page. Defaults to PAGE_SIZE.
+            factory (Callable[..., T], optional): Called with the attributes of every feature in the order of the
+                                                  fields of CasesResult, see JsonDecoder.decode_cases.
+                                                  Defaults to CasesResult.
+
+        Yields:
+            list[T]: Results of factory of each page, as soon as the page is loaded
+        """
+        if self.replay is not None:
+            yield decode_features(self.replay.read_json(ALL_CASES)["features"], factory)
+            return
+        # recording needs the CasesResults to write all.json at the end
+        page_factory = CasesResult if self.recorder is not None else factory
+        count = await self.get_count()
+        tasks = [
+            asyncio.create_task(self.get_page(offset, page_size, page_factory)) for offset in range(0, count, page_size)
+        ]
+        results = []
+        try:
+            for task in asyncio.as_completed(tasks):
+                page = await task
+                LOG.debug("Loaded page of %i features", len(page))
+                if self.recorder is not None:
+                    results.extend(page)
+                    page = [factory(*result) for result in page]
+                yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+        if self.recorder is not None:
+            results.sort(key=lambda result: result.region_id)
+            self.recorder.write_json(ALL_CASES, {"features": cases_to_features(results)})
+
+    async def iter_all_cases(self, page_size: int = PAGE_SIZE) -> AsyncIterator[CasesResult]:
+        """Loads the cases of all Landkreise, see iter_all_pages.
+
+        Yields:
+            CasesResult: Result of each Landkreis, page by page as soon as a page is loaded
+        """
+        async for page in self.iter_all_pages(page_size):
+            for result in page:
+                yield result
 
+    @coalesced()
+    @profiled(rows=len)
     async def get_all_cases(self) -> list[CasesResult]:
-        async with self.get(self.url_all) as response:
-            response_json = await response.json()
-        LOG.debug("Loaded: %s", str(response_json))
-        return self.parse_answer_all(response_json)
+        """Returns the cases of all Landkreise in OBJECTID order, see iter_all_cases"""
+        # a feature might be in two pages, if the features changed while loading them
+        results = {result.region_id: result async for result in self.iter_all_cases()}
+        return [results[region_id] for region_id in sorted(results)]
 
-    async def _fetch_binary(self, url):
-        async with self.get(url) as response:
-            return await response.read()
+    @coalesced()
+    @profiled(size=len)
+    @timed(FETCH_BINARY_SECONDS)
+    async def _fetch_binary(self, url, max_age: Optional[float] = None) -> bytes:
+        """Downloads url. If a cache is configured, a fresh cached file is returned without any request, a stale one
+        is revalidated with If-None-Match/If-Modified-Since and served from disk if the server answers 304.
+        If replaying, the recorded file is returned instead. If recording, the content is recorded.
+
+        Args:
+            url (str): Url to download
+            max_age (float, optional): Seconds a cached file is considered fresh. Defaults to the max_age of the cache.
+
+        Returns:
+            bytes: Content of the file
+        """
+        if self.replay is not None:
+            return self.replay.read(excel_name(url))
+        content = await self._fetch_binary_cached(url, max_age)
+        if self.recorder is not None:
+            self.recorder.write(excel_name(url), content)
+        return content
+
+    async def _fetch_binary_cached(self, url, max_age: Optional[float] = None) -> bytes:
+        if self.cache is None:
+            async with self.get(url) as response:
+                return await response.read()
+
+        entry = self.cache.get(url)
+        if entry is not None and self.cache.is_fresh(entry, max_age):
+            LOG.debug("Serving '%s' from cache", url)
+            CACHE_REQUESTS.inc(cache="http", result="hit")
+            return entry.content
+        async with self.get(url, self.cache.revalidation_headers(entry)) as response:
+            if response.status == 304 and entry is not None:
+                LOG.debug("'%s' not modified, serving from cache", url)
+                CACHE_REQUESTS.inc(cache="http", result="revalidated")
+                self.cache.touch(url)
+                return entry.content
+            CACHE_REQUESTS.inc(cache="http", result="miss")
+            content = await response.read()
+            self.cache.put(url, content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return content
 
     async def get_excel(self):
         return await self._fetch_binary(self.url_excel)
@@ -118,20 +455,55 @@ class Connector:
         return await self._fetch_binary(self.url_excel_fixed)
 
     async def get_excel_fixed_archive(self):
-        return await self._fetch_binary(self.url_excel_fixed_archive)
+        # the archive does not change anymore, so there is no need to ever revalidate it
+        return await self._fetch_binary(self.url_excel_fixed_archive, math.inf)
 
+    @coalesced()
     async def get_germany(self):
-        async with self.get(self.url_germany) as response:
-            result = await response.json()
+        result = await self._get_json(self.url_germany, GERMANY)
         return result["features"][0]["attributes"]["Inz7T"]
 
+    @staticmethod
+    def create_session(config: Optional[ConnectorConfig] = None) -> aiohttp.ClientSession:
+        """Creates a session with a connection pool tuned by config, which can be shared by multiple Connectors.
+        Must be called with a running event loop.
+
+        Args:
+            config (ConnectorConfig, optional): Settings of the session. Defaults to ConnectorConfig().
+
+        Returns:
+            aiohttp.ClientSession: New session
+        """
+        config = ConnectorConfig() if config is None else config
+        resolver = None
+        if config.use_aiodns and importlib.util.find_spec("aiodns") is not None:
+            resolver = aiohttp.AsyncResolver()
+        connector = aiohttp.TCPConnector(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            keepalive_timeout=config.keepalive_timeout,
+            ttl_dns_cache=config.ttl_dns_cache,
+            resolver=resolver,
+        )
+        headers = {"Accept-Encoding": "gzip, deflate" if config.compress else "identity"}
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=config.timeout),
+            raise_for_status=True,
+        )
+
     async def __aenter__(self) -> "Connector":
-        self._session = aiohttp.ClientSession(raise_for_status=True)
+        if self._shared_session is not None:
+            self._session = self._shared_session
+            return self
+        self._session = self.create_session(self.config)
         await self._session.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         if self._session is None:
             raise RuntimeError("__aexit__ called without __aenter__ before")
-        await self._session.__aexit__(exc_type, exc_val, exc_tb)
+        if self._session is not self._shared_session:
+            await self._session.__aexit__(exc_type, exc_val, exc_tb)
         self._session = None
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, TypeVar
+from urllib.parse import urlsplit
+
+import aiohttp
+
+LOG = logging.getLogger(__name__)
+T = TypeVar("T")
+
+# Request Timeout, Too Many Requests and the typical errors of an overloaded server or proxy
+RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+class RequestScheduler:
+    """Limits the concurrent requests per host and retries failed requests with exponential backoff and jitter."""
+
+    def __init__(
+        self,
+        limit_per_host: int = 10,
+        retries: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        deadline: Optional[float] = 120,
+    ):
+        """Inits the scheduler.
+
+        Args:
+            limit_per_host (int, optional): Max concurrent requests per host. Defaults to 10.
+            retries (int, optional): Max retries of a request, 0 disables retrying. Defaults to 4.
+            backoff (float, optional): Max delay in seconds before the first retry, doubles with every retry.
+                                       Defaults to 0.5.
+            max_backoff (float, optional): Upper limit for the delay between retries in seconds. Defaults to 30.
+            deadline (float, optional): Max seconds for a request including waiting and all retries.
+                                        None disables the deadline. Defaults to 120.
+        """
+        self.limit_per_host = limit_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def slot(self, url: str) -> asyncio.Semaphore:
+        """Returns the semaphore limiting the concurrent requests to the host of url"""
+        host = urlsplit(url).netloc
+        if (semaphore := self._semaphores.get(host)) is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.limit_per_host)
+        return semaphore
+
+    @staticmethod
+    def is_retryable(error: BaseException) -> bool:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in RETRY_STATUSES
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """Returns the seconds to wait requested by the Retry-After header of the response, if there is any"""
+        headers = getattr(error, "headers", None)
+        if not headers or not (value := headers.get("Retry-After")):
+            return None
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def delay(self, attempt: int, error: BaseException) -> float:
+        """Returns the seconds to wait before retry number attempt (starting with 0), at most max_backoff"""
+        if (retry_after := self.retry_after(error)) is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))  # full jitter
+
+    async def _attempt(self, request: Callable[[], Awaitable[T]], url: str) -> T:
+        async with self.slot(url):
+            return await request()
+
+    async def run(self, request: Callable[[], Awaitable[T]], url: str = "") -> T:
+        """Awaits request and retries it on retryable errors until retries or the deadline are exceeded.
+        Every attempt takes a slot of the host of url, it is released while waiting for the retry.
+
+        Args:
+            request (Callable[[], Awaitable[T]]): Creates the awaitable doing the request, called for every attempt
+            url (str, optional): Url of the request, used for the slot and logging. Defaults to "".
+
+        Returns:
+            T: Result of the first successful request
+        """
+        deadline_at = None if self.deadline is None else time.monotonic() + self.deadline
+        attempt = 0
+        while True:
+            timeout = None if deadline_at is None else max(0.0, deadline_at - time.monotonic())
+            try:
+                return await asyncio.wait_for(self._attempt(request, url), timeout)
+            except Exception as err:
+                if attempt >= self.retries or not self.is_retryable(err):
+                    raise
+                delay = self.delay(attempt, err)
+                if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+                    raise
+                LOG.warning("Request '%s' failed (%s), retry %i in %.2f s", url, err, attempt + 1, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
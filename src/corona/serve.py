@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+import math
+import time
+from collections.abc import Collection
+from typing import Optional
+
+import asyncclick as click
+import pandas as pd
+from aiohttp import web
+
+from corona.cache import FrameCache, HttpCache
+from corona.history import _get_excel_param, read_sheets
+from corona.landkreise import DEUTSCHLAND, Landkreise
+from corona.metrics import CONTENT_TYPE, REGISTRY
+from corona.rki_connector import CasesResult, Connector
+from corona.snapshot import get_snapshot
+from corona.store import Store
+
+LOG = logging.getLogger(__name__)
+
+
+def _to_json(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _to_list(values: Collection[float]) -> list[Optional[float]]:
+    return [None if math.isnan(value) else value for value in values]
+
+
+class ServeState:
+    """Keeps the latest data in memory, prepared to answer requests with lookups only"""
+
+    def __init__(self):
+        self.today_body: Optional[bytes] = None
+        self.today_by_id: dict[int, bytes] = {}
+        self.history_dates: list[str] = []
+        self.history_by_id: dict[int, list[Optional[float]]] = {}
+        self.history_laender: dict[str, list[Optional[float]]] = {}
+        self.updated: dict[str, float] = {}
+
+    def set_today(self, cases: Collection[CasesResult], germany: Optional[float] = None) -> None:
+        rows = [case._asdict() for case in sorted(cases, key=lambda case: case.region_id)]
+        self.today_by_id = {row["region_id"]: _to_json(row) for row in rows}
+        self.today_body = _to_json({"germany": germany, "regions": rows})
+        self.updated["today"] = time.time()
+
+    def set_history(self, sheets: dict[str, pd.DataFrame], fixed_values: bool = False) -> None:
+        sheet_names, _ = _get_excel_param(fixed_values, False)
+        df_lk = sheets[sheet_names[0]]
+        df_bl = sheets[sheet_names[1]].reindex(columns=df_lk.columns)
+        history_by_id = {}
+        for lk_name, values in zip(df_lk.index, df_lk.to_numpy().tolist()):
+            if (landkreis := Landkreise.find_by_lk_name(lk_name)) is not None:
+                history_by_id[landkreis.id] = _to_list(values)
+        self.history_laender = {
+            DEUTSCHLAND if land == "Gesamt" else land: _to_list(values)
+            for land, values in zip(df_bl.index, df_bl.to_numpy().tolist())
+        }
+        self.history_by_id = history_by_id
+        self.history_dates = [date.strftime("%Y-%m-%d") for date in df_lk.columns]
+        self.updated["history"] = time.time()
+
+    def history(self, landkreise: Collection[Landkreise], days: int) -> dict:
+        """Returns the last days of the inzidenz history of landkreise, their Bundeslaender and Deutschland"""
+        days = len(self.history_dates) if days <= 0 else days
+        laender = sorted({lk.land for lk in landkreise if lk.land}) + [DEUTSCHLAND]
+        return {
+            "dates": self.history_dates[-days:],
+            "regions": [
+                {"region_id": lk.id, "name": lk.name, "values": self.history_by_id[lk.id][-days:]}
+                for lk in landkreise
+                if lk.id in self.history_by_id
+            ],
+            "laender": {land: self.history_laender[land][-days:] for land in laender if land in self.history_laender},
+        }
+
+
+def create_app(state: ServeState) -> web.Application:
+    def json_response(body: bytes) -> web.Response:
+        return web.Response(body=body, content_type="application/json", charset="utf-8")
+
+    def not_loaded() -> web.Response:
+        return web.json_response({"error": "data is not loaded yet"}, status=503)
+
+    async def today(request: web.Request) -> web.Response:
+        return not_loaded() if state.today_body is None else json_response(state.today_body)
+
+    async def today_region(request: web.Request) -> web.Response:
+        if state.today_body is None:
+            return not_loaded()
+        try:
+            body = state.today_by_id[int(request.match_info["region_id"])]
+        except (KeyError, ValueError):
+            return web.json_response({"error": "unknown region_id"}, status=404)
+        return json_response(body)
+
+    async def history(request: web.Request) -> web.Response:
+        if not state.history_dates:
+            return not_loaded()
+        try:
+            ids = [int(region_id) for region_id in request.query.get("ids", "").split(",") if region_id]
+            landkreise = Landkreise.find_by_ids(ids)
+            days = int(request.query.get("days", 8))
+        except ValueError as err:
+            return web.json_response({"error": str(err)}, status=400)
+        return json_response(_to_json(state.history(landkreise, days)))
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({"updated": state.updated})
+
+    async def metrics(request: web.Request) -> web.Response:
+        return web.Response(body=REGISTRY.expose().encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+    app = web.Application()
+    app.router.add_get("/today", today)
+    app.router.add_get("/today/{region_id}", today_region)
+    app.router.add_get("/history", history)
+    app.router.add_get("/health", health)
+    app.router.add_get("/metrics", metrics)
+    return app
+
+
+async def refresh(
+    state: ServeState, con: Connector, frame_cache: Optional[FrameCache] = None, store: Optional[Store] = None
+) -> None:
+    loop = asyncio.get_running_loop()
+    cases, germany = await asyncio.gather(get_snapshot(con), con.get_germany())
+    state.set_today(cases, germany)
+    if store is not None:
+        # writing to the database and parsing take a while, do not block answering requests meanwhile
+        await loop.run_in_executor(None, store.add_snapshot, cases, germany)
+    excel = await con.get_excel()
+    sheets = await loop.run_in_executor(None, read_sheets, excel, False, False, frame_cache)
+    state.set_history(sheets)
+
+
+async def refresh_forever(
+    state: ServeState,
+    con: Connector,
+    interval: float,
+    frame_cache: Optional[FrameCache] = None,
+    store: Optional[Store] = None,
+) -> None:
+    while True:
+        try:
+            await refresh(state, con, frame_cache, store)
+            LOG.info("Data refreshed")
+        except Exception:
+            LOG.exception("Refreshing the data failed, keeping the old data")
+        await asyncio.sleep(interval)
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8080, interval: float = 900, record: bool = False) -> None:
+    """Serves the data as json until cancelled, refreshes it every interval seconds.
+    If record is set, the current values are recorded in the Store for history with every refresh."""
+    state = ServeState()
+    store = Store() if record else None
+    async with Connector(HttpCache(max_age=interval)) as con:
+        refresh_task = asyncio.create_task(refresh_forever(state, con, interval, FrameCache(), store))
+        runner = web.AppRunner(create_app(state))
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+            print(f"Serving on http://{host}:{port}")
+            await asyncio.Event().wait()
+        finally:
+            refresh_task.cancel()
+            await runner.cleanup()
+            if store is not None:
+                store.close()
+
+
+@click.command("serve")
+@click.option("--host", default="127.0.0.1", help="Address to listen on. Defaults to 127.0.0.1.")
+@click.option("-p", "--port", type=int, default=8080, help="Port to listen on. Defaults to 8080.")
+@click.option("--interval", type=float, default=900, help="Seconds between refreshing the data. Defaults to 900.")
+@click.option(
+    "-r", "--record", is_flag=True, default=False, help="Records the current values for history with every refresh."
+)
+async def serve_wrapped(host: str = "127.0.0.1", port: int = 8080, interval: float = 900, record: bool = False) -> None:
+    """Corona Inzidenzzahlen als HTTP Server mit JSON Endpunkten"""
+    await serve(host, port, interval, record)
@@ -0,0 +1,95 @@
+"""Coalescing of concurrent calls for the same data, e.g. when several requests of 'corona serve' or tasks of one
+process load the same url at the same time.
+
+Concurrent calls with the same key share a single call and its result. Optionally the results are kept for a short
+time, so calls shortly after are answered without any request. Every caller gets a shallow copy of the result, so
+a caller sorting or extending a list does not change the result of the others. The items are shared, the results of
+the Connector are lists of immutable namedtuples.
+"""
+import asyncio
+import copy
+import functools
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Optional, TypeVar
+
+from corona.metrics import COALESCED_CALLS
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, ttl: float = 0):
+        """Inits the SingleFlight.
+
+        Args:
+            ttl (float, optional): Seconds a successful result answers further calls with the same key,
+                                   0 only shares calls in flight. Defaults to 0.
+        """
+        self.ttl = ttl
+        self._flights: dict[Hashable, _Flight] = {}
+        self._memo: dict[Hashable, tuple[float, object]] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Returns a shallow copy of the result of func, or of the call with the same key in flight or memorized.
+        The call is cancelled once all of its callers are cancelled."""
+        if (entry := self._memo.get(key)) is not None:
+            expires, result = entry
+            if time.monotonic() < expires:
+                COALESCED_CALLS.inc(result="memo")
+                return copy.copy(result)
+            del self._memo[key]
+        if (flight := self._flights.get(key)) is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(func()))
+            flight.task.add_done_callback(functools.partial(self._done, key, flight))
+        else:
+            COALESCED_CALLS.inc(result="joined")
+        flight.waiters += 1
+        try:
+            return copy.copy(await asyncio.shield(flight.task))
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _done(self, key: Hashable, flight: _Flight, task: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # retrieves the exception even without callers left, the callers get it from their shield
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.ttl > 0:
+            self._memo[key] = (time.monotonic() + self.ttl, task.result())
+
+    def clear(self) -> None:
+        """Forgets the memorized results, calls in flight are still shared"""
+        self._memo.clear()
+
+
+def coalesced(key: Optional[Callable[..., Hashable]] = None) -> Callable[[Callable], Callable]:
+    """Decorator of coroutine methods of objects with a SingleFlight as single_flight, sharing concurrent calls.
+
+    Args:
+        key (Callable, optional): Called with the arguments of the method, returns the key identifying the data, e.g.
+                                  the url. Defaults to the arguments themselves.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            call_key = key(self, *args, **kwargs) if key is not None else (args, tuple(sorted(kwargs.items())))
+            return await self.single_flight.run((func.__name__, call_key), lambda: func(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,235 @@
+"""Compact container for the cases of all Landkreise, e.g. for polling them repeatedly in a long running process.
+
+Region ids and values are kept in numpy arrays, names and last updates as indexes into a string table shared by all
+rows. Sorting, filtering and top-k run vectorized over these columns, rows are converted to CasesResult only when
+accessed. Imports numpy, the one-shot output of 'corona today' uses the list of Connector.get_all_cases instead.
+"""
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional, Union, overload
+
+import numpy as np
+
+from corona.json_decoder import decode_features
+from corona.profiling import profiled
+from corona.rki_connector import CasesResult, Connector
+
+
+class CasesSnapshot(Sequence):
+    """Sequence of CasesResult backed by numpy arrays. Sorting and filtering return new snapshots, which share the
+    columns and only keep the indexes of their rows."""
+
+    __slots__ = ("_region_ids", "_values", "_city_names", "_counties", "_updated", "_strings", "_rows", "_name_ranks")
+
+    def __init__(
+        self,
+        region_ids: np.ndarray,
+        values: np.ndarray,
+        city_names: np.ndarray,
+        counties: np.ndarray,
+        updated: np.ndarray,
+        strings: list[str],
+        rows: Optional[np.ndarray] = None,
+        name_ranks: Optional[np.ndarray] = None,
+    ):
+        """Inits the snapshot, use from_json, from_results or SnapshotBuilder to create one.
+
+        Args:
+            region_ids (np.ndarray): OBJECTID of every row
+            values (np.ndarray): cases7_per_100k of every row, NaN if unknown
+            city_names (np.ndarray): Index of the city name in strings of every row
+            counties (np.ndarray): Index of the county in strings of every row
+            updated (np.ndarray): Index of the last update in strings of every row
+            strings (list[str]): String table
+            rows (np.ndarray, optional): Indexes of the rows of this snapshot in the columns. Defaults to all rows.
+            name_ranks (np.ndarray, optional): Rank of every string in alphabetical order, computed by sort_by_name
+                                               if None. Defaults to None.
+        """
+        self._region_ids = region_ids
+        self._values = values
+        self._city_names = city_names
+        self._counties = counties
+        self._updated = updated
+        self._strings = strings
+        self._rows = np.arange(len(region_ids)) if rows is None else rows
+        self._name_ranks = name_ranks
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, Optional[float], str, int]]) -> "CasesSnapshot":
+        """Creates a snapshot from rows in the order of the fields of CasesResult, see SnapshotBuilder"""
+        builder = SnapshotBuilder()
+        for row in rows:
+            builder.add(*row)
+        return builder.build()
+
+    @classmethod
+    def from_results(cls, results: Iterable[CasesResult]) -> "CasesSnapshot":
+        return cls.from_rows(results)
+
+    @classmethod
+    def from_features(cls, features: Iterable[dict]) -> "CasesSnapshot":
+        """Creates a snapshot from the features of answers of the FeatureServer, without creating CasesResults"""
+        builder = SnapshotBuilder()
+        decode_features(features, builder.add)
+        return builder.build()
+
+    @classmethod
+    def from_json(cls, response_json: dict) -> "CasesSnapshot":
+        """Creates a snapshot from an answer like Connector.parse_answer_all"""
+        return cls.from_features(response_json["features"])
+
+    @property
+    def region_ids(self) -> np.ndarray:
+        return self._region_ids[self._rows]
+
+    @property
+    def values(self) -> np.ndarray:
+        """cases7_per_100k of the rows, NaN if unknown"""
+        return self._values[self._rows]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _results(self, rows: np.ndarray) -> Iterator[CasesResult]:
+        strings = self._strings
+        columns = zip(
+            self._city_names[rows].tolist(),
+            self._counties[rows].tolist(),
+            self._values[rows].tolist(),
+            self._updated[rows].tolist(),
+            self._region_ids[rows].tolist(),
+        )
+        for city_name, county, value, updated, region_id in columns:
+            value = None if math.isnan(value) else value
+            yield CasesResult(strings[city_name], strings[county], value, strings[updated], region_id)
+
+    @overload
+    def __getitem__(self, index: int) -> CasesResult:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CasesSnapshot":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CasesResult, "CasesSnapshot"]:
+        if isinstance(index, slice):
+            return self._select(self._rows[index])
+        return next(self._results(self._rows[[index]]))
+
+    def __iter__(self) -> Iterator[CasesResult]:
+        return self._results(self._rows)
+
+    def __repr__(self) -> str:
+        return f"<CasesSnapshot of {len(self)} Landkreise>"
+
+    def _select(self, rows: np.ndarray) -> "CasesSnapshot":
+        columns = (self._region_ids, self._values, self._city_names, self._counties, self._updated)
+        return CasesSnapshot(*columns, self._strings, rows, self._name_ranks)
+
+    def _known_rows(self) -> np.ndarray:
+        return self._rows[~np.isnan(self._values[self._rows])]
+
+    def sort_by_value(self, descending: bool = False) -> "CasesSnapshot":
+        """Returns the rows sorted by cases7_per_100k, rows with unknown values last"""
+        known = self._known_rows()
+        values = self._values[known]
+        order = np.argsort(-values if descending else values, kind="stable")
+        unknown = self._rows[np.isnan(self._values[self._rows])]
+        return self._select(np.concatenate((known[order], unknown)))
+
+    def sort_by_name(self) -> "CasesSnapshot":
+        """Returns the rows sorted by city name, like today prints them"""
+        if self._name_ranks is None:
+            # computed once per string table and shared with the snapshots selected from this one
+            order = sorted(range(len(self._strings)), key=self._strings.__getitem__)
+            self._name_ranks = np.empty(len(order), dtype=np.intp)
+            self._name_ranks[order] = np.arange(len(order))
+        keys = self._name_ranks[self._city_names[self._rows]]
+        return self._select(self._rows[np.argsort(keys, kind="stable")])
+
+    def sort_by_region_id(self) -> "CasesSnapshot":
+        return self._select(self._rows[np.argsort(self._region_ids[self._rows], kind="stable")])
+
+    def filter(self, min_value: Optional[float] = None, max_value: Optional[float] = None) -> "CasesSnapshot":
+        """Returns the rows with min_value <= cases7_per_100k <= max_value, unknown values are dropped"""
+        values = self._values[self._rows]
+        mask = ~np.isnan(values)
+        if min_value is not None:
+            mask &= values >= min_value
+        if max_value is not None:
+            mask &= values <= max_value
+        return self._select(self._rows[mask])
+
+    def top(self, k: int) -> "CasesSnapshot":
+        """Returns the k rows with the highest cases7_per_100k, highest first"""
+        known = self._known_rows()
+        values = -self._values[known]
+        if 0 < k < len(known):
+            largest = np.argpartition(values, k - 1)[:k]
+            known, values = known[largest], values[largest]
+        elif k <= 0:
+            known, values = known[:0], values[:0]
+        return self._select(known[np.argsort(values, kind="stable")])
+
+    def nbytes(self) -> int:
+        """Returns the bytes of the columns and rows, without the shared string table"""
+        columns = (self._region_ids, self._values, self._city_names, self._counties, self._updated, self._rows)
+        return sum(column.nbytes for column in columns)
+
+
+class SnapshotBuilder:
+    """Appends rows to the columns of a snapshot. A row of a region id added already replaces the former one, e.g. if
+    the features changed while loading the pages of all Landkreise."""
+
+    def __init__(self):
+        self.region_ids, self.values = array("i"), array("d")
+        self.city_names, self.counties, self.updated = array("I"), array("I"), array("I")
+        self.strings: list[str] = []
+        self._indexes: dict[str, int] = {}
+        self._rows: dict[int, int] = {}
+
+    def _intern(self, string: str) -> int:
+        if (index := self._indexes.get(string)) is None:
+            index = self._indexes[string] = len(self.strings)
+            self.strings.append(string)
+        return index
+
+    def add(self, city_name: str, county: str, value: Optional[float], last_update: str, region_id: int) -> int:
+        """Adds a row in the order of the fields of CasesResult, usable as factory of JsonDecoder.decode_cases.
+        Returns the index of the row in the columns."""
+        value = math.nan if value is None else value
+        if (row := self._rows.get(region_id)) is None:
+            row = self._rows[region_id] = len(self.region_ids)
+            self.region_ids.append(region_id)
+            self.values.append(value)
+            self.city_names.append(self._intern(city_name))
+            self.counties.append(self._intern(county))
+            self.updated.append(self._intern(last_update))
+        else:
+            self.values[row] = value
+            self.city_names[row] = self._intern(city_name)
+            self.counties[row] = self._intern(county)
+            self.updated[row] = self._intern(last_update)
+        return row
+
+    def build(self) -> CasesSnapshot:
+        """Returns the snapshot of the rows in the order their region ids were added first. The columns are copied
+        into numpy arrays, the builder may add further rows afterwards."""
+        columns = (self.region_ids, self.values, self.city_names, self.counties, self.updated)
+        return CasesSnapshot(*(np.array(column) for column in columns), list(self.strings))
+
+
+async def get_snapshot(con: Connector) -> CasesSnapshot:
+    """Loads the cases of all Landkreise like Connector.get_all_cases into a snapshot, in OBJECTID order.
+    Concurrent calls with the same Connector share the snapshot."""
+    return await con.single_flight.run(("get_snapshot",), lambda: _load_snapshot(con))
+
+
+@profiled("get_snapshot", rows=len)
+async def _load_snapshot(con: Connector) -> CasesSnapshot:
+    builder = SnapshotBuilder()
+    # decodes the features of every page straight into the columns
+    async for _ in con.iter_all_pages(factory=builder.add):
+        pass
+    return builder.build().sort_by_region_id()
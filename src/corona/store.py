@@ -0,0 +1,256 @@
+"""Local store of inzidenz values.
+
+The RKI dashboard only returns the current inzidenz of the Landkreise. Recording it regularly builds up a history,
+which answers history requests for recent days without downloading and parsing the RKI excel files.
+The series of the fixed values of the RKI excel files are imported once, as the values do not change anymore.
+"""
+import logging
+import os
+import sqlite3
+import sys
+from collections import namedtuple
+from collections.abc import Collection, Iterable
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from corona.rki_connector import CasesResult
+
+LOG = logging.getLogger(__name__)
+# region_id of the inzidenz of Deutschland, the region_ids of the Landkreise start with 1
+DEUTSCHLAND_ID = 0
+Source = namedtuple("Source", ("name", "version", "first_date", "last_date", "values", "imported"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    region_id INTEGER NOT NULL,
+    updated TEXT NOT NULL,
+    date TEXT NOT NULL,
+    cases7_per_100k REAL,
+    PRIMARY KEY (region_id, updated)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS snapshots_date ON snapshots (date, region_id);
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    first_date TEXT,
+    last_date TEXT,
+    "values" INTEGER NOT NULL DEFAULT 0,
+    imported TEXT NOT NULL,
+    UNIQUE (name, version)
+);
+CREATE TABLE IF NOT EXISTS series (
+    kind TEXT NOT NULL,
+    region TEXT NOT NULL,
+    date TEXT NOT NULL,
+    value REAL NOT NULL,
+    source_id INTEGER NOT NULL REFERENCES sources (id),
+    PRIMARY KEY (kind, region, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS series_date ON series (kind, date);
+"""
+
+
+def user_data_dir() -> Path:
+    """Returns the directory for data which can not be downloaded again.
+    Can be overwritten with the environment variable CORONA_DATA_DIR
+
+    Returns:
+        Path: Data directory, might not exist yet
+    """
+    if data_dir := os.getenv("CORONA_DATA_DIR"):
+        return Path(data_dir)
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = os.getenv("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / "corona"
+
+
+def parse_last_update(last_update: str) -> datetime:
+    """Parses the last_update of the RKI dashboard, e.g. '27.04.2022, 00:00 Uhr'"""
+    return datetime.strptime(last_update, "%d.%m.%Y, %H:%M Uhr")
+
+
+class Store:
+    """SQLite database with the recorded values indexed by region_id and date
+    and the imported series indexed by kind, region and date"""
+
+    def __init__(self, path: Union[None, str, Path] = None):
+        """Inits the store, the database is created with the first write.
+
+        Args:
+            path (str|Path, optional): Path of the database. Defaults to 'inzidenz.sqlite3' in user_data_dir().
+        """
+        self.path = user_data_dir() / "inzidenz.sqlite3" if path is None else Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self, create: bool = False) -> Optional[sqlite3.Connection]:
+        """Returns the connection to the database, or None if it does not exist and create is False"""
+        if self._connection is None:
+            if not create and not self.path.exists():
+                return None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # used from the executor of 'corona serve' as well, but never concurrently
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def add_snapshot(self, cases: Iterable[CasesResult], germany: Optional[float] = None) -> int:
+        """Adds the results of Connector.get_all_cases. Values with an already known last_update are ignored.
+
+        Args:
+            cases (Iterable[CasesResult]): Current values of the Landkreise
+            germany (float, optional): Current value of Deutschland, stored with the last_update of cases.
+                                       Defaults to None.
+
+        Returns:
+            int: Amount of added values
+        """
+        rows = []
+        for case in cases:
+            updated = parse_last_update(case.updated)
+            rows.append((case.region_id, updated.isoformat(), updated.date().isoformat(), case.cases7_per_100k))
+        if not rows:
+            return 0
+        if germany is not None:
+            rows.append((DEUTSCHLAND_ID, *max(row[1:3] for row in rows), germany))
+        connection = self._connect(create=True)
+        with connection:
+            changes = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO snapshots VALUES (?, ?, ?, ?)", rows)
+            added = connection.total_changes - changes
+        LOG.debug("Added %i of %i values to '%s'", added, len(rows), self.path)
+        return added
+
+    def latest_date(self) -> Optional[date]:
+        """Returns the date of the newest recorded value, None if nothing is recorded"""
+        if (connection := self._connect()) is None:
+            return None
+        (latest,) = connection.execute("SELECT MAX(date) FROM snapshots").fetchone()
+        return None if latest is None else date.fromisoformat(latest)
+
+    def get_snapshots(self, region_ids: Collection[int], first: date, last: date) -> dict[int, dict[date, float]]:
+        """Returns the recorded values of region_ids between first and last (both included).
+        If there are multiple values of a day, the newest one is returned.
+
+        Args:
+            region_ids (Collection[int]): region_ids of the Landkreise, DEUTSCHLAND_ID for Deutschland
+            first (date): First date to return
+            last (date): Last date to return
+
+        Returns:
+            dict[int, dict[date, float]]: Values by date by region_id, regions without values are missing
+        """
+        result: dict[int, dict[date, float]] = {}
+        if not region_ids or (connection := self._connect()) is None:
+            return result
+        rows = connection.execute(
+            "SELECT region_id, date, cases7_per_100k FROM snapshots "
+            f"WHERE date BETWEEN ? AND ? AND region_id IN ({','.join('?' * len(region_ids))}) ORDER BY updated",
+            (first.isoformat(), last.isoformat(), *region_ids),
+        )
+        for region_id, day, value in rows:
+            result.setdefault(region_id, {})[date.fromisoformat(day)] = value
+        return result
+
+    def has_source(self, version: str) -> bool:
+        """Returns whether a source with this version was already imported, under any name, so a renamed file with
+        the same content is not imported again"""
+        if (connection := self._connect()) is None:
+            return False
+        query = "SELECT 1 FROM sources WHERE version = ?"
+        return connection.execute(query, (version,)).fetchone() is not None
+
+    def sources(self) -> list[Source]:
+        """Returns all imported sources, with the range of dates and the amount of values they added"""
+        if (connection := self._connect()) is None:
+            return []
+        query = 'SELECT name, version, first_date, last_date, "values", imported FROM sources ORDER BY id'
+        return [Source(*row) for row in connection.execute(query)]
+
+    def add_series(self, name: str, version: str, values: Iterable[tuple[str, str, date, float]]) -> int:
+        """Imports the values of a source. The store is append only, already stored values are not changed.
+
+        Args:
+            name (str): Name of the source, e.g. the file name
+            version (str): Version of the source, e.g. the hash of its content
+            values (Iterable[tuple[str, str, date, float]]): The values as (kind, region, date, value)
+
+        Returns:
+            int: Amount of added values, 0 if the version of the source was imported before
+        """
+        if self.has_source(version):
+            return 0
+        connection = self._connect(create=True)
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO sources (name, version, imported) VALUES (?, ?, ?)",
+                (name, version, datetime.now().isoformat(timespec="seconds")),
+            )
+            source_id = cursor.lastrowid
+            changes = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO series VALUES (?, ?, ?, ?, ?)",
+                ((kind, region, day.isoformat(), value, source_id) for kind, region, day, value in values),
+            )
+            added = connection.total_changes - changes
+            connection.execute(
+                "UPDATE sources SET first_date = (SELECT MIN(date) FROM series WHERE source_id = :id), "
+                'last_date = (SELECT MAX(date) FROM series WHERE source_id = :id), "values" = :values WHERE id = :id',
+                {"id": source_id, "values": added},
+            )
+        LOG.info("Imported %i values of '%s' into '%s'", added, name, self.path)
+        return added
+
+    def latest_series_date(self, kind: str) -> Optional[date]:
+        """Returns the newest date with imported values of kind, None if there are none"""
+        if (connection := self._connect()) is None:
+            return None
+        (latest,) = connection.execute("SELECT MAX(date) FROM series WHERE kind = ?", (kind,)).fetchone()
+        return None if latest is None else date.fromisoformat(latest)
+
+    def get_series(
+        self,
+        kind: str,
+        regions: Optional[Collection[str]] = None,
+        first: Optional[date] = None,
+        last: Optional[date] = None,
+    ) -> dict[str, dict[date, float]]:
+        """Returns the imported values of kind between first and last (both included).
+
+        Args:
+            kind (str): Kind of the values, e.g. the sheet they were imported from
+            regions (Collection[str], optional): Regions to return, None returns all. Defaults to None.
+            first (date, optional): First date to return, None starts with the first value. Defaults to None.
+            last (date, optional): Last date to return, None ends with the last value. Defaults to None.
+
+        Returns:
+            dict[str, dict[date, float]]: Values by date by region, regions without values are missing
+        """
+        result: dict[str, dict[date, float]] = {}
+        if (connection := self._connect()) is None:
+            return result
+        conditions = ["kind = ?", "date >= ?", "date <= ?"]
+        params = [kind, (first or date.min).isoformat(), (last or date.max).isoformat()]
+        if regions is not None:
+            conditions.append(f"region IN ({','.join('?' * len(regions))})")
+            params.extend(regions)
+        query = f"SELECT region, date, value FROM series WHERE {' AND '.join(conditions)}"
+        for region, day, value in connection.execute(query, params):
+            result.setdefault(region, {})[date.fromisoformat(day)] = value
+        return result
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "Store":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
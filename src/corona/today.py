@@ -1,18 +1,29 @@
 import asyncio
+import contextlib
 import logging
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from typing import AsyncIterable, Iterable, Optional
 
 import asyncclick as click
 
 from corona.landkreise import Landkreise
-from corona.rki_connector import CasesResult, Connector
+from corona.output import OUTPUT_FORMATS, check_output_format, create_writer, open_output, validate_output_format
+from corona.rki_connector import CASES_RESULT_TYPES, CasesResult, Connector
+from corona.store import Store
 
 LOG = logging.getLogger(__name__)
 
 
+def name_width(landkreise: Iterable[Landkreise]) -> int:
+    """Returns the width of the Landkreis column for the names of landkreise, known before any result arrives"""
+    return max((len(lk.name) for lk in landkreise), default=0)
+
+
 async def print_result_async(cities: AsyncIterable[CasesResult], column1_width: int = 20) -> None:
+    """Prints every result as soon as it arrives, the widths of the columns are fixed up front.
+    Longer names are printed completely, they shift the value of their row only."""
     date_string = None
+    column1_width = max(column1_width, len("Landkreis"))
     print_format = "{:" + str(column1_width) + "} {:>8}"
     async for city in cities:
         if date_string is None:
@@ -21,30 +32,9 @@ async def print_result_async(cities: AsyncIterable[CasesResult], column1_width:
             print(print_format.format("Landkreis", "Inzidenz"))
         elif not city.updated.startswith(date_string):
             raise RuntimeError("Different updated dates!")
-        print(print_format.format(city.city_name, f"{city.cases7_per_100k:3.2f}"))
-
-
-async def print_result_async2(result: AsyncIterable[CasesResult], print_id: bool = False) -> None:
-    to_print = []
-    date_string = None
-    async for city in result:
-        if date_string is None:
-            date_string = city.updated[:10]
-        elif not city.updated.startswith(date_string):
-            raise RuntimeError("Different updated dates!")
-        temp = []
-        if print_id:
-            temp.append(f"{city.county} ({city.region_id})")
-        else:
-            temp.append(city.city_name)
-        temp.append(f"{city.cases7_per_100k:3.2f}")
-        to_print.append(temp)
+        print(print_format.format(city.city_name, f"{city.cases7_per_100k:3.2f}"), flush=True)
     if date_string is None:
         print("Keine Daten verfügbar")
-    else:
-        print(f"Datum: {date_string}")
-        header = ["Landkreis", "Inzidenz"]
-        print_table(header, to_print)
 
 
 def print_result(result: Iterable[CasesResult], print_id: bool = False) -> None:
@@ -93,12 +83,109 @@ async def handle_context_manager(con_needs_opening: bool, con: Connector, coro_f
     return await coro_func(*args, **kwargs)
 
 
-async def get_and_print_landkreise_tasks(con, landkreise: Iterable[Landkreise], force_order: bool) -> None:
-    async_generator = con.get_cases(landkreise, force_order)
-    if force_order:
-        await print_result_async2(async_generator)
-    else:
-        await print_result_async(async_generator)
+async def get_all_cases(con: Connector, store: Optional[Store] = None) -> list[CasesResult]:
+    """Gets the cases of all Landkreise. If store is set, they are recorded in it together with Deutschland."""
+    if store is None:
+        return await con.get_all_cases()
+    result, germany = await asyncio.gather(con.get_all_cases(), con.get_germany())
+    added = store.add_snapshot(result, germany)
+    LOG.info("Recorded %i new values in '%s'", added, store.path)
+    return result
+
+
+async def get_and_print_landkreise_tasks(
+    con, landkreise: Iterable[Landkreise], force_order: bool, bulk: bool = True
+) -> None:
+    landkreise = tuple(landkreise)
+    await print_result_async(con.get_cases(landkreise, force_order, bulk), name_width(landkreise))
+
+
+async def get_and_write_landkreise_tasks(
+    con, landkreise: Iterable[Landkreise], force_order: bool, bulk: bool, output_format: str, output_file: Optional[str]
+) -> None:
+    """Writes every CasesResult as soon as it arrives, in output_format of corona.output"""
+    with open_output(output_file) as file, create_writer(
+        output_format, file, CasesResult._fields, CASES_RESULT_TYPES
+    ) as writer:
+        async for city in con.get_cases(landkreise, force_order, bulk):
+            writer.write(city)
+
+
+def write_result(result: Iterable[CasesResult], output_format: str, output_file: Optional[str] = None) -> None:
+    with open_output(output_file) as file, create_writer(
+        output_format, file, CasesResult._fields, CASES_RESULT_TYPES
+    ) as writer:
+        for city in result:
+            writer.write(city)
+
+
+def changed_cases(previous: Mapping[int, CasesResult], current: Iterable[CasesResult]) -> list[CasesResult]:
+    """Returns the results of current which are not in previous by region id, or whose value or update changed"""
+    changed = []
+    for city in current:
+        old = previous.get(city.region_id)
+        if old is None or old.cases7_per_100k != city.cases7_per_100k or old.updated != city.updated:
+            changed.append(city)
+    return changed
+
+
+async def watch(
+    con: Connector,
+    interval: float,
+    regions: Optional[Collection[Landkreise]] = None,
+    bulk: bool = True,
+    store: Optional[Store] = None,
+    output_format: str = "table",
+    output_file: Optional[str] = None,
+    polls: Optional[int] = None,
+) -> None:
+    """Polls every interval seconds and outputs the Landkreise whose values changed since the last poll, all of them
+    at the first poll. The cases are only loaded if the last updates of Connector.get_updates changed.
+
+    Args:
+        con (Connector): Opened Connector to poll with
+        interval (float): Seconds to wait between two polls
+        regions (Collection[Landkreise], optional): The Landkreise to watch, None watches all. Defaults to None.
+        bulk (bool, optional): Whether to get regions with one request. Defaults to True.
+        store (Store, optional): If set, the loaded values of all Landkreise are recorded in it. Defaults to None.
+        output_format (str, optional): Like today. Defaults to 'table'.
+        output_file (str, optional): File to write to, None writes to stdout. Defaults to None.
+        polls (int, optional): Stops after this many polls, None polls until cancelled. Defaults to None.
+    """
+    previous: dict[int, CasesResult] = {}
+    updates = None
+    poll = 0
+    with contextlib.ExitStack() as stack:
+        file = writer = None
+        if output_format != "table":
+            file = stack.enter_context(open_output(output_file))
+            writer = stack.enter_context(create_writer(output_format, file, CasesResult._fields, CASES_RESULT_TYPES))
+        while True:
+            try:
+                current_updates = await con.get_updates()
+                if current_updates == updates:
+                    LOG.info("No new data since the last poll")
+                else:
+                    if regions is None:
+                        results = await get_all_cases(con, store)
+                    else:
+                        results = [city async for city in con.get_cases(regions, False, bulk)]
+                    changed = sorted(changed_cases(previous, results), key=lambda city: city.city_name)
+                    LOG.info("%i of %i Landkreise changed", len(changed), len(results))
+                    previous = {city.region_id: city for city in results}
+                    updates = current_updates
+                    if writer is not None:
+                        for city in changed:
+                            writer.write(city)
+                        file.flush()
+                    elif changed:
+                        print_result(changed, regions is None)
+            except Exception:
+                LOG.exception("Polling failed, retrying with the next poll")
+            poll += 1
+            if polls is not None and poll >= polls:
+                break
+            await asyncio.sleep(interval)
 
 
 async def today(
@@ -106,10 +193,31 @@ async def today(
     all: bool = False,
     keep_order: bool = False,
     con: Optional[Connector] = None,
+    bulk: bool = True,
+    store: Optional[Store] = None,
+    output_format: str = "table",
+    output_file: Optional[str] = None,
+    watch_interval: Optional[float] = None,
 ) -> None:
-    """Corona Inzidenzzahlen von heute"""
+    """Corona Inzidenzzahlen von heute
+
+    Args:
+        landkreise_ids (Collection[int], optional): The Landkreise to get, DEFAULT_REGIONS if empty. Defaults to None.
+        all (bool, optional): Whether to get all Landkreise, ignores landkreise_ids. Defaults to False.
+        keep_order (bool, optional): Whether to output in the order of landkreise_ids. Defaults to False.
+        con (Connector, optional): Connector to use, opened if needed. Defaults to None.
+        bulk (bool, optional): Whether to get all Landkreise with one request. Defaults to True.
+        store (Store, optional): If set, the values of all Landkreise are recorded in it, implies all.
+                                 Defaults to None.
+        output_format (str, optional): 'table' prints a table, the other OUTPUT_FORMATS of corona.output write a row
+                                       per Landkreis to output_file. Defaults to 'table'.
+        output_file (str, optional): File to write to, None writes to stdout. Defaults to None.
+        watch_interval (float, optional): If set, polls every watch_interval seconds and only outputs the changed
+                                          Landkreise, see watch. Defaults to None.
+    """
+    check_output_format(output_format)
     regions = DEFAULT_REGIONS
-    if all:
+    if all or store is not None:
         regions = None
     elif landkreise_ids:
         regions = Landkreise.find_by_ids(landkreise_ids)
@@ -117,13 +225,42 @@ async def today(
     if con is None:
         con = Connector()
         con_needs_opening = True
-    if regions is None:
-        result = await handle_context_manager(con_needs_opening, con, con.get_all_cases)
-        sort_by_name = lambda city: city.city_name
-        result.sort(key=sort_by_name)
-        print_result(result, True)
+    if watch_interval is not None:
+        await handle_context_manager(
+            con_needs_opening,
+            con,
+            watch,
+            con,
+            watch_interval,
+            regions,
+            bulk,
+            store,
+            output_format,
+            output_file,
+        )
+    elif regions is None:
+        result = await handle_context_manager(con_needs_opening, con, get_all_cases, con, store)
+        result = sorted(result, key=lambda city: city.city_name)
+        if output_format == "table":
+            print_result(result, True)
+        else:
+            write_result(result, output_format, output_file)
+    elif output_format != "table":
+        await handle_context_manager(
+            con_needs_opening,
+            con,
+            get_and_write_landkreise_tasks,
+            con,
+            regions,
+            keep_order,
+            bulk,
+            output_format,
+            output_file,
+        )
     else:
-        await handle_context_manager(con_needs_opening, con, get_and_print_landkreise_tasks, con, regions, keep_order)
+        await handle_context_manager(
+            con_needs_opening, con, get_and_print_landkreise_tasks, con, regions, keep_order, bulk
+        )
     await asyncio.sleep(0.15)  # prevents "RuntimeError: Event loop is closed"
 
 
@@ -139,13 +276,78 @@ async def today(
 @click.option(
     "-o", "--keep_order", is_flag=True, default=False, help="Ausgabe ist in der selben Reihenfolge wie die IDs."
 )
+@click.option(
+    "--bulk/--single",
+    default=True,
+    help="Lädt alle Landkreise mit einer Anfrage statt mit einer Anfrage pro Landkreis. Standard ist --bulk.",
+)
+@click.option(
+    "-r",
+    "--record",
+    is_flag=True,
+    default=False,
+    help="Speichert die Inzidenzzahlen aller Landkreise lokal, damit history sie statt der Excel Dateien nutzen kann. "
+    "Beinhaltet -a.",
+)
+@click.option(
+    "-f",
+    "--output-format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    callback=validate_output_format,
+    help="'table' gibt eine Tabelle aus, 'jsonl', 'csv' und 'arrow' (benötigt pyarrow) eine Zeile pro Landkreis, "
+    "sobald sie geladen ist. Standard ist 'table'.",
+)
+@click.option("--output-file", help="Schreibt die Zeilen in diese Datei statt auf stdout.")
+@click.option(
+    "-w",
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Fragt regelmäßig ab und gibt nur die Landkreise aus, deren Werte sich geändert haben. Die Werte werden nur "
+    "geladen, wenn das RKI neue Daten veröffentlicht hat.",
+)
+@click.option(
+    "--interval",
+    type=float,
+    default=300,
+    help="Sekunden zwischen zwei Abfragen von --watch. Standard ist 300.",
+)
 async def today_wrapped(
     landkreise_ids: Optional[Collection[int]] = None,
     all: bool = False,
     keep_order: bool = False,
+    bulk: bool = True,
+    record: bool = False,
+    output_format: str = "table",
+    output_file: Optional[str] = None,
+    watch: bool = False,
+    interval: float = 300,
 ) -> None:
     """Corona Inzidenzzahlen von heute"""
-    await today(landkreise_ids, all, keep_order)
+    watch_interval = interval if watch else None
+    if not record:
+        await today(
+            landkreise_ids,
+            all,
+            keep_order,
+            bulk=bulk,
+            output_format=output_format,
+            output_file=output_file,
+            watch_interval=watch_interval,
+        )
+        return
+    with Store() as store:
+        await today(
+            landkreise_ids,
+            all,
+            keep_order,
+            bulk=bulk,
+            store=store,
+            output_format=output_format,
+            output_file=output_file,
+            watch_interval=watch_interval,
+        )
 
 
 DEFAULT_REGIONS = (
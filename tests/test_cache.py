@@ -0,0 +1,134 @@
+import math
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, NonCallableMock, patch
+
+import pandas as pd
+
+import corona.history as history
+from corona.cache import FrameCache, HttpCache
+from corona.landkreise import Landkreise
+from corona.rki_connector import Connector
+
+from .testing_utils import get_testdata_binary
+
+
+def create_binary_answer(content: bytes = b"", status: int = 200, headers=None):
+    result = NonCallableMock()
+    result.__aenter__ = AsyncMock(return_value=result)
+    result.__aexit__ = AsyncMock(return_value=False)
+    result.status = status
+    result.headers = headers or {}
+    result.read = AsyncMock(return_value=content)
+    return result
+
+
+class TestHttpCache(unittest.IsolatedAsyncioTestCase):
+    url = "https://example.org/file.xlsx"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(self.temp_dir.name, max_age=60)
+        self.con = Connector(self.cache)
+        self.con._session = NonCallableMock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.cache.get(self.url))
+        self.cache.put(self.url, b"content", '"etag"', "Wed, 21 Oct 2015 07:28:00 GMT")
+        entry = self.cache.get(self.url)
+        self.assertEqual(entry.content, b"content")
+        self.assertEqual(
+            self.cache.revalidation_headers(entry),
+            {"If-None-Match": '"etag"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        self.assertTrue(self.cache.is_fresh(entry))
+        self.assertFalse(self.cache.is_fresh(entry, 0))
+
+    def test_get_incomplete_meta(self):
+        self.cache.put(self.url, b"content")
+        _, meta_path = self.cache._paths(self.url)
+        for meta in ('{"size": 7}', '{"fetched": 0}', "{"):
+            with self.subTest(meta=meta):
+                meta_path.write_text(meta, "utf-8")
+                self.assertIsNone(self.cache.get(self.url))
+
+    def test_evict(self):
+        self.cache.max_size = 10
+        self.cache.put("https://example.org/1", b"123456")
+        time.sleep(0.01)
+        self.cache.put("https://example.org/2", b"123456")
+        self.assertIsNone(self.cache.get("https://example.org/1"))
+        self.assertEqual(self.cache.get("https://example.org/2").content, b"123456")
+
+    def test_clear(self):
+        self.cache.put(self.url, b"content")
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.url))
+
+    async def test_fetch_binary_stores(self):
+        answer = create_binary_answer(b"content", headers={"ETag": '"etag"'})
+        self.con._session.get = MagicMock(return_value=answer)
+        self.assertEqual(await self.con._fetch_binary(self.url), b"content")
+        self.assertEqual(self.cache.get(self.url).etag, '"etag"')
+        # fresh entries are served without a request
+        self.assertEqual(await self.con._fetch_binary(self.url), b"content")
+        self.con._session.get.assert_called_once()
+
+    async def test_fetch_binary_not_modified(self):
+        self.cache.put(self.url, b"content", '"etag"')
+        self.con._session.get = MagicMock(return_value=create_binary_answer(status=304))
+        self.assertEqual(await self.con._fetch_binary(self.url, 0), b"content")
+        self.assertEqual(self.con._session.get.call_args.kwargs["headers"], {"If-None-Match": '"etag"'})
+
+    async def test_fetch_binary_modified(self):
+        self.cache.put(self.url, b"content", '"etag"')
+        self.con._session.get = MagicMock(return_value=create_binary_answer(b"new", headers={"ETag": '"etag2"'}))
+        self.assertEqual(await self.con._fetch_binary(self.url, 0), b"new")
+        self.assertEqual(self.cache.get(self.url).etag, '"etag2"')
+
+    async def test_fetch_binary_never_stale(self):
+        self.cache.put(self.url, b"content")
+        self.con._session.get = MagicMock()
+        self.assertEqual(await self.con._fetch_binary(self.url, math.inf), b"content")
+        self.con._session.get.assert_not_called()
+
+
+class TestFrameCache(unittest.TestCase):
+    landkreise = (Landkreise.KOELN, Landkreise.HAMBURG, Landkreise.NORDFRIESLAND)
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = FrameCache(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_key(self):
+        self.assertEqual(self.cache.key(b"content", True, False), self.cache.key(b"content", True, False))
+        self.assertNotEqual(self.cache.key(b"content", True, False), self.cache.key(b"content", False, False))
+        self.assertNotEqual(self.cache.key(b"content", True, False), self.cache.key(b"content2", True, False))
+
+    def test_read_excel_cached(self):
+        excel = get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx")
+        expected = history.read_excel(excel, self.landkreise, False, 8)
+        history.read_excel(excel, self.landkreise, False, 8, cache=self.cache)
+        with patch.object(history.pd, "read_excel") as read_excel_mock:
+            for _ in range(2):  # cached frames must not be modified by selecting
+                result = history.read_excel(excel, self.landkreise, False, 8, cache=self.cache)
+                pd.testing.assert_frame_equal(result[0], expected[0])
+                pd.testing.assert_frame_equal(result[1], expected[1])
+            read_excel_mock.assert_not_called()
+
+    def test_clear(self):
+        self.cache.put("key", {"a": 1})
+        self.assertEqual(self.cache.get("key"), {"a": 1})
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+import unittest
+
+import asyncclick as click
+
+from corona import cli
+
+
+class TestCli(unittest.TestCase):
+    def test_lazy_commands(self):
+        ctx = click.Context(cli)
+        self.assertEqual(cli.list_commands(ctx), sorted(cli.lazy_commands))
+        for name in cli.lazy_commands:
+            with self.subTest(name=name):
+                command = cli.get_command(ctx, name)
+                self.assertIsInstance(command, click.Command)
+                self.assertEqual(command.name, name)
+        self.assertIsNone(cli.get_command(ctx, "does-not-exist"))
+
+    def test_today_does_not_import_pandas(self):
+        code = (
+            "import sys; from corona import cli; cli.get_command(None, 'today'); "
+            "print(','.join(m for m in ('pandas', 'numpy', 'matplotlib') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import math
+import unittest
+import zipfile
+
+import openpyxl
+
+from corona.excel_stream import StreamingWorkbook
+
+SHEET_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<x:worksheet xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><x:sheetData>
+<x:row r="1"><x:c r="A1" t="inlineStr"><x:is><x:t>LK</x:t></x:is></x:c>\
+<x:c r="B1" t="inlineStr"><x:is><x:t>01.01.2022</x:t></x:is></x:c>\
+<x:c r="C1" t="inlineStr"><x:is><x:t>02.01.2022</x:t></x:is></x:c></x:row>
+<x:row r="2"><x:c r="A2" t="str"><x:v>SK &quot;A&quot; &amp; B&#8217;s</x:v></x:c>\
+<x:c r="B2"><x:v>1.5</x:v></x:c><x:c r="C2"><x:v>2</x:v></x:c></x:row>
+<x:row r="3"><x:c r="A3" t="inlineStr"><x:is><x:r><x:t xml:space="preserve">LK </x:t></x:r>\
+<x:r><x:t>C&apos;s</x:t></x:r></x:is></x:c><x:c r="C3" t="e"><x:v>#DIV/0!</x:v></x:c></x:row>
+<x:row r="4"><x:c r="A4" t="inlineStr"><x:is><x:t>other</x:t></x:is></x:c><x:c r="B4"><x:v>4</x:v></x:c></x:row>
+<x:row r="5"><x:c t="inlineStr"><x:is><x:t>LK D</x:t></x:is></x:c><x:c/><x:c><x:v>5</x:v></x:c></x:row>
+</x:sheetData></x:worksheet>"""
+
+
+def create_workbook(sheet_xml: str) -> bytes:
+    """Returns an xlsx written by openpyxl, with the xml of its sheet replaced by sheet_xml"""
+    source = io.BytesIO()
+    openpyxl.Workbook().save(source)
+    result = io.BytesIO()
+    with zipfile.ZipFile(source) as archive, zipfile.ZipFile(result, "w") as target:
+        for item in archive.infolist():
+            content = archive.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                content = sheet_xml.encode("utf-8")
+            target.writestr(item, content)
+    return result.getvalue()
+
+
+class TestStreamingWorkbook(unittest.TestCase):
+    def test_read_sheet(self):
+        labels = ('SK "A" & B’s', "LK C's", "LK D")
+        with StreamingWorkbook(create_workbook(SHEET_XML)) as workbook:
+            df = workbook.read_sheet("Sheet", 0, lambda name: True, labels, 0)
+        self.assertEqual(list(df.index), list(labels))
+        self.assertEqual(list(df.columns), ["01.01.2022", "02.01.2022"])
+        self.assertEqual(df.iloc[0].tolist(), [1.5, 2.0])
+        self.assertTrue(df.iloc[1].isna().all(), "missing cells and errors are NaN")
+        self.assertTrue(math.isnan(df.iloc[2, 0]))
+        self.assertEqual(df.iloc[2, 1], 5.0, "cells without reference are counted by position")
+
+        with StreamingWorkbook(create_workbook(SHEET_XML)) as workbook:
+            df = workbook.read_sheet("Sheet", 0, lambda name: True, labels[:1], 1)
+        self.assertEqual(df.to_dict(), {"02.01.2022": {labels[0]: 2.0}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+import corona.history as history
+from corona.export import export_charts, read_region_sets, region_sets_by_land, select_region_set
+from corona.landkreise import DEUTSCHLAND, Landkreise
+
+from .testing_utils import get_testdata_binary
+
+
+class TestExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        excel = get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx")
+        cls.df_inzidenz, cls.df_hosp = history.read_excel(excel, None, False, 8)
+        cls.landkreise = (Landkreise.KOELN, Landkreise.AURICH, Landkreise.WOLFSBURG)
+        cls.expected = history.read_excel(excel, cls.landkreise, False, 8)
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name) / "graphs"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_region_sets_by_land(self):
+        region_sets = region_sets_by_land()
+        self.assertEqual(len(region_sets), 16)
+        self.assertEqual(
+            sorted(lk.id for region_set in region_sets for lk in region_set.landkreise),
+            sorted(lk.id for lk in Landkreise),
+        )
+
+    def test_read_region_sets(self):
+        config_file = Path(self.temp_dir.name) / "regions.json"
+        config_file.write_text(json.dumps({"Rheinland": [80, 82], "Wolfsburg": [19]}), encoding="utf-8")
+        region_sets = read_region_sets(config_file)
+        self.assertEqual([region_set.name for region_set in region_sets], ["Rheinland", "Wolfsburg"])
+        self.assertEqual(region_sets[1].landkreise, (Landkreise.WOLFSBURG,))
+        for config in ({"Rheinland": [-1]}, {"Rheinland": 80}, [80]):
+            with self.subTest(config=config):
+                config_file.write_text(json.dumps(config), encoding="utf-8")
+                self.assertRaises(ValueError, read_region_sets, config_file)
+
+    def test_select_region_set(self):
+        df1, df2 = select_region_set(self.df_inzidenz, self.df_hosp, self.landkreise)
+        pd.testing.assert_frame_equal(df1, self.expected[0])
+        pd.testing.assert_frame_equal(df2, self.expected[1])
+        self.assertEqual(list(df2.index), ["Niedersachsen", "Nordrhein-Westfalen", DEUTSCHLAND])
+
+    def test_export_charts(self):
+        region_sets = region_sets_by_land()[4:6]  # Bremen and Hamburg
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                timings = export_charts(self.df_inzidenz, self.df_hosp, region_sets, self.output_dir, jobs=jobs)
+                self.assertEqual([timing.name for timing in timings], ["Bremen", "Hamburg"])
+                self.assertEqual(sorted(path.name for path in self.output_dir.iterdir()), ["Bremen.png", "Hamburg.png"])
+                self.assertTrue(all(timing.draw > 0 and timing.save > 0 for timing in timings))
+        timings = export_charts(self.df_inzidenz, None, region_sets[:1], self.output_dir, "svg", jobs=1)
+        self.assertTrue(Path(timings[0].path).read_text(encoding="utf-8").lstrip().startswith("<?xml"))
+        self.assertRaises(ValueError, export_charts, self.df_inzidenz, None, region_sets, self.output_dir, "pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
+import asyncio
+import json
 import unittest
 from datetime import datetime
+from unittest.mock import AsyncMock, patch
 
+import asyncclick as click
 import pandas as pd
 
 import corona.history as history
@@ -472,6 +476,50 @@ class TestCoronaHistory(unittest.TestCase):
         )  # expected result has less decimal places
         self.assertIsNone(result[1])
 
+    def test_streaming_engine(self):
+        landkreise = (
+            Landkreise.BERLIN_MITTE,
+            Landkreise.HANNOVER,
+            Landkreise.NORDFRIESLAND,
+            Landkreise.KOELN,
+            Landkreise.OSTHOLSTEIN,
+        )
+        tests = (
+            ("Fallzahlen_Inzidenz_aktualisiert.xlsx", False, False),
+            ("Fallzahlen_Kum_Tab_aktuell.xlsx", True, False),
+            ("Fallzahlen_Kum_Tab_Archiv.xlsx", True, True),
+        )
+        for file_name, fixed_values, archive in tests:
+            excel = get_testdata_binary(file_name)
+            for days in (8, 0):
+                with self.subTest(file_name=file_name, days=days):
+                    expected = history.read_excel(excel, landkreise, fixed_values, days, archive)
+                    result = history.read_excel(excel, landkreise, fixed_values, days, archive, engine="streaming")
+                    pd.testing.assert_frame_equal(result[0], expected[0])
+                    if expected[1] is None:
+                        self.assertIsNone(result[1])
+                    else:
+                        pd.testing.assert_frame_equal(result[1], expected[1])
+        self.assertRaises(ValueError, history.read_excel, excel, landkreise, engine="unknown")
+
+    def test_all_landkreise(self):
+        excel = get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx")
+        df1, df2 = history.read_excel(excel, None, False, 8)
+        self.assertEqual(set(df1.index), {*Landkreise, DEUTSCHLAND})
+        self.assertEqual(df1.shape, (len(Landkreise) + 1, 8))
+        lands = [lk.land for lk in df1.index.drop(DEUTSCHLAND)]
+        self.assertEqual(lands, sorted(lands))
+        self.assertEqual(len(df2), 17)
+
+        expected, _ = history.read_excel(excel, self.landkreise, False, 8)
+        pd.testing.assert_frame_equal(df1.loc[expected.index], expected)
+        result, _ = history.read_excel(excel, None, False, 8, engine="streaming")
+        pd.testing.assert_frame_equal(result, df1)
+
+        colors_lks, colors_bundesland = history.get_colors(df1)
+        self.assertEqual(set(colors_lks), set(Landkreise))
+        self.assertEqual(set(colors_bundesland), set(df2.index.drop(DEUTSCHLAND)))
+
     def test_format_to_week(self):
         tests = (
             (datetime(2020, 12, 26), "2020-52"),
@@ -486,6 +534,59 @@ class TestCoronaHistory(unittest.TestCase):
             with self.subTest(test=test):
                 self.assertEqual(history.format_to_week(test[0]), test[1])
 
+    def test_group_labels(self):
+        dates = pd.DatetimeIndex([datetime(2020, 12, 31), datetime(2021, 1, 3), datetime(2021, 1, 4)])
+        self.assertEqual(list(history.group_labels(dates, "week")), [history.format_to_week(d) for d in dates])
+        self.assertEqual(list(history.group_labels(dates, "month")), ["2020-12", "2021-01", "2021-01"])
+
+    def test_aggregate(self):
+        dates = pd.date_range("2021-01-03", "2021-02-10")  # Sunday of 2020-53, 10 days of February
+        df = pd.DataFrame({Landkreise.KOELN: range(len(dates)), DEUTSCHLAND: 1.0}, index=dates)
+        df.loc["2021-01-05", Landkreise.KOELN] = float("nan")
+        stats = history.aggregate(df, "w")
+        self.assertEqual(stats.index.names, ["region", "KW"])
+        self.assertEqual(list(stats.index.unique(0)), [Landkreise.KOELN, DEUTSCHLAND])
+        koeln = stats.loc[Landkreise.KOELN]
+        self.assertEqual(list(koeln.index), ["2021-01", "2021-02", "2021-03", "2021-04", "2021-05", "2021-06"])
+        self.assertEqual(koeln.loc["2021-01"].tolist(), [6, 26 / 6, 1.0, 3.25, 4.5, 5.75, 7.0])
+        self.assertEqual(koeln.loc["2021-06", "count"], 3)
+
+        stats = history.aggregate(df, "month")
+        self.assertEqual(list(stats.loc[DEUTSCHLAND].index), ["2021-01", "2021-02"])
+        self.assertEqual(stats.loc[(DEUTSCHLAND, "2021-01"), "count"], 29)
+        self.assertRaises(ValueError, history.aggregate, df, "d")
+
+        records = json.loads(history.aggregates_to_json(stats))
+        self.assertEqual(records[0], {"region": "Köln", "Monat": "2021-01", **stats.iloc[0].to_dict()})
+
+    def test_stats_options(self):
+        for args in (["--stats", "text"], ["-m", "10", "--stats", "json"], ["-m", "w", "--stats", "text", "-f", "csv"]):
+            with self.subTest(args=args), patch("corona.history.get_history", AsyncMock()) as get_history:
+                with self.assertRaises(click.UsageError):
+                    asyncio.run(history.history_wrapped.main([*args, "--no-store"], standalone_mode=False))
+                get_history.assert_not_awaited()
+        with patch("corona.history.get_history", AsyncMock()) as get_history:
+            asyncio.run(
+                history.history_wrapped.main(["-m", "month", "--stats", "json", "--no-store"], standalone_mode=False)
+            )
+        self.assertEqual(get_history.call_args.kwargs["stats_format"], "json")
+
+    def test_values_to_frame(self):
+        excel = get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx")
+        df_inzidenz, df_hosp = history.read_excel(excel, self.landkreise, False, 8)
+        df_inzidenz.loc[Landkreise.KOELN, df_inzidenz.columns[0]] = float("nan")
+        result = history.values_to_frame(df_inzidenz, df_hosp)
+        self.assertEqual(list(result.columns), ["kind", "region", "region_id", "date", "value"])
+        self.assertEqual(len(result), df_inzidenz.size - 1 + df_hosp.size)
+        koeln = result[(result["kind"] == "inzidenz") & (result["region_id"] == 80)]
+        self.assertEqual(list(koeln["date"]), [day.strftime("%Y-%m-%d") for day in df_inzidenz.columns[1:]])
+        self.assertEqual(list(koeln["value"]), list(df_inzidenz.loc[Landkreise.KOELN].iloc[1:]))
+        hosp = result[result["kind"] == "hospitalisierung"]
+        self.assertEqual(set(hosp["region"]), set(df_hosp.index))
+        self.assertEqual(hosp.loc[hosp["region"] == DEUTSCHLAND, "region_id"].unique().tolist(), [0])
+        self.assertTrue(hosp.loc[hosp["region"] != DEUTSCHLAND, "region_id"].isna().all())
+        self.assertEqual(len(history.values_to_frame(df_inzidenz)), df_inzidenz.size - 1)
+
     def test_get_colors_integrety(self):
         """Tests if the method returns usable responses - not if the color values are correct"""
         excel = get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx")
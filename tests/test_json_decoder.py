@@ -0,0 +1,67 @@
+import importlib.util
+import json
+import sys
+import unittest
+from unittest.mock import patch
+
+from corona.json_decoder import JSON_DECODERS, JsonDecoder, MsgspecDecoder, create_decoder
+from corona.rki_connector import CasesResult, Connector
+
+from .testing_utils import get_testdata_binary, get_testdata_text
+
+
+def available_decoders() -> list[JsonDecoder]:
+    decoders = []
+    for name in JSON_DECODERS[1:]:
+        try:
+            decoders.append(create_decoder(name))
+        except RuntimeError:
+            continue
+    return decoders
+
+
+class TestJsonDecoder(unittest.TestCase):
+    def test_decode_cases(self):
+        for file_name in ("all.json", "80.json", "413.json"):
+            expected = Connector.parse_answer_all(json.loads(get_testdata_text(file_name)))
+            data = get_testdata_binary(file_name)
+            for decoder in available_decoders():
+                with self.subTest(file_name=file_name, decoder=decoder.name):
+                    self.assertEqual(decoder.decode_cases(data, CasesResult), (expected, False))
+
+    def test_exceeded_transfer_limit(self):
+        answer = json.loads(get_testdata_text("80.json"))
+        data = json.dumps({**answer, "exceededTransferLimit": True}).encode("utf-8")
+        for decoder in available_decoders():
+            with self.subTest(decoder=decoder.name):
+                self.assertEqual(decoder.decode_cases(data, CasesResult)[1], True)
+
+    @unittest.skipUnless(importlib.util.find_spec("msgspec"), "msgspec is not installed")
+    def test_msgspec(self):
+        decoder = MsgspecDecoder()
+        self.assertEqual(create_decoder().name, "msgspec")
+        for file_name in ("all.json", "80.json"):
+            data = get_testdata_binary(file_name)
+            with self.subTest(file_name=file_name):
+                self.assertEqual(decoder.decode_cases(data, CasesResult), JsonDecoder().decode_cases(data, CasesResult))
+                self.assertEqual(decoder.loads(data), JsonDecoder().loads(data))
+        results, _ = decoder.decode_cases(get_testdata_binary("all.json"), CasesResult)
+        self.assertEqual({type(value) for value in results[0]}, {str, float, int})
+
+    def test_loads(self):
+        data = get_testdata_binary("de.json")
+        for decoder in available_decoders():
+            with self.subTest(decoder=decoder.name):
+                self.assertEqual(decoder.loads(data), json.loads(data))
+
+    def test_create_decoder(self):
+        self.assertIn(create_decoder().name, JSON_DECODERS)
+        self.assertEqual(create_decoder("json").name, "json")
+        with self.assertRaises(ValueError):
+            create_decoder("simplejson")
+
+    def test_missing_package(self):
+        with patch.dict(sys.modules, {"msgspec": None, "orjson": None}):
+            self.assertEqual(create_decoder().name, "json")
+            with self.assertRaisesRegex(RuntimeError, r"pip install corona\[orjson\]"):
+                create_decoder("orjson")
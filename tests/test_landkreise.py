@@ -1,4 +1,5 @@
 import asyncio
+import pickle
 import unittest
 
 from corona.landkreise import Landkreise
@@ -17,10 +18,20 @@ class TestLandkreise(unittest.IsolatedAsyncioTestCase):
             same_lk_name = [lk for lk in Landkreise if lk.lk_name == landkreis.lk_name]
             self.assertEqual(len(same_lk_name), 1, "All Lankreise should have an unique lk name")
 
+    def test_land(self):
+        lands = {lk.land for lk in Landkreise}
+        self.assertEqual(len(lands), 16, "All Landkreise should be located in one of the 16 Bundeslaender")
+        self.assertTrue(all(isinstance(land, str) for land in lands))
+
     def test_if_value_is_id(self):
         self.assertEqual(Landkreise.KOELN.value, 80)
         self.assertEqual(Landkreise.HANNOVER.value, 27)
 
+    def test_pickle(self):
+        self.assertIs(pickle.loads(pickle.dumps(Landkreise.HANNOVER)), Landkreise.HANNOVER)
+        self.assertIs(Landkreise(80), Landkreise.KOELN)
+        self.assertRaises(ValueError, Landkreise, -1)
+
     def test_find_by_id(self):
         for landkreis in Landkreise:
             self.assertEqual(Landkreise.find_by_id(landkreis.value), landkreis)
@@ -54,6 +65,24 @@ class TestLandkreise(unittest.IsolatedAsyncioTestCase):
                 landkreise = list(Landkreise.find_by_lk_names(test["test"]))
                 self.assertEqual(landkreise, test["expect"])
 
+    def test_map_lk_names(self):
+        lk_names = [Landkreise.KOELN.lk_name, "Gesamt", 7, Landkreise.AURICH.lk_name]
+        self.assertEqual(Landkreise.map_lk_names(lk_names), [Landkreise.KOELN, "Gesamt", 7, Landkreise.AURICH])
+        self.assertEqual(Landkreise.map_lk_names(()), [])
+
+    def test_find_by_name(self):
+        self.assertEqual(Landkreise.find_by_name("Köln"), (Landkreise.KOELN,))
+        self.assertEqual(Landkreise.find_by_name("Ansbach"), (Landkreise.ANSBACH_SK, Landkreise.ANSBACH_LK))
+        self.assertEqual(Landkreise.find_by_name("DOES NOT EXIST"), ())
+
+    def test_find_by_land(self):
+        for land in ("Niedersachsen", "Berlin"):
+            with self.subTest(land=land):
+                expected = tuple(lk for lk in Landkreise if lk._land == land)
+                self.assertTrue(expected)
+                self.assertEqual(Landkreise.find_by_land(land), expected)
+        self.assertEqual(Landkreise.find_by_land(""), ())
+
     def test_name(self):
         tests = {
             "Aurich": Landkreise.AURICH,
@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import MagicMock, NonCallableMock
+
+from corona.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS, HTTP_RETRIES, Registry, timed
+from corona.rki_connector import Connector
+from corona.scheduler import RequestScheduler
+
+from .test_scheduler import create_error
+from .test_today import create_answer
+
+
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.registry = Registry()
+
+    def test_expose(self):
+        counter = self.registry.counter("requests_total", "Requests", ("host",))
+        counter.inc(host='a"b')
+        counter.inc(2, host='a"b')
+        histogram = self.registry.histogram("duration_seconds", "Duration", buckets=(0.1, 1))
+        for value in (0.05, 0.5, 0.1, 3):
+            histogram.observe(value)
+        expected = (
+            "# HELP requests_total Requests\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{host="a\\"b"} 3\n'
+            "# HELP duration_seconds Duration\n"
+            "# TYPE duration_seconds histogram\n"
+            'duration_seconds_bucket{le="0.1"} 2\n'
+            'duration_seconds_bucket{le="1"} 3\n'
+            'duration_seconds_bucket{le="+Inf"} 4\n'
+            "duration_seconds_sum 3.65\n"
+            "duration_seconds_count 4\n"
+        )
+        self.assertEqual(self.registry.expose(), expected)
+
+    def test_register(self):
+        counter = self.registry.counter("requests_total", "Requests", ("host",))
+        self.assertIs(self.registry.counter("requests_total", "Requests", ("host",)), counter)
+        self.assertRaises(ValueError, self.registry.histogram, "requests_total", "Requests", ("host",))
+        self.assertRaises(ValueError, counter.inc, status=200)
+        self.assertRaises(ValueError, counter.inc, -1, host="a")
+
+    async def test_timed(self):
+        histogram = self.registry.histogram("duration_seconds", "Duration")
+
+        @timed(histogram)
+        async def fail():
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            await fail()
+        self.assertEqual(histogram.count(), 1)
+
+    async def test_connector(self):
+        host = "metrics.test"
+        answer = create_answer(json_object={"count": 0})
+        answer.status = 200
+        con = Connector(scheduler=RequestScheduler(backoff=0), replay_dir="", record_dir="")
+        con._session = NonCallableMock()
+        con.url_count = f"https://{host}/query"
+        con._session.get = MagicMock(side_effect=[create_error(503, url=con.url_count), answer])
+        self.assertEqual(await con.get_all_cases(), [])
+        self.assertEqual(HTTP_REQUESTS.value(host=host, status=503), 1)
+        self.assertEqual(HTTP_REQUESTS.value(host=host, status=200), 1)
+        self.assertEqual(HTTP_RETRIES.value(host=host), 1)
+        self.assertEqual(HTTP_REQUEST_SECONDS.count(host=host, status=200), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import asyncio
+import csv
+import importlib.util
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import asyncclick as click
+import pandas as pd
+
+from corona.output import RowWriter, create_writer, validate_output_format, write_frame
+from corona.rki_connector import CASES_RESULT_TYPES, CasesResult
+from corona.today import today
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            CasesResult("Köln", "SK Köln", 553.485101033874, "27.04.2022, 00:00 Uhr", 80),
+            CasesResult("Aurich", "LK Aurich", 1843.53605569519, "27.04.2022, 00:00 Uhr", 51),
+        ]
+
+    def write(self, output_format: str) -> bytes:
+        file = io.BytesIO()
+        with create_writer(output_format, file, CasesResult._fields, CASES_RESULT_TYPES) as writer:
+            for row in self.rows:
+                writer.write(row)
+        return file.getvalue()
+
+    def test_jsonl(self):
+        lines = self.write("jsonl").decode("utf-8").splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [row._asdict() for row in self.rows])
+
+    def test_csv(self):
+        rows = list(csv.reader(io.StringIO(self.write("csv").decode("utf-8"))))
+        self.assertEqual(rows[0], list(CasesResult._fields))
+        self.assertEqual(rows[1], ["Köln", "SK Köln", "553.485101033874", "27.04.2022, 00:00 Uhr", "80"])
+        self.assertEqual(len(rows), 3)
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, create_writer, "table", io.BytesIO(), CasesResult._fields, CASES_RESULT_TYPES)
+        self.assertRaises(ValueError, write_frame, pd.DataFrame(), "xml", io.BytesIO())
+
+    def test_row_writer_is_abstract(self):
+        self.assertRaises(TypeError, RowWriter, io.BytesIO(), CasesResult._fields, CASES_RESULT_TYPES)
+
+    @unittest.skipIf(HAS_PYARROW, "pyarrow is installed")
+    def test_arrow_without_pyarrow(self):
+        command = click.Command("test", params=[click.Option(["--output-format"])])
+        ctx = click.Context(command)
+        param = command.params[0]
+        self.assertEqual(validate_output_format(ctx, param, "csv"), "csv")
+        self.assertRaises(click.BadParameter, validate_output_format, ctx, param, "arrow")
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, "out.arrow")
+            with open(output_file, "w") as file:
+                file.write("kept")
+            with self.assertRaises(RuntimeError):
+                asyncio.run(today(output_format="arrow", output_file=output_file))
+            with open(output_file) as file:
+                self.assertEqual(file.read(), "kept")
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_arrow(self):
+        import pyarrow as pa
+
+        file = io.BytesIO()
+        with create_writer("arrow", file, CasesResult._fields, CASES_RESULT_TYPES) as writer:
+            writer.batch_size = 1
+            writer.write(CasesResult("Berlin", None, None, None, None))
+            for row in self.rows:
+                writer.write(row)
+        table = pa.ipc.open_stream(file.getvalue()).read_all()
+        self.assertEqual(table.schema.types, [pa.string(), pa.string(), pa.float64(), pa.string(), pa.int64()])
+        self.assertEqual(table.to_pylist()[1:], [row._asdict() for row in self.rows])
+
+        df = pd.DataFrame(self.rows)
+        file = io.BytesIO()
+        write_frame(df, "arrow", file)
+        pd.testing.assert_frame_equal(pa.ipc.open_stream(file.getvalue()).read_pandas(), df)
+
+    def test_write_frame(self):
+        df = pd.DataFrame(self.rows)
+        for output_format, read in (
+            ("jsonl", lambda file: pd.read_json(file, lines=True)),
+            ("csv", pd.read_csv),
+        ):
+            with self.subTest(output_format=output_format):
+                file = io.BytesIO()
+                write_frame(df, output_format, file)
+                file.seek(0)
+                pd.testing.assert_frame_equal(read(file), df)
+
+    def test_jsonl_precision(self):
+        values = [1843.53605569519, 247.900516795866, 0.1 + 0.2]
+        file = io.BytesIO()
+        write_frame(pd.DataFrame({"value": values, "region_id": pd.array([1, None, 3], dtype="Int64")}), "jsonl", file)
+        lines = file.getvalue().decode("utf-8").splitlines()
+        self.assertEqual([json.loads(line)["value"] for line in lines], values)
+        self.assertEqual(json.loads(lines[1])["region_id"], None)
+        self.assertIn('"value":247.900516795866,', lines[1])
+
+        file = io.BytesIO()
+        with create_writer("jsonl", file, ("value",), (float,)) as writer:
+            for value in values:
+                writer.write((value,))
+        self.assertEqual(file.getvalue().decode("utf-8").splitlines()[1], '{"value":247.900516795866}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+import unittest
+
+from corona.profiling import Profiler, profiled, span
+
+from .testing_utils import get_testdata_file
+
+
+@profiled(rows=len)
+def allocate(size: int) -> bytes:
+    return bytes(size)
+
+
+@profiled("download", size=len)
+async def download(size: int) -> bytes:
+    return bytes(size)
+
+
+class TestProfiling(unittest.IsolatedAsyncioTestCase):
+    async def test_profiled(self):
+        with Profiler() as profiler:
+            allocate(1_000_000)
+            allocate(10)
+            await download(20)
+        allocate(30)  # not recorded after stopping
+        self.assertEqual([phase.name for phase in profiler.summary()], ["allocate", "download"])
+        allocate_phase, download_phase = profiler.summary()
+        self.assertEqual((allocate_phase.calls, allocate_phase.rows, allocate_phase.size), (2, 1_000_010, None))
+        self.assertGreaterEqual(allocate_phase.peak_memory, 1_000_000)
+        self.assertEqual((download_phase.calls, download_phase.size, download_phase.rows), (1, 20, None))
+        self.assertGreaterEqual(profiler.seconds, allocate_phase.seconds + download_phase.seconds)
+
+    def test_nested_peak_memory(self):
+        with Profiler() as profiler:
+            with span("outer") as outer:
+                allocate(1_000_000)
+                with span("inner") as inner:
+                    pass
+        self.assertGreaterEqual(outer.peak_memory, 1_000_000, "peak of the nested span must be kept")
+        self.assertLess(inner.peak_memory, outer.peak_memory)
+        self.assertEqual([phase.name for phase in profiler.summary()], ["allocate", "inner", "outer"])
+
+    def test_not_running(self):
+        with span("nothing") as record:
+            pass
+        self.assertEqual(record.seconds, 0)
+        profiler = Profiler(trace_memory=False)
+        with profiler:
+            self.assertRaises(RuntimeError, Profiler().start)
+            allocate(10)
+        self.assertIsNone(profiler.summary()[0].peak_memory)
+        self.assertRaises(ValueError, profiler.format, "xml")
+
+    def test_cli_profile(self):
+        args = ["--replay", str(get_testdata_file("")), "--profile", "--profile-format", "json", "today", "-a"]
+        result = subprocess.run(
+            [sys.executable, "-m", "corona", *args], capture_output=True, text=True, check=True, encoding="utf-8"
+        )
+        report = json.loads(result.stderr.strip().splitlines()[-1])
+        self.assertEqual([phase["name"] for phase in report["phases"]], ["Connector.get_all_cases"])
+        self.assertEqual(report["phases"][0]["rows"], 411)
+        self.assertIn("Köln", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
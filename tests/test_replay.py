@@ -0,0 +1,73 @@
+import json
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, NonCallableMock, patch
+
+from corona.landkreise import Landkreise
+from corona.replay import ResponseDirectory
+from corona.rki_connector import Connector
+
+from .test_today import create_answer, get_city
+from .testing_utils import get_testdata_binary, get_testdata_file, get_testdata_text
+
+
+class TestReplay(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.con = Connector(replay_dir=str(get_testdata_file("")))
+        self.con._session = NonCallableMock()  # any request fails
+
+    async def test_replay(self):
+        self.assertEqual(await self.con.get_germany(), 702.1)
+        self.assertEqual(len(await self.con.get_all_cases()), 411)
+        self.assertEqual((await self.con.get_case(Landkreise.KOELN)).cases7_per_100k, 553.485101033874)
+        # not recorded on its own, taken from all.json
+        self.assertEqual((await self.con.get_case(Landkreise.AHRWEILER)).county, "LK Ahrweiler")
+        landkreise = (Landkreise.KOELN, Landkreise.AHRWEILER, Landkreise.AURICH)
+        for bulk in (True, False):
+            with self.subTest(bulk=bulk):
+                result = [case.region_id async for case in self.con.get_cases(landkreise, True, bulk)]
+                self.assertEqual(result, [80, 144, 51])
+        self.assertEqual(await self.con.get_excel_fixed(), get_testdata_binary("Fallzahlen_Kum_Tab_aktuell.xlsx"))
+        self.con._session.get.assert_not_called()
+
+    async def test_replay_missing(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            con = Connector(replay_dir=temp_dir)
+            with self.assertRaises(FileNotFoundError):
+                await con.get_germany()
+            with self.assertRaises(RuntimeError):
+                await con.get_cases_chunk([Landkreise.KOELN])
+        self.assertRaises(ValueError, Connector, replay_dir=temp_dir, record_dir=temp_dir)
+
+    async def test_env(self):
+        with patch.dict("os.environ", {"CORONA_REPLAY_DIR": "replay"}):
+            self.assertEqual(str(Connector().replay.path), "replay")
+            self.assertIsNone(Connector(replay_dir="").replay)
+
+    async def test_record(self):
+        landkreise = (Landkreise.KOELN, Landkreise.AURICH)
+        excel = get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            con = Connector(record_dir=temp_dir)
+            con._session = NonCallableMock()
+            con._session.get = MagicMock(side_effect=get_city)
+            expected = [case async for case in con.get_cases(landkreise, True, bulk=True)]
+            expected.append(await con.get_case(Landkreise.WOLFSBURG))
+            con._session.get = MagicMock(
+                return_value=create_answer(json_object=json.loads(get_testdata_text("de.json")))
+            )
+            self.assertEqual(await con.get_germany(), 702.1)
+            with patch.object(Connector, "_fetch_binary_cached", AsyncMock(return_value=excel)):
+                await con.get_excel()
+
+            replay = Connector(replay_dir=temp_dir)
+            result = [case async for case in replay.get_cases(landkreise, True, bulk=True)]
+            result.append(await replay.get_case(Landkreise.WOLFSBURG))
+            self.assertEqual(result, expected)
+            self.assertEqual(await replay.get_germany(), 702.1)
+            self.assertEqual(await replay.get_excel(), excel)
+            self.assertEqual(ResponseDirectory(temp_dir).cases_json([80])["features"][0]["attributes"]["OBJECTID"], 80)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from corona.scheduler import RequestScheduler
+
+
+def create_error(status: int, headers=None, url: str = "https://example.com/") -> aiohttp.ClientResponseError:
+    request_info = aiohttp.RequestInfo(URL(url), "GET", CIMultiDictProxy(CIMultiDict()))
+    return aiohttp.ClientResponseError(request_info, (), status=status, headers=headers)
+
+
+class TestRequestScheduler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.scheduler = RequestScheduler(retries=3, backoff=0.01)
+
+    async def test_retry(self):
+        request = AsyncMock(side_effect=[create_error(503), aiohttp.ServerDisconnectedError(), "result"])
+        self.assertEqual(await self.scheduler.run(request), "result")
+        self.assertEqual(request.call_count, 3)
+
+    async def test_no_retry(self):
+        request = AsyncMock(side_effect=[create_error(404), "result"])
+        with self.assertRaises(aiohttp.ClientResponseError):
+            await self.scheduler.run(request)
+        request.assert_called_once()
+
+    async def test_retries_exceeded(self):
+        request = AsyncMock(side_effect=create_error(429))
+        with self.assertRaises(aiohttp.ClientResponseError):
+            await self.scheduler.run(request)
+        self.assertEqual(request.call_count, 4)
+
+    async def test_retry_after(self):
+        request = AsyncMock(side_effect=[create_error(429, {"Retry-After": "7"}), "result"])
+        with patch("corona.scheduler.asyncio.sleep", AsyncMock()) as sleep_mock:
+            self.assertEqual(await self.scheduler.run(request), "result")
+        sleep_mock.assert_awaited_once_with(7.0)
+
+    async def test_deadline(self):
+        self.scheduler.deadline = 5
+        request = AsyncMock(side_effect=[create_error(429, {"Retry-After": "7"}), "result"])
+        with self.assertRaises(aiohttp.ClientResponseError):
+            await self.scheduler.run(request)
+        request.assert_called_once()
+
+    async def test_deadline_timeout(self):
+        self.scheduler.deadline = 0.05
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.scheduler.run(lambda: asyncio.sleep(1))
+
+    def test_delay(self):
+        for attempt in range(10):
+            self.assertLessEqual(self.scheduler.delay(attempt, create_error(503)), self.scheduler.max_backoff)
+        self.assertEqual(self.scheduler.delay(0, create_error(503, {"Retry-After": "3"})), 3)
+        self.assertEqual(self.scheduler.delay(0, create_error(503, {"Retry-After": "86400"})), 30)
+        self.assertEqual(
+            self.scheduler.delay(0, create_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})), 0
+        )
+
+    async def test_slot(self):
+        self.scheduler.limit_per_host = 2
+        running = 0
+        max_running = 0
+
+        async def request():
+            nonlocal running, max_running
+            async with self.scheduler.slot("https://example.org/path"):
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        self.assertEqual(max_running, 2)
+        self.assertIs(self.scheduler.slot("https://example.org/a"), self.scheduler.slot("https://example.org/b"))
+        self.assertIsNot(self.scheduler.slot("https://example.org/a"), self.scheduler.slot("https://example.com/a"))
+
+    async def test_slot_released_during_backoff(self):
+        self.scheduler.limit_per_host = 1
+        finished = []
+
+        async def request(name: str, errors: list):
+            if errors:
+                raise errors.pop()
+            finished.append(name)
+            return name
+
+        errors = [create_error(503)]
+        failing = self.scheduler.run(lambda: request("failing", errors), "https://example.org/a")
+        other = self.scheduler.run(lambda: request("other", []), "https://example.org/b")
+        with patch.object(self.scheduler, "delay", return_value=0.05):
+            self.assertEqual(await asyncio.gather(failing, other), ["failing", "other"])
+        self.assertEqual(finished, ["other", "failing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
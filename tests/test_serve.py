@@ -0,0 +1,104 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, NonCallableMock, patch
+
+from aiohttp.test_utils import TestClient, TestServer
+
+import corona.history as history
+from corona.landkreise import DEUTSCHLAND, Landkreise
+from corona.rki_connector import Connector
+from corona.serve import ServeState, create_app, refresh
+from corona.store import Store
+
+from .testing_utils import get_testdata_binary, get_testdata_text
+
+
+class TestServe(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cases = Connector.parse_answer_all(json.loads(get_testdata_text("all.json")))
+        cls.sheets = history.read_sheets(get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx"))
+
+    async def asyncSetUp(self):
+        self.state = ServeState()
+        self.client = TestClient(TestServer(create_app(self.state)))
+        await self.client.start_server()
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    async def test_not_loaded(self):
+        for path in ("/today", "/today/80", "/history?ids=80"):
+            with self.subTest(path=path):
+                response = await self.client.get(path)
+                self.assertEqual(response.status, 503)
+
+    async def test_today(self):
+        self.state.set_today(self.cases, 702.1)
+        response = await self.client.get("/today")
+        result = await response.json()
+        self.assertEqual(result["germany"], 702.1)
+        self.assertEqual(len(result["regions"]), len(self.cases))
+
+        response = await self.client.get("/today/80")
+        result = await response.json()
+        self.assertEqual(result["city_name"], "Köln")
+        self.assertAlmostEqual(result["cases7_per_100k"], 553.485101033874)
+
+        response = await self.client.get("/today/-1")
+        self.assertEqual(response.status, 404)
+
+    async def test_history(self):
+        self.state.set_history(self.sheets)
+        landkreise = (Landkreise.KOELN, Landkreise.HAMBURG)
+        expected, _ = history.read_excel(
+            get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx"), landkreise, False, 8
+        )
+        response = await self.client.get("/history?ids=80,16&days=8")
+        result = await response.json()
+        self.assertEqual(result["dates"], [date.strftime("%Y-%m-%d") for date in expected.columns])
+        self.assertEqual([region["region_id"] for region in result["regions"]], [80, 16])
+        self.assertEqual(result["regions"][0]["values"], expected.loc[Landkreise.KOELN].tolist())
+        self.assertEqual(result["laender"][DEUTSCHLAND], expected.loc[DEUTSCHLAND].tolist())
+        self.assertEqual(set(result["laender"]), {"Hamburg", "Nordrhein-Westfalen", DEUTSCHLAND})
+
+        response = await self.client.get("/history?ids=-1")
+        self.assertEqual(response.status, 400)
+
+    async def test_refresh(self):
+        con = NonCallableMock()
+        con.get_germany = AsyncMock(return_value=702.1)
+        con.get_excel = AsyncMock(return_value=get_testdata_binary("Fallzahlen_Inzidenz_aktualisiert.xlsx"))
+        threads = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = Store(Path(temp_dir) / "inzidenz.sqlite3")
+            add_snapshot = store.add_snapshot
+
+            def record_thread(*args):
+                threads.append(threading.get_ident())
+                return add_snapshot(*args)
+
+            with patch("corona.serve.get_snapshot", AsyncMock(return_value=self.cases)), patch.object(
+                store, "add_snapshot", record_thread
+            ):
+                await refresh(self.state, con, store=store)
+                await refresh(self.state, con, store=store)
+            self.assertIsNotNone(store.latest_date())
+            store.close()
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)  # the database is written outside of the event loop
+        self.assertEqual(len((await (await self.client.get("/today")).json())["regions"]), len(self.cases))
+
+    async def test_metrics(self):
+        response = await self.client.get("/metrics")
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        result = await response.text()
+        self.assertIn("# TYPE corona_http_requests_total counter\n", result)
+        self.assertIn("# TYPE corona_read_excel_duration_seconds histogram\n", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, NonCallableMock, patch
+
+from corona.metrics import COALESCED_CALLS
+from corona.rki_connector import Connector
+from corona.single_flight import SingleFlight
+
+from .test_today import create_answer
+from .testing_utils import get_testdata_text
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def load(self, result="result"):
+        self.calls += 1
+        await self.release.wait()
+        return result
+
+    async def test_shares_calls_in_flight(self):
+        single_flight = SingleFlight()
+        joined = COALESCED_CALLS.value(result="joined")
+        tasks = [asyncio.create_task(single_flight.run("key", self.load)) for _ in range(3)]
+        other = asyncio.create_task(single_flight.run("other", self.load))
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await asyncio.gather(*tasks, other), ["result"] * 4)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(COALESCED_CALLS.value(result="joined"), joined + 2)
+        # without ttl the next call loads again
+        await single_flight.run("key", self.load)
+        self.assertEqual(self.calls, 3)
+
+    async def test_memo(self):
+        self.release.set()
+        single_flight = SingleFlight(ttl=60)
+        self.assertEqual(await single_flight.run("key", self.load), "result")
+        self.assertEqual(await single_flight.run("key", self.load), "result")
+        self.assertEqual(self.calls, 1)
+        with patch("corona.single_flight.time.monotonic", return_value=float("inf")):
+            await single_flight.run("key", self.load)
+        self.assertEqual(self.calls, 2)
+        single_flight.clear()
+        await single_flight.run("key", self.load)
+        self.assertEqual(self.calls, 3)
+
+    async def test_results_are_copied(self):
+        single_flight = SingleFlight(ttl=60)
+        tasks = [asyncio.create_task(single_flight.run("key", lambda: self.load([2, 1]))) for _ in range(2)]
+        await asyncio.sleep(0)
+        self.release.set()
+        first, joined = await asyncio.gather(*tasks)
+        first.sort()
+        joined.append(3)
+        self.assertEqual(await single_flight.run("key", self.load), [2, 1])
+        self.assertEqual(self.calls, 1)
+
+    async def test_errors_are_shared_but_not_memorized(self):
+        single_flight = SingleFlight(ttl=60)
+
+        async def fail():
+            self.calls += 1
+            await self.release.wait()
+            raise RuntimeError("failed")
+
+        tasks = [asyncio.create_task(single_flight.run("key", fail)) for _ in range(2)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(self.calls, 1)
+        with self.assertRaises(RuntimeError):
+            await single_flight.run("key", fail)
+        self.assertEqual(self.calls, 2)
+
+    async def test_cancel(self):
+        single_flight = SingleFlight()
+        first = asyncio.create_task(single_flight.run("key", self.load))
+        second = asyncio.create_task(single_flight.run("key", self.load))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await second, "result", "the call goes on while another caller waits")
+
+        self.release.clear()
+        only = asyncio.create_task(single_flight.run("key", self.load))
+        await asyncio.sleep(0)
+        flight = single_flight._flights["key"]
+        only.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await only
+        await asyncio.sleep(0)
+        self.assertTrue(flight.task.cancelled(), "the call is cancelled without callers")
+        self.assertNotIn("key", single_flight._flights)
+
+    async def test_connector(self):
+        con = Connector()
+        con._session = NonCallableMock()
+        con._session.get = MagicMock(return_value=create_answer(json_object=json.loads(get_testdata_text("de.json"))))
+        results = await asyncio.gather(*(con.get_germany() for _ in range(5)))
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(con._session.get.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
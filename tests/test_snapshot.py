@@ -0,0 +1,70 @@
+import json
+import math
+import unittest
+from unittest.mock import MagicMock, NonCallableMock
+
+from corona.rki_connector import CasesResult, Connector
+from corona.snapshot import CasesSnapshot, SnapshotBuilder, get_snapshot
+
+from .test_today import get_all_page
+from .testing_utils import get_testdata_file, get_testdata_text
+
+
+class TestSnapshot(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        response_json = json.loads(get_testdata_text("all.json"))
+        cls.cases = Connector.parse_answer_all(response_json)
+        cls.snapshot = CasesSnapshot.from_json(response_json)
+
+    def test_sequence(self):
+        self.assertEqual(len(self.snapshot), len(self.cases))
+        self.assertEqual(list(self.snapshot), self.cases)
+        self.assertEqual(self.snapshot[-1], self.cases[-1])
+        self.assertEqual(list(self.snapshot[10:20:3]), self.cases[10:20:3])
+        self.assertRaises(IndexError, self.snapshot.__getitem__, len(self.cases))
+        self.assertEqual(self.snapshot[5:].region_ids.tolist(), [case.region_id for case in self.cases[5:]])
+        self.assertEqual(list(CasesSnapshot.from_results(self.cases)), self.cases)
+        self.assertLess(len(self.snapshot._strings), 3 * len(self.cases), "the last update is shared")
+
+    def test_sort(self):
+        self.assertEqual(list(self.snapshot.sort_by_name()), sorted(self.cases, key=lambda case: case.city_name))
+        by_value = sorted(self.cases, key=lambda case: case.cases7_per_100k, reverse=True)
+        self.assertEqual(list(self.snapshot.sort_by_value(descending=True)), by_value)
+        self.assertEqual(list(self.snapshot.top(5)), by_value[:5])
+        self.assertEqual(list(self.snapshot.sort_by_value().sort_by_region_id()), self.cases)
+
+    def test_filter(self):
+        expected = [case for case in self.cases if 500 <= case.cases7_per_100k <= 1000]
+        self.assertEqual(list(self.snapshot.filter(500, 1000)), expected)
+        self.assertEqual(len(self.snapshot.filter(max_value=-1)), 0)
+
+    def test_unknown_value(self):
+        cases = [CasesResult("A", "SK A", None, "u", 1), CasesResult("B", "SK B", 2.0, "u", 2)]
+        snapshot = CasesSnapshot.from_results(cases)
+        self.assertTrue(math.isnan(snapshot.values[0]))
+        self.assertEqual(list(snapshot), cases)
+        self.assertEqual([case.region_id for case in snapshot.sort_by_value(descending=True)], [2, 1])
+        self.assertEqual([case.region_id for case in snapshot.top(2)], [2])
+        self.assertEqual([case.region_id for case in snapshot.filter()], [2])
+
+    def test_builder(self):
+        builder = SnapshotBuilder()
+        self.assertEqual(builder.add("B", "SK B", 2.0, "u", 2), 0)
+        self.assertEqual(builder.add("A", "SK A", None, "u", 1), 1)
+        self.assertEqual(builder.add("B", "SK B", 3.0, "v", 2), 0, "a region id added again replaces its row")
+        expected = [CasesResult("B", "SK B", 3.0, "v", 2), CasesResult("A", "SK A", None, "u", 1)]
+        self.assertEqual(list(builder.build()), expected)
+
+    async def test_get_snapshot(self):
+        con = Connector(replay_dir=str(get_testdata_file("")))
+        self.assertEqual(list(await get_snapshot(con)), self.cases)
+
+        con = Connector(replay_dir="")
+        con._session = NonCallableMock()
+        con._session.get = MagicMock(side_effect=get_all_page)
+        self.assertEqual(list(await get_snapshot(con)), self.cases)
+
+
+if __name__ == "__main__":
+    unittest.main()
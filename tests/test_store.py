@@ -0,0 +1,157 @@
+import json
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, NonCallableMock, patch
+
+import pandas as pd
+
+import corona.history as history
+from corona.landkreise import DEUTSCHLAND, Landkreise
+from corona.rki_connector import CasesResult, Connector
+from corona.store import DEUTSCHLAND_ID, Store
+from corona.today import get_all_cases
+
+from .testing_utils import get_testdata_binary, get_testdata_file, get_testdata_text
+
+
+def create_cases(day: date, landkreise, offset: float = 0) -> list[CasesResult]:
+    updated = day.strftime("%d.%m.%Y, 00:00 Uhr")
+    return [CasesResult(lk.name, lk.lk_name, lk.id + offset, updated, lk.id) for lk in landkreise]
+
+
+class TestStore(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = Store(Path(self.temp_dir.name) / "store" / "inzidenz.sqlite3")
+        self.cases = Connector.parse_answer_all(json.loads(get_testdata_text("all.json")))
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_empty(self):
+        self.assertIsNone(self.store.latest_date())
+        self.assertEqual(self.store.get_snapshots([80], date(2022, 4, 1), date(2022, 4, 30)), {})
+        self.assertFalse(self.store.path.exists())
+        self.assertEqual(self.store.add_snapshot([]), 0)
+        self.assertFalse(self.store.path.exists())
+
+    def test_add_snapshot(self):
+        self.assertEqual(self.store.add_snapshot(self.cases, 702.1), len(self.cases) + 1)
+        self.assertEqual(self.store.add_snapshot(self.cases, 702.1), 0, "known last_update should be ignored")
+        self.assertEqual(self.store.latest_date(), date(2022, 4, 27))
+
+        result = self.store.get_snapshots([80, DEUTSCHLAND_ID, -1], date(2022, 4, 27), date(2022, 4, 27))
+        self.assertEqual(
+            result, {80: {date(2022, 4, 27): 553.485101033874}, DEUTSCHLAND_ID: {date(2022, 4, 27): 702.1}}
+        )
+        self.assertEqual(self.store.get_snapshots([80], date(2022, 4, 1), date(2022, 4, 26)), {})
+
+    def test_newest_of_day(self):
+        day = date(2022, 4, 27)
+        self.store.add_snapshot([CasesResult("Köln", "SK Köln", 1.0, "27.04.2022, 00:00 Uhr", 80)])
+        self.store.add_snapshot([CasesResult("Köln", "SK Köln", 2.0, "27.04.2022, 12:00 Uhr", 80)])
+        self.assertEqual(self.store.get_snapshots([80], day, day), {80: {day: 2.0}})
+
+    def test_read_store(self):
+        landkreise = (Landkreise.KOELN, Landkreise.AURICH)
+        latest = date.today()
+        for days_before in range(10):
+            self.store.add_snapshot(create_cases(latest - timedelta(days=days_before), landkreise, days_before), 1.0)
+
+        result = history.read_store(self.store, landkreise, 8)
+        self.assertEqual(list(result.index), [Landkreise.AURICH, Landkreise.KOELN, DEUTSCHLAND])
+        self.assertEqual(list(result.columns.date), [latest - timedelta(days=i) for i in range(7, -1, -1)])
+        self.assertEqual(result.loc[Landkreise.KOELN].tolist(), [80.0 + i for i in range(7, -1, -1)])
+        self.assertEqual(result.loc[DEUTSCHLAND].tolist(), [1.0] * 8)
+
+        self.assertIsNone(history.read_store(self.store, landkreise, 11), "days before the first recording")
+        self.assertIsNone(history.read_store(self.store, (Landkreise.HAMBURG,), 8), "Landkreis not recorded")
+        self.assertIsNone(history.read_store(self.store, landkreise, 0))
+        self.assertIsNone(history.read_store(self.store, landkreise, 8, max_age=-1), "outdated")
+
+    async def test_get_history(self):
+        landkreise = (Landkreise.KOELN, Landkreise.AURICH)
+        for days_before in range(8):
+            self.store.add_snapshot(create_cases(date.today() - timedelta(days=days_before), landkreise), 1.0)
+        with patch("corona.history.get_input") as get_input, patch(
+            "corona.history.prepare_and_show_graph"
+        ) as show, self.assertLogs("corona.history", "WARNING"):
+            await history.get_history([80, 51], fix=True, store=self.store)
+        get_input.assert_not_called()  # only the recordings exist, they are used without hospitalisierung
+        pd.testing.assert_frame_equal(show.call_args.args[0], history.read_store(self.store, landkreise, 8))
+        self.assertIsNone(show.call_args.args[1])
+
+        days = [date.today() - timedelta(days=days_before) for days_before in range(8)]
+        regions = ("Niedersachsen", "Nordrhein-Westfalen", "Gesamt")
+        self.store.add_series(
+            "hosp", "1", [("hospitalisierung", region, day, 2.0) for region in regions for day in days]
+        )
+        with patch("corona.history.get_input") as get_input, patch("corona.history.prepare_and_show_graph") as show:
+            await history.get_history([80, 51], fix=True, store=self.store)
+        get_input.assert_not_called()
+        df_inzidenz, df_hosp = show.call_args.args[:2]
+        pd.testing.assert_frame_equal(df_inzidenz, history.read_store(self.store, landkreise, 8))
+        self.assertEqual(list(df_hosp.index), ["Niedersachsen", "Nordrhein-Westfalen", DEUTSCHLAND])
+        self.assertEqual(df_hosp.to_numpy().tolist(), [[2.0] * 8] * 3)
+
+    async def test_import_excels(self):
+        archive = get_testdata_file("Fallzahlen_Kum_Tab_Archiv.xlsx")
+        current = get_testdata_file("Fallzahlen_Kum_Tab_aktuell.xlsx")
+        added = await history.import_excels(self.store, archive, current, use_cache=False)
+        sources = self.store.sources()
+        self.assertEqual([source.name for source in sources], [archive.name, current.name])
+        self.assertEqual(sum(source.values for source in sources), added)
+        self.assertEqual((sources[1].first_date, sources[1].last_date), ("2021-09-11", "2022-02-14"))
+        self.assertEqual(await history.import_excels(self.store, archive, current, use_cache=False), 0)
+        self.assertEqual(history.import_excel(self.store, current.read_bytes(), "renamed.xlsx"), 0)
+        self.assertEqual(len(self.store.sources()), 2)
+
+        landkreise = history.LANDKREISE
+        for days in (8, 0):
+            with self.subTest(days=days):
+                expected, expected_hosp = history.read_excel(current.read_bytes(), landkreise, True, days)
+                if days == 0:
+                    expected_archive, _ = history.read_excel(archive.read_bytes(), landkreise, True, days, True)
+                    expected = expected_archive.join(expected)
+                    expected_hosp = expected_hosp.reindex(columns=expected.columns)
+                result, result_hosp = history.read_series(self.store, landkreise, days)
+                pd.testing.assert_frame_equal(result, expected, check_freq=False)
+                pd.testing.assert_frame_equal(result_hosp, expected_hosp, check_freq=False)
+
+    async def test_get_history_series(self):
+        current = get_testdata_binary("Fallzahlen_Kum_Tab_aktuell.xlsx")
+        self.assertIsNone(history.read_series(self.store, history.LANDKREISE))
+        history.import_excel(self.store, current, history.FIXED_EXCEL_NAME)
+        with patch("corona.history.get_input", AsyncMock(return_value=[current])) as get_input, patch(
+            "corona.history.prepare_and_show_graph"
+        ) as show, patch("corona.history.read_sheets", wraps=history.read_sheets) as read_sheets:
+            await history.get_history([80, 51], fix=True, method=0, store=self.store)
+        get_input.assert_awaited_once_with(True, 1, None, True, None)
+        read_sheets.assert_not_called()  # this version was imported already
+        expected = history.read_excel(current, (Landkreise.KOELN, Landkreise.AURICH), True, 0)
+        pd.testing.assert_frame_equal(show.call_args.args[0], expected[0], check_freq=False)
+
+        # without the imported values of these days the excel loaded for the import is read instead
+        with patch("corona.history.get_input", AsyncMock(return_value=[current])) as get_input, patch(
+            "corona.history.prepare_and_show_graph"
+        ) as show, patch("corona.history.read_series", return_value=None):
+            await history.get_history([80, 51], fix=True, store=self.store)
+        get_input.assert_awaited_once_with(True, 8, None, True, None)
+        expected = history.read_excel(current, (Landkreise.KOELN, Landkreise.AURICH), True, 8)
+        pd.testing.assert_frame_equal(show.call_args.args[0], expected[0], check_freq=False)
+
+    async def test_get_all_cases(self):
+        con = NonCallableMock()
+        con.get_all_cases = AsyncMock(return_value=self.cases)
+        con.get_germany = AsyncMock(return_value=702.1)
+        self.assertEqual(await get_all_cases(con, self.store), self.cases)
+        self.assertEqual(self.store.latest_date(), date(2022, 4, 27))
+        day = date(2022, 4, 27)
+        self.assertEqual(self.store.get_snapshots([DEUTSCHLAND_ID], day, day), {DEUTSCHLAND_ID: {day: 702.1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
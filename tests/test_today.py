@@ -1,14 +1,18 @@
+import csv
 import json
+import os
 import sys
+import tempfile
 import unittest
 from functools import lru_cache
 from io import StringIO
 from typing import Optional
-from unittest.mock import AsyncMock, MagicMock, NonCallableMock
+from unittest.mock import AsyncMock, MagicMock, NonCallableMock, patch
+from urllib.parse import parse_qs, urlsplit
 
 from corona.landkreise import Landkreise
-from corona.rki_connector import CasesResult, Connector
-from corona.today import today
+from corona.rki_connector import CasesResult, Connector, ConnectorConfig
+from corona.today import name_width, print_result_async, today, watch
 
 from .testing_utils import get_testdata_text
 
@@ -22,6 +26,7 @@ def create_answer(value: Optional[str] = None, json_object=None):
     if value is None:
         value = json.dumps(json_object)
     result.text = AsyncMock(return_value=value)
+    result.read = AsyncMock(return_value=value.encode("utf-8"))
     if json_object is not None:
         result.json = AsyncMock(return_value=json_object)
     return result
@@ -31,15 +36,34 @@ def create_answer(value: Optional[str] = None, json_object=None):
 def get_city(url: str, *args, **kwargs):
     prefix = (
         "https://services7.arcgis.com/mOBPykOjAyBO2ZKk/arcgis/rest/services/RKI_Landkreisdaten/FeatureServer/0/"
-        "query?where=OBJECTID="
+        "query?where=OBJECTID"
     )
     suffix = "&outFields=OBJECTID,GEN,county,cases7_per_100k,last_update&returnGeometry=false&outSR=&f=json"
     url = url.removeprefix(prefix)
-    city_id = url.removesuffix(suffix)
+    url = url.removesuffix(suffix)
+    if url.startswith(" IN ("):  # bulk request, combine the answers of all ids
+        city_ids = url.removeprefix(" IN (").removesuffix(")").split(",")
+        result = json.loads(get_testdata_text(f"{city_ids[0]}.json"))
+        for city_id in city_ids[1:]:
+            result["features"].extend(json.loads(get_testdata_text(f"{city_id}.json"))["features"])
+        return create_answer(json_object=result)
+    city_id = url.removeprefix("=")
     result = get_testdata_text(f"{city_id}.json")
     return create_answer(json_object=json.loads(result))
 
 
+def get_all_page(url: str, *args, max_record_count: int = 150, **kwargs):
+    """Answers the count and page requests of get_all_cases from all.json, cutting pages at max_record_count"""
+    query = {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+    features = json.loads(get_testdata_text("all.json"))["features"]
+    if query.get("returnCountOnly") == "true":
+        return create_answer(json_object={"count": len(features)})
+    offset = int(query["resultOffset"])
+    count = min(int(query["resultRecordCount"]), max_record_count)
+    exceeded = offset + count < len(features)
+    return create_answer(json_object={"features": features[offset : offset + count], "exceededTransferLimit": exceeded})
+
+
 class TestCorona(unittest.IsolatedAsyncioTestCase):
     @classmethod
     def setUpClass(cls):
@@ -106,6 +130,53 @@ Ostholstein           1891.44
         generator = self.con.get_cases(self.landkreise, True)
         result = [x async for x in generator]
         self.assertEqual(result, expected_result)
+        self.assertEqual(self.con._session.get.call_count, len(self.landkreise))
+
+        self.con._session.get.reset_mock()
+        generator = self.con.get_cases(self.landkreise, True, bulk=True)
+        result = [x async for x in generator]
+        self.assertEqual(result, expected_result)
+        self.con._session.get.assert_called_once()
+
+    async def test_get_cases_bulk_chunks(self):
+        self.con._session.get = MagicMock(side_effect=get_city)
+        with patch("corona.rki_connector.MAX_IDS_PER_REQUEST", 3):
+            result = [x.region_id async for x in self.con.get_cases(self.landkreise, True, bulk=True)]
+        self.assertEqual(result, list(self.landkreise_ids))
+        self.assertEqual(self.con._session.get.call_count, 4)
+
+    async def test_get_cases_bulk_missing(self):
+        answer = json.loads(get_testdata_text("80.json"))
+        self.con._session.get = MagicMock(return_value=create_answer(json_object=answer))
+        with self.assertRaises(RuntimeError):
+            await self.con.get_cases_chunk([Landkreise.KOELN, Landkreise.BERLIN_MITTE])
+
+    async def test_get_all_cases(self):
+        expected = Connector.parse_answer_all(json.loads(get_testdata_text("all.json")))
+        self.con._session.get = MagicMock(side_effect=get_all_page)
+        self.assertEqual(await self.con.get_all_cases(), expected)
+        # count, pages at 0 cut at 150 and 300 and the rest of the first page at 150
+        self.assertEqual(self.con._session.get.call_count, 4)
+
+        self.con._session.get.reset_mock()
+        result = [case.region_id async for case in self.con.iter_all_cases(page_size=100)]
+        self.assertEqual(sorted(result), [case.region_id for case in expected])
+        self.assertEqual(self.con._session.get.call_count, 6)
+
+    async def test_shared_session(self):
+        session = NonCallableMock()
+        session.__aexit__ = AsyncMock()
+        con = Connector(session=session)
+        async with con:
+            self.assertIs(con._session, session)
+        self.assertIsNone(con._session)
+        session.__aexit__.assert_not_called()
+
+    async def test_create_session(self):
+        async with Connector.create_session(ConnectorConfig(limit=20, limit_per_host=5)) as session:
+            self.assertEqual(session.connector.limit, 20)
+            self.assertEqual(session.connector.limit_per_host, 5)
+            self.assertEqual(session.headers["Accept-Encoding"], "gzip, deflate")
 
     async def test_today_ordered(self):
         self.con._session.get = MagicMock(side_effect=get_city)
@@ -137,6 +208,99 @@ Ostholstein           1891.44
         # the rest should match unordered
         self.assertEqual(set(result_list), set(expected_list))
 
+    async def test_print_result_async_streams(self):
+        captured_output = StringIO()
+        cities = [
+            CasesResult("Altenkirchen (Westerwald)", "LK Altenkirchen", 1.0, "27.04.2022, 00:00 Uhr", 145),
+            CasesResult("Köln", "SK Köln", 553.485101033874, "27.04.2022, 00:00 Uhr", 80),
+        ]
+
+        async def results():
+            yield cities[0]
+            # the first row is printed before the next result arrives
+            self.assertIn("Altenkirchen (Westerwald)     1.00\n", captured_output.getvalue())
+            yield cities[1]
+
+        width = name_width((Landkreise.ALTENKIRCHEN_WESTERWALD, Landkreise.KOELN))
+        self.assertEqual(width, len("Altenkirchen"))
+        with patch("sys.stdout", captured_output):
+            await print_result_async(results(), width)
+        self.assertEqual(
+            captured_output.getvalue().splitlines(),
+            [
+                "Datum: 27.04.2022",
+                "Landkreis    Inzidenz",
+                "Altenkirchen (Westerwald)     1.00",
+                "Köln           553.49",
+            ],
+        )
+
+    async def test_print_result_async_errors(self):
+        async def results(*cities):
+            for city in cities:
+                yield city
+
+        captured_output = StringIO()
+        with patch("sys.stdout", captured_output):
+            await print_result_async(results())
+        self.assertEqual(captured_output.getvalue(), "Keine Daten verfügbar\n")
+        cities = (
+            CasesResult("Köln", "SK Köln", 1.0, "27.04.2022, 00:00 Uhr", 80),
+            CasesResult("Aurich", "LK Aurich", 1.0, "28.04.2022, 00:00 Uhr", 51),
+        )
+        with patch("sys.stdout", StringIO()), self.assertRaises(RuntimeError):
+            await print_result_async(results(*cities))
+
+    async def test_today_output_format(self):
+        self.con._session.get = MagicMock(side_effect=get_city)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "today.jsonl")
+            await today(
+                self.landkreise_ids, keep_order=True, con=self.con, output_format="jsonl", output_file=output_file
+            )
+            with open(output_file, encoding="utf-8") as file:
+                rows = [json.loads(line) for line in file]
+            self.assertEqual([row["region_id"] for row in rows], list(self.landkreise_ids))
+            self.assertEqual(
+                rows[8], CasesResult("Köln", "SK Köln", 553.485101033874, "27.04.2022, 00:00 Uhr", 80)._asdict()
+            )
+
+            output_file = os.path.join(temp_dir, "today.csv")
+            await today(self.landkreise_ids, con=self.con, output_format="csv", output_file=output_file)
+            with open(output_file, encoding="utf-8", newline="") as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual({int(row["region_id"]) for row in rows}, set(self.landkreise_ids))
+
+    async def test_get_updates(self):
+        answer = {"features": [{"attributes": {"last_update": "27.04.2022, 00:00 Uhr"}}]}
+        self.con._session.get = MagicMock(return_value=create_answer(json_object=answer))
+        self.assertEqual(await self.con.get_updates(), {"27.04.2022, 00:00 Uhr"})
+        self.assertIn("returnDistinctValues=true", self.con._session.get.call_args.args[0])
+
+    async def test_watch(self):
+        hamburg = CasesResult("Hamburg", "SK Hamburg", 909.43, "27.04.2022, 00:00 Uhr", 2000)
+        koeln = CasesResult("Köln", "SK Köln", 553.49, "27.04.2022, 00:00 Uhr", 80)
+        koeln_updated = koeln._replace(cases7_per_100k=601.2, updated="28.04.2022, 00:00 Uhr")
+        cases = [[koeln, hamburg], [koeln_updated, hamburg]]
+
+        async def get_cases(*args):
+            for city in cases.pop(0):
+                yield city
+
+        self.con.get_updates = AsyncMock(
+            side_effect=[{koeln.updated}, {koeln.updated}, RuntimeError("no connection"), {koeln_updated.updated}]
+        )
+        self.con.get_cases = MagicMock(side_effect=get_cases)
+        regions = (Landkreise.KOELN, Landkreise.HAMBURG)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "watch.jsonl")
+            with self.assertLogs("corona.today", "ERROR"):
+                await watch(self.con, 0, regions, output_format="jsonl", output_file=output_file, polls=4)
+            with open(output_file, encoding="utf-8") as file:
+                rows = [CasesResult(**json.loads(line)) for line in file]
+        self.assertEqual(rows, [hamburg, koeln, koeln_updated])
+        self.assertEqual(self.con.get_cases.call_count, 2, "cases are only loaded if the last updates changed")
+
 
 if __name__ == "__main__":
     unittest.main()